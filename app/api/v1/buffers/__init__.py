@@ -0,0 +1,10 @@
+"""Contains domain write buffer classes.
+
+Buffer rules:
+
+- Accumulate frequent writes to one entity in process memory of the worker.
+- Recommended name format: {Entity}{Field}Buffer.
+- Are not aware of HTTP requests.
+- Buffered writes are flushed by interval, so they are eventually consistent.
+
+"""
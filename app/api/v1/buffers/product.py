@@ -0,0 +1,219 @@
+"""Module that contains product buffer classes."""
+
+import asyncio
+import logging
+from typing import ClassVar
+
+from bson import ObjectId
+from fastapi import Depends
+from injector import inject
+from pydantic import BaseModel
+from pymongo.errors import BulkWriteError, PyMongoError
+from redis.exceptions import RedisError
+
+from app.api.v1.caches.product import ProductsLeaderboardCache
+from app.api.v1.repositories.product import ProductRepository
+from app.services.redis.constants import RedisNamesEnum
+from app.services.redis.service import RedisService
+from app.settings import SETTINGS
+
+
+class ProductViewsStatistics(BaseModel):
+    """Statistics of the product views buffer."""
+
+    pending_products: int
+    pending_views: int
+    flushed_views: int
+    failed_flushes: int
+
+
+@inject
+class ProductViewsBuffer:
+    """Buffer of product views.
+
+    Views are counted in process memory and written to the database by interval
+    as one unordered bulk of increments, so hot products don't serialize writes
+    on their documents. Product which reaches the pending views cap triggers an
+    early flush, which bounds the lag of its counter.
+
+    Views, which are failed to be written, including single failed increments of
+    a bulk, are moved into Redis hash and flushed by any worker later, so they
+    survive worker restart. Written views update ranks of products in the
+    leaderboards.
+
+    """
+
+    _views: ClassVar[dict[ObjectId, int]] = {}
+
+    _flushed_views: ClassVar[int] = 0
+    _failed_flushes: ClassVar[int] = 0
+
+    # Keeps references to flushes triggered by the pending views cap
+    _flush_tasks: ClassVar[set[asyncio.Task[None]]] = set()
+
+    def __init__(
+        self,
+        repository: ProductRepository = Depends(),
+        redis_service: RedisService = Depends(),
+        leaderboard_cache: ProductsLeaderboardCache = Depends(),
+    ) -> None:
+        """Initializes product views buffer.
+
+        Args:
+            repository (ProductRepository): An instance of the Product repository.
+            redis_service (RedisService): Redis service.
+            leaderboard_cache (ProductsLeaderboardCache): Products leaderboard cache.
+
+        """
+
+        self.repository = repository
+        self.redis_service = redis_service
+        self.leaderboard_cache = leaderboard_cache
+
+    def add(self, id_: ObjectId) -> None:
+        """Counts a product view.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the product.
+
+        """
+
+        views = self._views.get(id_, 0) + 1
+
+        self._views[id_] = views
+
+        if views >= SETTINGS.PRODUCT_VIEWS_MAX_PENDING and not self._flush_tasks:
+            task = asyncio.create_task(self.flush())
+
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> None:
+        """Writes pending views of the worker and Redis fallback to the database."""
+
+        views = dict(self._views)
+        self._views.clear()
+
+        try:
+            fallback_views = await self.redis_service.hpopall(
+                name=RedisNamesEnum.PRODUCT_VIEWS
+            )
+
+        except RedisError as e:
+            logging.error(f"Product views fallback can't be read: {e}")
+
+            fallback_views = {}
+
+        for id_, count in fallback_views.items():
+            views[ObjectId(id_)] = views.get(ObjectId(id_), 0) + int(count)
+
+        if not views:
+            return
+
+        failed_views: dict[ObjectId, int] = {}
+
+        try:
+            await self.repository.increment_views(views=views)
+
+        except BulkWriteError as e:
+            logging.error(f"Product views are partially flushed: {e.details}")
+
+            ProductViewsBuffer._failed_flushes += 1
+
+            # Error indexes refer to increments, which follow order of the views
+            ids = list(views)
+
+            for error in e.details.get("writeErrors", []):
+                product_id = ids[error["index"]]
+
+                failed_views[product_id] = views[product_id]
+
+            await self._save_fallback(views=failed_views)
+
+        except PyMongoError as e:
+            logging.error(f"Product views can't be flushed: {e}")
+
+            ProductViewsBuffer._failed_flushes += 1
+
+            await self._save_fallback(views=views)
+
+            return
+
+        flushed_views = {
+            id_: count for id_, count in views.items() if id_ not in failed_views
+        }
+
+        ProductViewsBuffer._flushed_views += sum(flushed_views.values())
+
+        await self._update_leaderboards(ids=list(flushed_views))
+
+    async def _update_leaderboards(self, ids: list[ObjectId]) -> None:
+        """Updates ranks of products in the leaderboards by their current views.
+
+        Args:
+            ids (list[ObjectId]): The unique identifiers of viewed products.
+
+        """
+
+        try:
+            products = await self.repository.get_views(ids=ids)
+
+            await self.leaderboard_cache.update(products=products)
+
+        except (PyMongoError, RedisError) as e:
+            # Leaderboards are rebuilt from the database once they expire
+            logging.error(f"Products leaderboards can't be updated: {e}")
+
+    async def _save_fallback(self, views: dict[ObjectId, int]) -> None:
+        """Saves views into Redis hash or returns them to the buffer.
+
+        Args:
+            views (dict[ObjectId, int]): Count of views by unique identifiers
+            of products.
+
+        """
+
+        try:
+            await self.redis_service.hincrby_many(
+                name=RedisNamesEnum.PRODUCT_VIEWS,
+                mapping={str(id_): count for id_, count in views.items()},
+            )
+
+        except RedisError as e:
+            logging.error(f"Product views fallback can't be saved: {e}")
+
+            for id_, count in views.items():
+                self._views[id_] = self._views.get(id_, 0) + count
+
+    async def run(self) -> None:
+        """Flushes pending views by interval, runs till cancelled."""
+
+        while True:
+            await asyncio.sleep(SETTINGS.PRODUCT_VIEWS_FLUSH_INTERVAL)
+
+            # Unexpected error must not stop flushes of the worker
+            try:
+                await self.flush()
+
+            except Exception as e:
+                logging.error(f"Product views flush is failed: {e}")
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drops pending views of the worker."""
+        cls._views.clear()
+
+    @classmethod
+    def get_statistics(cls) -> ProductViewsStatistics:
+        """Returns statistics of the buffer.
+
+        Returns:
+            ProductViewsStatistics: Count of pending and flushed views.
+
+        """
+        return ProductViewsStatistics(
+            pending_products=len(cls._views),
+            pending_views=sum(cls._views.values()),
+            flushed_views=cls._flushed_views,
+            failed_flushes=cls._failed_flushes,
+        )
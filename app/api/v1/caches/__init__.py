@@ -0,0 +1,10 @@
+"""Contains domain cache classes.
+
+Cache rules:
+
+- Keeps read models of one entity in process memory and/or Redis.
+- Recommended name format: {Entity}Cache or {Qualifier}{Entity}Cache.
+- Are not aware of HTTP requests.
+- Cached data is invalidated explicitly after writes are committed.
+
+"""
@@ -0,0 +1,351 @@
+"""Module that contains category cache classes."""
+
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, ClassVar
+
+from bson import ObjectId
+from fastapi import Depends
+from injector import inject
+
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum, RedisNamesTTLEnum
+from app.services.redis.service import RedisService
+
+
+class CategoryTree:
+    """Index of the category tree.
+
+    Relations of categories are resolved once the index is built, so leaf checks,
+    subtrees, breadcrumbs and children are looked up in memory.
+
+    """
+
+    def __init__(self, categories: list[Mapping[str, Any]]) -> None:
+        """Builds category tree index.
+
+        Args:
+            categories (list[Mapping[str, Any]]): Categories sorted by identifiers.
+
+        """
+
+        self._categories: dict[ObjectId, Mapping[str, Any]] = {
+            category["_id"]: category for category in categories
+        }
+
+        self._children: dict[ObjectId, list[ObjectId]] = {
+            id_: [] for id_ in self._categories
+        }
+
+        for category in categories:
+            # Category which refers to itself is not a child of its own
+            if (
+                category["parent_id"] in self._children
+                and category["parent_id"] != category["_id"]
+            ):
+                self._children[category["parent_id"]].append(category["_id"])
+
+        self._ancestors: dict[ObjectId, list[ObjectId]] = {
+            id_: self._get_ancestor_ids(id_=id_) for id_ in self._categories
+        }
+
+        subtrees: dict[ObjectId, set[ObjectId]] = {
+            id_: set() for id_ in self._categories
+        }
+
+        for id_, ancestor_ids in self._ancestors.items():
+            for ancestor_id in (*ancestor_ids, id_):
+                subtrees[ancestor_id].add(id_)
+
+        self._subtrees: dict[ObjectId, frozenset[ObjectId]] = {
+            id_: frozenset(subtree) for id_, subtree in subtrees.items()
+        }
+
+        self.leaf_ids: frozenset[ObjectId] = frozenset(
+            id_ for id_, children in self._children.items() if not children
+        )
+
+        # Categories by beginnings of paths, they are expanded on demand
+        self._ids_by_path: dict[str, frozenset[ObjectId]] = {}
+
+    def _get_ancestor_ids(self, id_: ObjectId) -> list[ObjectId]:
+        """Returns identifiers of ancestors of the category from the root.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the category.
+
+        Returns:
+            list[ObjectId]: Identifiers of ancestors.
+
+        """
+
+        ancestor_ids: list[ObjectId] = []
+
+        parent_id = self._categories[id_]["parent_id"]
+
+        # Broken references can't loop the walk forever
+        while (
+            parent_id in self._categories
+            and parent_id != id_
+            and parent_id not in ancestor_ids
+        ):
+            ancestor_ids.append(parent_id)
+
+            parent_id = self._categories[parent_id]["parent_id"]
+
+        return ancestor_ids[::-1]
+
+    def __contains__(self, id_: object) -> bool:
+        """Checks if the category is in the tree.
+
+        Args:
+            id_ (object): The unique identifier of the category.
+
+        Returns:
+            bool: True if category is in the tree else False.
+
+        """
+        return id_ in self._categories
+
+    def is_leaf(self, id_: ObjectId) -> bool:
+        """Checks if the category doesn't have children.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the category.
+
+        Returns:
+            bool: True if category is a leaf else False, categories which are not
+            in the tree are not leafs.
+
+        """
+        return id_ in self.leaf_ids
+
+    def get_children(self, id_: ObjectId) -> list[Mapping[str, Any]]:
+        """Returns children of the category.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the category.
+
+        Returns:
+            list[Mapping[str, Any]]: Children sorted by identifiers.
+
+        """
+        return [self._categories[child_id] for child_id in self._children.get(id_, [])]
+
+    def get_subtree_ids(self, id_: ObjectId) -> frozenset[ObjectId]:
+        """Returns identifiers of the category and all its descendants.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the category.
+
+        Returns:
+            frozenset[ObjectId]: Identifiers of categories of the subtree.
+
+        """
+        return self._subtrees.get(id_, frozenset())
+
+    def get_breadcrumbs(self, id_: ObjectId) -> list[Mapping[str, Any]]:
+        """Returns the category and its ancestors starting from the root.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the category.
+
+        Returns:
+            list[Mapping[str, Any]]: Categories from the root to the category.
+
+        """
+
+        if id_ not in self._categories:
+            return []
+
+        return [
+            self._categories[category_id]
+            for category_id in (*self._ancestors[id_], id_)
+        ]
+
+    def get_ids_by_path(self, path: str) -> frozenset[ObjectId]:
+        """Returns identifiers of categories which paths start with the path.
+
+        Args:
+            path (str): Beginning of the materialized path.
+
+        Returns:
+            frozenset[ObjectId]: Identifiers of categories.
+
+        """
+
+        ids = self._ids_by_path.get(path)
+
+        if ids is None:
+            ids = frozenset(
+                id_
+                for id_, category in self._categories.items()
+                if category["path"].startswith(path)
+            )
+
+            self._ids_by_path[path] = ids
+
+        return ids
+
+
+@inject
+class CategoryTreeCache:
+    """Cache of the category tree index.
+
+    Categories are kept in the two-tier cache, so they are loaded once and
+    invalidated in all workers at once. The index is built once per loaded list
+    and is shared by requests of the worker till the list is reloaded.
+
+    """
+
+    # Cached categories and the index built from them
+    _tree: ClassVar[tuple[list[Mapping[str, Any]], CategoryTree] | None] = None
+
+    def __init__(self, cache: TwoTierCache = Depends()) -> None:
+        """Initializes category tree cache.
+
+        Args:
+            cache (TwoTierCache): Two-tier cache.
+
+        """
+
+        self.cache = cache
+
+    async def get_or_load(
+        self,
+        loader: Callable[[], Awaitable[list[Mapping[str, Any]]]],
+        category_id: ObjectId | None = None,
+    ) -> CategoryTree:
+        """Returns category tree index, categories are loaded on cache miss.
+
+        Args:
+            loader (Callable[[], Awaitable[list[Mapping[str, Any]]]]): Loads all
+            categories sorted by identifiers.
+            category_id (ObjectId | None): The unique identifier of the existing
+            category which must be in the tree. Cached categories are reloaded if
+            it is missing there. Defaults to None.
+
+        Returns:
+            CategoryTree: Category tree index.
+
+        """
+
+        tree = await self._get_or_load(loader=loader)
+
+        # Category is created after categories were cached
+        if category_id is not None and category_id not in tree:
+            await self.invalidate()
+
+            tree = await self._get_or_load(loader=loader)
+
+        return tree
+
+    async def _get_or_load(
+        self, loader: Callable[[], Awaitable[list[Mapping[str, Any]]]]
+    ) -> CategoryTree:
+        """Returns category tree index built from cached or loaded categories.
+
+        Args:
+            loader (Callable[[], Awaitable[list[Mapping[str, Any]]]]): Loads all
+            categories sorted by identifiers.
+
+        Returns:
+            CategoryTree: Category tree index.
+
+        """
+
+        categories = await self.cache.get_or_load(
+            name=RedisNamesEnum.CATEGORY_TREE,
+            loader=loader,
+            ttl=RedisNamesTTLEnum.CATEGORY_TREE.value,
+        )
+
+        tree = CategoryTreeCache._tree
+
+        if tree is None or tree[0] is not categories:
+            tree = (categories, CategoryTree(categories=categories))
+
+            CategoryTreeCache._tree = tree
+
+        return tree[1]
+
+    async def invalidate(self) -> None:
+        """Removes cached categories, so the index is rebuilt by all workers."""
+        await self.cache.delete(name=RedisNamesEnum.CATEGORY_TREE)
+
+
+@inject
+class CategoryCache:
+    """Cache of categories with their parameters.
+
+    Each category is kept in the two-tier cache under own name. Identifiers of
+    cached categories are tracked in a set, so writes of categories or parameters
+    drop all of them without scanning the keyspace.
+
+    """
+
+    def __init__(
+        self, redis_service: RedisService = Depends(), cache: TwoTierCache = Depends()
+    ) -> None:
+        """Initializes category cache.
+
+        Args:
+            redis_service (RedisService): Redis service.
+            cache (TwoTierCache): Two-tier cache.
+
+        """
+
+        self.redis_service = redis_service
+
+        self.cache = cache
+
+    @staticmethod
+    def _get_name(id_: ObjectId | str) -> str:
+        """Returns cache name of the category.
+
+        Args:
+            id_ (ObjectId | str): The unique identifier of the category.
+
+        Returns:
+            str: Cache name.
+
+        """
+        return RedisNamesEnum.CATEGORY.format(category_id=id_)
+
+    async def get_or_load(
+        self, id_: ObjectId, loader: Callable[[], Awaitable[Mapping[str, Any]]]
+    ) -> Mapping[str, Any]:
+        """Returns a cached category, it is loaded on cache miss.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the category.
+            loader (Callable[[], Awaitable[Mapping[str, Any]]]): Loads the category.
+
+        Returns:
+            Mapping[str, Any]: Category.
+
+        """
+
+        async def load() -> Mapping[str, Any]:
+            category = await loader()
+
+            await self.redis_service.sadd(
+                name=RedisNamesEnum.CATEGORIES, members=[str(id_)]
+            )
+
+            return category
+
+        return await self.cache.get_or_load(  # type: ignore
+            name=self._get_name(id_=id_),
+            loader=load,
+            ttl=RedisNamesTTLEnum.CATEGORY.value,
+        )
+
+    async def invalidate(self) -> None:
+        """Removes all cached categories in all workers."""
+
+        ids = await self.redis_service.smembers(name=RedisNamesEnum.CATEGORIES)
+
+        for id_ in ids:
+            await self.cache.delete(name=self._get_name(id_=id_))
+
+        await self.redis_service.unlink(name=RedisNamesEnum.CATEGORIES)
@@ -0,0 +1,54 @@
+"""Module that contains parameter cache classes."""
+
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from fastapi import Depends
+from injector import inject
+
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum, RedisNamesTTLEnum
+
+
+@inject
+class ParametersCache:
+    """Cache of the product parameters list.
+
+    Parameters are kept in the two-tier cache and refreshed in background before
+    they expire. Writes of parameters drop the list in all workers.
+
+    """
+
+    def __init__(self, cache: TwoTierCache = Depends()) -> None:
+        """Initializes parameters cache.
+
+        Args:
+            cache (TwoTierCache): Two-tier cache.
+
+        """
+
+        self.cache = cache
+
+    async def get_or_load(
+        self, loader: Callable[[], Awaitable[list[Mapping[str, Any]]]]
+    ) -> list[Mapping[str, Any]]:
+        """Returns cached parameters, they are loaded on cache miss.
+
+        Args:
+            loader (Callable[[], Awaitable[list[Mapping[str, Any]]]]): Loads all
+            parameters.
+
+        Returns:
+            list[Mapping[str, Any]]: Parameters.
+
+        """
+        return await self.cache.get_or_load(  # type: ignore
+            name=RedisNamesEnum.PRODUCT_PARAMETERS_LIST,
+            loader=loader,
+            ttl=RedisNamesTTLEnum.PRODUCT_PARAMETERS_LIST.value,
+            early_refresh=True,
+        )
+
+    async def invalidate(self) -> None:
+        """Removes cached parameters in all workers."""
+        await self.cache.delete(name=RedisNamesEnum.PRODUCT_PARAMETERS_LIST)
@@ -0,0 +1,242 @@
+"""Module that contains product cache classes."""
+
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from bson import ObjectId
+from fastapi import Depends
+from injector import inject
+
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum, RedisNamesTTLEnum
+from app.services.redis.service import RedisService
+from app.settings import SETTINGS
+
+
+@inject
+class ProductsLeaderboardCache:
+    """Cache of the most viewed available products.
+
+    Leaderboards are Redis sorted sets of product identifiers scored by views,
+    one for all the products and one per category. A leaderboard is built from
+    the database on the first read, one build at once through the two-tier cache,
+    and then kept up to date by flushed views. Other product writes drop
+    leaderboards of touched categories, so they are rebuilt with new and changed
+    products in place. Names of built leaderboards are tracked in a set, so all
+    of them are dropped without scanning the keyspace.
+
+    """
+
+    def __init__(
+        self, redis_service: RedisService = Depends(), cache: TwoTierCache = Depends()
+    ) -> None:
+        """Initializes products leaderboard cache.
+
+        Args:
+            redis_service (RedisService): Redis service.
+            cache (TwoTierCache): Two-tier cache.
+
+        """
+
+        self.redis_service = redis_service
+
+        self.cache = cache
+
+    @staticmethod
+    def _get_name(category_id: ObjectId | None) -> str:
+        """Returns a leaderboard name.
+
+        Args:
+            category_id (ObjectId | None): The unique identifier of the category
+            or None for the leaderboard of all products.
+
+        Returns:
+            str: Leaderboard name.
+
+        """
+        return (
+            RedisNamesEnum.PRODUCTS_LEADERBOARD
+            if category_id is None
+            else RedisNamesEnum.CATEGORY_PRODUCTS_LEADERBOARD.format(
+                category_id=category_id
+            )
+        )
+
+    @classmethod
+    def _get_snapshot_name(cls, category_id: ObjectId | None) -> str:
+        """Returns a name of the ranking cached on leaderboard build.
+
+        Args:
+            category_id (ObjectId | None): The unique identifier of the category
+            or None for the leaderboard of all products.
+
+        Returns:
+            str: Ranking name.
+
+        """
+        return RedisNamesEnum.PRODUCTS_LEADERBOARD_SNAPSHOT.format(
+            name=cls._get_name(category_id)
+        )
+
+    async def get(
+        self, category_id: ObjectId | None, start: int, end: int
+    ) -> list[ObjectId] | None:
+        """Returns identifiers of products ranked in the range.
+
+        Args:
+            category_id (ObjectId | None): The unique identifier of the category
+            or None for all products.
+            start (int): Rank of the first product, starting from 0.
+            end (int): Rank of the last product, inclusive.
+
+        Returns:
+            list[ObjectId] | None: Identifiers of products or None if leaderboard
+            is not built.
+
+        """
+
+        ids = await self.redis_service.zrevrange(
+            name=self._get_name(category_id), start=start, end=end
+        )
+
+        if ids is None:
+            return None
+
+        return [ObjectId(id_) for id_ in ids]
+
+    async def get_or_build(
+        self,
+        category_id: ObjectId | None,
+        start: int,
+        end: int,
+        loader: Callable[[], Awaitable[list[Mapping[str, Any]]]],
+    ) -> list[ObjectId]:
+        """Returns identifiers of products ranked in the range, builds leaderboard
+        on miss.
+
+        Args:
+            category_id (ObjectId | None): The unique identifier of the category
+            or None for all products.
+            start (int): Rank of the first product, starting from 0.
+            end (int): Rank of the last product, inclusive.
+            loader (Callable[[], Awaitable[list[Mapping[str, Any]]]]): Loads the
+            most viewed products with their views.
+
+        Returns:
+            list[ObjectId]: Identifiers of products.
+
+        """
+
+        ids = await self.get(category_id=category_id, start=start, end=end)
+
+        if ids is not None:
+            return ids
+
+        async def build() -> list[str]:
+            products = await loader()
+
+            await self.set(category_id=category_id, products=products)
+
+            return [str(product["_id"]) for product in products]
+
+        # Concurrent misses wait for a single build, its ranking is served to them
+        ranking = await self.cache.get_or_load(
+            name=self._get_snapshot_name(category_id),
+            loader=build,
+            ttl=RedisNamesTTLEnum.PRODUCTS_LEADERBOARD.value,
+        )
+
+        return [ObjectId(id_) for id_ in ranking[start : end + 1]]
+
+    async def set(
+        self, category_id: ObjectId | None, products: list[Mapping[str, Any]]
+    ) -> None:
+        """Builds a leaderboard.
+
+        Args:
+            category_id (ObjectId | None): The unique identifier of the category
+            or None for all products.
+            products (list[Mapping[str, Any]]): The most viewed products with
+            their views.
+
+        """
+        name = self._get_name(category_id)
+
+        await self.redis_service.sadd(
+            name=RedisNamesEnum.PRODUCTS_LEADERBOARDS, members=[name]
+        )
+
+        await self.redis_service.zreplace(
+            name=name,
+            mapping={str(product["_id"]): product["views"] for product in products},
+            ttl=RedisNamesTTLEnum.PRODUCTS_LEADERBOARD.value,
+        )
+
+    async def update(self, products: list[Mapping[str, Any]]) -> None:
+        """Updates ranks of products in the built leaderboards.
+
+        Args:
+            products (list[Mapping[str, Any]]): Products with their views,
+            category and availability.
+
+        """
+
+        available: defaultdict[ObjectId | None, dict[str, float]] = defaultdict(dict)
+        not_available: defaultdict[ObjectId | None, list[str]] = defaultdict(list)
+
+        for product in products:
+            for category_id in (None, product["category_id"]):
+                if product["available"] is True:
+                    available[category_id][str(product["_id"])] = product["views"]
+                else:
+                    not_available[category_id].append(str(product["_id"]))
+
+        for category_id, mapping in available.items():
+            await self.redis_service.zupdate(
+                name=self._get_name(category_id),
+                mapping=mapping,
+                max_size=SETTINGS.PRODUCTS_LEADERBOARD_SIZE,
+            )
+
+        for category_id, members in not_available.items():
+            await self.redis_service.zrem(
+                name=self._get_name(category_id), members=members
+            )
+
+    async def invalidate(self, category_ids: list[ObjectId]) -> None:
+        """Drops leaderboards which contain products of the categories.
+
+        Args:
+            category_ids (list[ObjectId]): The unique identifiers of the categories.
+
+        """
+
+        for category_id in (None, *category_ids):
+            await self._drop(name=self._get_name(category_id))
+
+    async def clear(self) -> None:
+        """Drops all built leaderboards."""
+
+        names = await self.redis_service.smembers(
+            name=RedisNamesEnum.PRODUCTS_LEADERBOARDS
+        )
+
+        for name in names:
+            await self._drop(name=name)
+
+        await self.redis_service.unlink(name=RedisNamesEnum.PRODUCTS_LEADERBOARDS)
+
+    async def _drop(self, name: str) -> None:
+        """Drops a leaderboard and its ranking cached on build.
+
+        Args:
+            name (str): Leaderboard name.
+
+        """
+
+        await self.redis_service.unlink(name=name)
+
+        await self.cache.delete(
+            name=RedisNamesEnum.PRODUCTS_LEADERBOARD_SNAPSHOT.format(name=name)
+        )
@@ -0,0 +1,63 @@
+"""Module that contains role cache classes."""
+
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from fastapi import Depends
+from injector import inject
+
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum, RedisNamesTTLEnum
+
+
+@inject
+class RolesCache:
+    """Cache of the roles list.
+
+    Roles are kept in the two-tier cache and refreshed in background before
+    they expire. Writes of roles drop the list in all workers.
+
+    """
+
+    def __init__(self, cache: TwoTierCache = Depends()) -> None:
+        """Initializes roles cache.
+
+        Args:
+            cache (TwoTierCache): Two-tier cache.
+
+        """
+
+        self.cache = cache
+
+    async def get(self) -> list[Mapping[str, Any]] | None:
+        """Returns cached roles.
+
+        Returns:
+            list[Mapping[str, Any]] | None: Roles or None if they are not cached.
+
+        """
+        return await self.cache.get(name=RedisNamesEnum.ROLES_LIST)  # type: ignore
+
+    async def get_or_load(
+        self, loader: Callable[[], Awaitable[list[Mapping[str, Any]]]]
+    ) -> list[Mapping[str, Any]]:
+        """Returns cached roles, they are loaded on cache miss.
+
+        Args:
+            loader (Callable[[], Awaitable[list[Mapping[str, Any]]]]): Loads all
+            roles.
+
+        Returns:
+            list[Mapping[str, Any]]: Roles.
+
+        """
+        return await self.cache.get_or_load(  # type: ignore
+            name=RedisNamesEnum.ROLES_LIST,
+            loader=loader,
+            ttl=RedisNamesTTLEnum.ROLES_LIST.value,
+            early_refresh=True,
+        )
+
+    async def invalidate(self) -> None:
+        """Removes cached roles in all workers."""
+        await self.cache.delete(name=RedisNamesEnum.ROLES_LIST)
@@ -0,0 +1,92 @@
+"""Module that contains user cache classes."""
+
+from bson import ObjectId
+from fastapi import Depends
+from injector import inject
+
+from app.api.v1.models.user import AuthorizedUser
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum, RedisNamesTTLEnum
+
+
+@inject
+class AuthorizedUserCache:
+    """Cache of users resolved on requests authorization.
+
+    Only fields which are checked on authorization are cached, each user under
+    own name which expires in Redis. Snapshots are kept in the two-tier cache, so
+    invalidated ones are dropped from process memory of all workers.
+
+    """
+
+    def __init__(self, cache: TwoTierCache = Depends()) -> None:
+        """Initializes authorized user cache.
+
+        Args:
+            cache (TwoTierCache): Two-tier cache.
+
+        """
+
+        self.cache = cache
+
+    @staticmethod
+    def _get_name(id_: ObjectId) -> str:
+        """Returns cache name of the user.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the user.
+
+        Returns:
+            str: Cache name.
+
+        """
+        return RedisNamesEnum.AUTHORIZED_USER.format(user_id=id_)
+
+    async def get(self, id_: ObjectId) -> AuthorizedUser | None:
+        """Returns a cached user by its unique identifier.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the user.
+
+        Returns:
+            AuthorizedUser | None: Cached user or None if it is missing or expired.
+
+        """
+
+        snapshot = await self.cache.get(name=self._get_name(id_=id_))
+
+        if snapshot is None:
+            return None
+
+        return AuthorizedUser.model_validate(snapshot)
+
+    async def set(self, user: AuthorizedUser) -> None:
+        """Caches a user.
+
+        Args:
+            user (AuthorizedUser): User object.
+
+        """
+
+        await self.cache.set(
+            name=self._get_name(id_=user.id),
+            value={
+                "_id": user.id,
+                "email_verified": user.email_verified,
+                "roles": list(user.roles),
+                "deleted": user.deleted,
+            },
+            ttl=RedisNamesTTLEnum.AUTHORIZED_USER.value,
+        )
+
+    async def invalidate(self, id_: ObjectId) -> None:
+        """Removes a cached user in Redis and in memory of all workers.
+
+        Must be called after the user write is committed, otherwise concurrent
+        request could cache the user again before the write is visible.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the user.
+
+        """
+        await self.cache.delete(name=self._get_name(id_=id_))
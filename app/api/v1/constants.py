@@ -20,6 +20,7 @@ class ScopesEnum(Enum):
     # Scope naming: {domain}_{action}_{entity}
 
     HEALTH_GET_HEALTH = "Allows to check application health."
+    HEALTH_GET_METRICS = "Allows to get application metrics."
 
     AUTH_REFRESH_TOKEN = "Allows to refresh Access token using Refresh token."
 
@@ -75,3 +76,11 @@ class PlaceholdersEnum(StrEnum):
     """Placeholders enumerate."""
 
     DELETED_COMMENT = "[Deleted]"
+
+
+class CommentRankingEnum(StrEnum):
+    """Comment ranking enumerate."""
+
+    BEST = auto()
+    HOT = auto()
+    NEW = auto()
@@ -15,6 +15,7 @@ from app.api.v1.validators.product import (
     ProductAccessValidator,
     ProductAvailableFilterValidator,
     ProductByIdValidator,
+    ProductCategorySubtreeFilterValidator,
     ProductParametersFilterValidator,
     ProductParametersValidator,
 )
@@ -73,6 +74,9 @@ class ProductsFilterDependency(metaclass=SingletonMeta):
         self,
         filter_: Annotated[BaseProductFilter, Query()],
         available_filter_validator: ProductAvailableFilterValidator = Depends(),
+        category_subtree_filter_validator: ProductCategorySubtreeFilterValidator = (
+            Depends()
+        ),
         parameters_filter_validator: ProductParametersFilterValidator = Depends(),
     ) -> ProductFilter:
         """Validates filter for product list.
@@ -81,6 +85,8 @@ class ProductsFilterDependency(metaclass=SingletonMeta):
             filter_ (BaseProductFilter): Base product filter.
             available_filter_validator (ProductAvailableFilterValidator): Product
             filter validator.
+            category_subtree_filter_validator (ProductCategorySubtreeFilterValidator):
+            Product category subtree filter validator.
             parameters_filter_validator (ProductParametersFilterValidator): Product
             parameters filter validator.
 
@@ -91,13 +97,19 @@ class ProductsFilterDependency(metaclass=SingletonMeta):
 
         await available_filter_validator.validate(available=filter_.available)
 
+        category_ids = await category_subtree_filter_validator.validate(
+            category_id=filter_.category_subtree
+        )
+
         query_params = await parameters_filter_validator.validate()
 
         return ProductFilter(
             category_id=filter_.category_id,
+            category_subtree=filter_.category_subtree,
             available=filter_.available,
             ids=filter_.ids,
             parameters=query_params,
+            category_ids=category_ids,
         )
 
 
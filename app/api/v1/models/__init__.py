@@ -38,6 +38,7 @@ class Pagination(BaseModel):
 
     page: int
     page_size: int = Field(le=AppConstantsEnum.PAGINATION_MAX_PAGE_SIZE)
+    after: str | None = None  # keyset cursor, page is ignored if it is passed
 
 
 class Sorting(BaseModel):
@@ -52,3 +53,9 @@ class List(BaseModel):
 
     data: list[Any]
     total: int
+
+
+class CursorList(List):
+    """List model with keyset pagination cursor."""
+
+    next_cursor: str | None
@@ -11,28 +11,30 @@ from app.api.v1.models.parameter import Parameter
 from app.utils.pydantic import ObjectIdAnnotation
 
 
-class Category(BSONObjectId):
-    """Category model."""
+class ShortCategory(BSONObjectId):
+    """Short category model."""
 
     name: str
     description: str
     parent_id: Annotated[ObjectId, ObjectIdAnnotation] | None
     path: str  # used as "Materialized Path" pattern
     machine_name: str
-    has_children: bool
-    parameters: list[Parameter]
     created_at: datetime
     updated_at: datetime | None
 
 
-class ShortCategory(BSONObjectId):
-    """Short category model."""
+class Category(BSONObjectId):
+    """Category model."""
 
     name: str
     description: str
     parent_id: Annotated[ObjectId, ObjectIdAnnotation] | None
     path: str  # used as "Materialized Path" pattern
     machine_name: str
+    has_children: bool
+    children: list[ShortCategory]
+    breadcrumbs: list[ShortCategory]  # from the root to the category itself
+    parameters: list[Parameter]
     created_at: datetime
     updated_at: datetime | None
 
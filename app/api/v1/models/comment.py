@@ -4,10 +4,11 @@ from datetime import datetime
 from typing import Annotated
 
 from bson import ObjectId
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 
-from app.api.v1.constants import PlaceholdersEnum
-from app.api.v1.models import BSONObjectId
+from app.api.v1.constants import CommentRankingEnum, PlaceholdersEnum
+from app.api.v1.models import BSONObjectId, CursorList
+from app.constants import AppConstantsEnum
 from app.utils.pydantic import ObjectIdAnnotation
 
 
@@ -33,6 +34,36 @@ class Comment(BSONObjectId):
         return self
 
 
+class CommentTree(Comment):
+    """Comment tree model."""
+
+    replies: list["CommentTree"] = Field(default_factory=list)
+    has_more_replies: bool = False  # replies could be omitted from the page
+
+
+class CommentFilter(BaseModel):
+    """Comment filter model."""
+
+    thread_id: Annotated[ObjectId, ObjectIdAnnotation]
+
+
+class CommentTreeFilter(BaseModel):
+    """Comment tree filter model."""
+
+    depth: int = Field(  # count of reply levels under top-level comments
+        default=AppConstantsEnum.COMMENTS_TREE_DEFAULT_DEPTH,
+        ge=0,
+        le=AppConstantsEnum.COMMENTS_TREE_MAX_DEPTH,
+    )
+    ranking: CommentRankingEnum | None = None  # comments go in order of creation
+
+
+class CommentTreeList(CursorList):
+    """Comment tree list model."""
+
+    data: list[CommentTree]
+
+
 class BaseCommentCreateData(BaseModel):
     """Base comment create data model."""
 
@@ -0,0 +1,19 @@
+"""Module that contains health domain models."""
+
+from pydantic import BaseModel
+
+from app.api.v1.buffers.product import ProductViewsStatistics
+from app.services.mongo.models import CommandStatistics, ConnectionPoolStatistics
+from app.utils.lru import LRUCacheStatistics
+from app.utils.password import PasswordHashingStatistics
+
+
+class Metrics(BaseModel):
+    """Metrics of the application worker model."""
+
+    mongo_connection_pools: list[ConnectionPoolStatistics]
+    mongo_commands: list[CommandStatistics]
+    password_hashing: PasswordHashingStatistics
+    jwt_cache: LRUCacheStatistics
+    local_cache: LRUCacheStatistics
+    product_views: ProductViewsStatistics
@@ -6,7 +6,7 @@ from typing import Annotated, Any
 from bson import ObjectId
 from pydantic import BaseModel, Field
 
-from app.api.v1.models import BSONObjectId, List
+from app.api.v1.models import BSONObjectId, CursorList
 from app.utils.pydantic import ObjectIdAnnotation
 
 
@@ -66,6 +66,7 @@ class BaseProductFilter(BaseModel):
     """Base product filter model."""
 
     category_id: Annotated[ObjectId, ObjectIdAnnotation] | None = None
+    category_subtree: Annotated[ObjectId, ObjectIdAnnotation] | None = None
     available: bool | None = None
     ids: list[Annotated[ObjectId, ObjectIdAnnotation]] | None = Field(
         default_factory=list  # type: ignore[arg-type]
@@ -76,9 +77,11 @@ class ProductFilter(BaseProductFilter):
     """Product filter model."""
 
     parameters: dict[str, list[Any]] | None = None
+    # leaf categories of the requested subtree
+    category_ids: list[Annotated[ObjectId, ObjectIdAnnotation]] | None = None
 
 
-class ProductList(List):
+class ProductList(CursorList):
     """Product list model."""
 
     data: list[ShortProduct]
@@ -5,7 +5,7 @@ from datetime import date, datetime
 from pydantic import BaseModel, EmailStr, Field
 
 from app.api.v1.constants import RolesEnum
-from app.api.v1.models import BSONObjectId, List
+from app.api.v1.models import BSONObjectId, CursorList
 from app.utils.pydantic import (
     PasswordPolicy,
     PhoneNumber,
@@ -13,7 +13,20 @@ from app.utils.pydantic import (
 )
 
 
-class User(BSONObjectId):
+class AuthorizedUser(BSONObjectId):
+    """User model with fields which are required on authorization."""
+
+    email_verified: bool
+    roles: list[RolesEnum]
+    deleted: bool
+
+    @property
+    def is_client(self) -> bool:
+        """Shows is user a client or belongs to shop side."""
+        return self.roles == [RolesEnum.CUSTOMER]
+
+
+class User(AuthorizedUser):
     """User model."""
 
     first_name: str
@@ -21,25 +34,17 @@ class User(BSONObjectId):
     patronymic_name: str | None
     username: str
     email: str
-    email_verified: bool
     hashed_password: str
     phone_number: str
     birthdate: date
-    roles: list[RolesEnum]
-    deleted: bool
     created_at: datetime
     updated_at: datetime | None
 
-    @property
-    def is_client(self) -> bool:
-        """Shows is user a client or belongs to shop side."""
-        return self.roles == [RolesEnum.CUSTOMER]
-
 
 class CurrentUser(BaseModel):
     """User model for authenticate/authorize operations."""
 
-    object: User
+    object: AuthorizedUser
     scopes: list[str]
 
 
@@ -67,7 +72,7 @@ class UserFilter(BaseModel):
     deleted: bool | None = None
 
 
-class UserList(List):
+class UserList(CursorList):
     """User list model."""
 
     data: list[ShortUser]
@@ -10,18 +10,28 @@ Repository rules:
 """
 
 import abc
-from collections.abc import Mapping
+import asyncio
+from collections.abc import AsyncGenerator, Mapping, Sequence
 from typing import Any
 
+import bson
 from bson import ObjectId
 from fastapi import Depends
 from injector import inject
 from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import DeleteOne, InsertOne, UpdateMany, UpdateOne
 
 from app.api.v1.models import Pagination, Search, Sorting
-from app.exceptions import EntityIsNotFoundError
-from app.services.mongo.constants import SortingTypesEnum, SortingValuesEnum
+from app.exceptions import EntityIsNotFoundError, InvalidCursorError
+from app.services.mongo.constants import (
+    ProjectionValuesEnum,
+    SortingTypesEnum,
+    SortingValuesEnum,
+)
+from app.services.mongo.models import BulkWriteResult
+from app.services.mongo.profiler import QueryProfiler
 from app.services.mongo.service import MongoDBService
+from app.utils.cursor import Cursor
 
 
 @inject
@@ -64,17 +74,236 @@ class BaseRepository(abc.ABC):
         Returns:
             list[Mapping[str, Any]]: The retrieved list of documents.
 
+        Raises:
+            InvalidCursorError: In case pagination cursor is invalid.
+
         """
+
+        options = self._get_list_query_options(
+            search=search, sorting=sorting, pagination=pagination
+        )
+
+        keyset_condition = options.pop("keyset_condition")
+
+        if keyset_condition is not None:
+            filter_ = (
+                {"$and": [filter_, keyset_condition]} if filter_ else keyset_condition
+            )
+
         return await self._mongo_service.find(
+            collection=self._collection_name,
+            filter_=filter_,
+            **options,
+            session=session,
+        )
+
+    def _iter_get(
+        self,
+        filter_: Mapping[str, Any] | None = None,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        *,
+        batch_size: int | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        """Iterates over a list of documents based on parameters.
+
+        Documents are fetched from the database in batches, so the whole list is
+        never held in memory at once.
+
+        Args:
+            filter_ (Mapping[str, Any] | None): Parameters for list filtering.
+            Defaults to None.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            batch_size (int | None): The number of documents fetched per round trip.
+            Defaults to None.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            AsyncGenerator[Mapping[str, Any], None]: Documents generator.
+
+        """
+        return self._mongo_service.iter_find(
             collection=self._collection_name,
             filter_=filter_,
             projection=self._get_list_query_projection(),
             sort=self._get_list_sorting(sorting=sorting, search=search),
-            skip=self._calculate_skip(pagination),
-            limit=pagination.page_size if pagination is not None else None,
+            batch_size=batch_size,
             session=session,
         )
 
+    async def _get_and_count(
+        self,
+        filter_: Mapping[str, Any] | None = None,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> Mapping[str, Any]:
+        """Retrieves a list of documents and their total count.
+
+        Page and search queries are answered by a single aggregation, which
+        matches documents once and "$facet"s them into the page and the total.
+        Keyset pages are fetched by "find" with keyset condition in the filter,
+        so the index serves them without reading preceding documents, and the
+        total is counted without keyset condition.
+
+        Args:
+            filter_ (Mapping[str, Any] | None): Parameters for list filtering.
+            Defaults to None.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of documents and their total count.
+
+        Raises:
+            InvalidCursorError: In case pagination cursor is invalid.
+
+        """
+
+        options = self._get_list_query_options(
+            search=search, sorting=sorting, pagination=pagination
+        )
+
+        if options["keyset_condition"] is None:
+            return await self._get_and_count_by_facet(
+                filter_=filter_, options=options, session=session
+            )
+
+        # Operations of one session can't run concurrently
+        if session is not None:
+            documents = await self._get(
+                filter_=filter_,
+                search=search,
+                sorting=sorting,
+                pagination=pagination,
+                session=session,
+            )
+            count = await self._count(filter_=filter_, session=session)
+
+        else:
+            documents, count = await asyncio.gather(
+                self._get(
+                    filter_=filter_,
+                    search=search,
+                    sorting=sorting,
+                    pagination=pagination,
+                ),
+                self._count(filter_=filter_),
+            )
+
+        return {"data": documents, "total": count}
+
+    async def _get_and_count_by_facet(
+        self,
+        filter_: Mapping[str, Any] | None,
+        options: Mapping[str, Any],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> Mapping[str, Any]:
+        """Retrieves a list of documents and their total count by one aggregation.
+
+        Args:
+            filter_ (Mapping[str, Any] | None): Parameters for list filtering.
+            options (Mapping[str, Any]): List query options.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of documents and their total count.
+
+        """
+
+        data_pipeline: list[Mapping[str, Any]] = []
+
+        if options["sort"]:
+            data_pipeline.append({"$sort": dict(options["sort"])})
+
+        if options["skip"]:
+            data_pipeline.append({"$skip": options["skip"]})
+
+        if options["limit"] is not None:
+            data_pipeline.append({"$limit": options["limit"]})
+
+        if options["projection"] is not None:
+            data_pipeline.append({"$project": options["projection"]})
+
+        result = await self._mongo_service.aggregate(
+            collection=self._collection_name,
+            pipeline=[
+                {"$match": filter_ or {}},
+                {
+                    "$facet": {
+                        # Facet sub-pipeline can't be empty
+                        "data": data_pipeline or [{"$match": {}}],
+                        "total": [{"$count": "total"}],
+                    }
+                },
+            ],
+            session=session,
+            cursor_length=1,
+        )
+
+        total = result[0]["total"]
+
+        return {"data": result[0]["data"], "total": total[0]["total"] if total else 0}
+
+    def _get_list_query_options(
+        self,
+        search: Search | None,
+        sorting: Sorting | None,
+        pagination: Pagination | None,
+    ) -> dict[str, Any]:
+        """Returns list query projection, sorting, skip, limit and keyset condition.
+
+        Args:
+            search (Search | None): Parameters for list searching.
+            sorting (Sorting | None): Parameters for sorting.
+            pagination (Pagination | None): Parameters for pagination.
+
+        Returns:
+            dict[str, Any]: List query options.
+
+        Raises:
+            InvalidCursorError: In case pagination cursor is invalid.
+
+        """
+
+        options: dict[str, Any] = {
+            "projection": self._get_list_query_projection(),
+            "sort": self._get_list_sorting(sorting=sorting, search=search),
+            "skip": self._calculate_skip(pagination),
+            "limit": pagination.page_size if pagination is not None else None,
+            "keyset_condition": None,
+        }
+
+        if pagination is not None:
+            keyset_sorting = self._get_keyset_sorting(options["sort"])
+
+            if keyset_sorting is not None:
+                options["sort"] = keyset_sorting
+                options["projection"] = self._get_keyset_projection(
+                    options["projection"], keyset_sorting
+                )
+
+            if pagination.after is not None:
+                if keyset_sorting is None:
+                    raise InvalidCursorError
+
+                options["keyset_condition"] = self._get_keyset_condition(
+                    cursor=Cursor.decode(pagination.after), sorting=keyset_sorting
+                )
+                options["skip"] = None
+
+        return options
+
     async def get(
         self,
         *,
@@ -97,6 +326,148 @@ class BaseRepository(abc.ABC):
         """
         raise NotImplementedError
 
+    def get_next_cursor(
+        self,
+        documents: list[Mapping[str, Any]],
+        *,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+    ) -> str | None:
+        """Returns a cursor which points to the next page of the list.
+
+        Args:
+            documents (list[Mapping[str, Any]]): Documents of the current page.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+
+        Returns:
+            str | None: Next page cursor or None, in case it is the last page or
+            list can't be paginated by keyset.
+
+        """
+
+        if not documents or pagination is None or len(documents) < pagination.page_size:
+            return None
+
+        keyset_sorting = self._get_keyset_sorting(
+            self._get_list_sorting(sorting=sorting, search=search)
+        )
+
+        if keyset_sorting is None:
+            return None
+
+        return Cursor.from_document(
+            sorting=keyset_sorting, document=documents[-1]
+        ).encode()
+
+    def iter_get(
+        self,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        """Iterates over a list of documents based on parameters.
+
+        Args:
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword parameters.
+
+        Returns:
+            AsyncGenerator[Mapping[str, Any], None]: Documents generator.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+
+        """
+        raise NotImplementedError
+
+    async def get_and_count(
+        self,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> Mapping[str, Any]:
+        """Retrieves a list of documents and their total count based on parameters.
+
+        Args:
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword parameters.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of documents and their total count.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+
+        """
+        raise NotImplementedError
+
+    async def explain_get(
+        self,
+        *,
+        filter_: Any = None,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+    ) -> Mapping[str, Any]:
+        """Explains a list query the repository issues for parameters.
+
+        Args:
+            filter_ (Any): Parameters for list filtering. Defaults to None.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+
+        Returns:
+            Mapping[str, Any]: The list query command and summary of its plan.
+
+        Raises:
+            InvalidCursorError: In case pagination cursor is invalid.
+
+        """
+
+        options = self._get_list_query_options(
+            search=search, sorting=sorting, pagination=pagination
+        )
+
+        keyset_condition = options.pop("keyset_condition")
+
+        query_filter = await self._get_list_query_filter(filter_=filter_, search=search)
+
+        if keyset_condition is not None:
+            query_filter = (
+                {"$and": [query_filter, keyset_condition]}
+                if query_filter
+                else keyset_condition
+            )
+
+        command: dict[str, Any] = {
+            "find": self._collection_name,
+            "filter": query_filter or {},
+        }
+
+        if options["sort"] is not None:
+            command["sort"] = dict(options["sort"])
+
+        command.update(
+            {
+                key: options[key]
+                for key in ("projection", "skip", "limit")
+                if options[key] is not None
+            }
+        )
+
+        explanation = await self._mongo_service.explain(command=command)
+
+        return {
+            "command": command,
+            "plan": QueryProfiler.get_plan_summary(explanation),
+        }
+
     @staticmethod
     def _calculate_skip(pagination: Pagination | None) -> int | None:
         """Calculates count of documents to skip for reaching page.
@@ -116,6 +487,136 @@ class BaseRepository(abc.ABC):
             else None
         )
 
+    @staticmethod
+    def _get_keyset_sorting(
+        sort: list[tuple[str, int | Mapping[str, Any]]] | None,
+    ) -> list[tuple[str, int]] | None:
+        """Returns list sorting which is suitable for keyset pagination.
+
+        Unique "_id" field is appended to the sorting as a tiebreaker, so each
+        document has a strict position in a list.
+
+        Args:
+            sort (list[tuple[str, int | Mapping[str, Any]]] | None): List sorting.
+
+        Returns:
+            list[tuple[str, int]] | None: Keyset sorting or None, in case list is
+            sorted by computed value (e.g. search score).
+
+        """
+
+        keyset_sorting: list[tuple[str, int]] = []
+
+        for field, direction in sort or []:
+            if not isinstance(direction, int):
+                return None
+
+            keyset_sorting.append((field, direction))
+
+        if all(field != "_id" for field, _ in keyset_sorting):
+            keyset_sorting.append(
+                (
+                    "_id",
+                    keyset_sorting[-1][1] if keyset_sorting else SortingValuesEnum.ASC,
+                )
+            )
+
+        return keyset_sorting
+
+    @staticmethod
+    def _get_keyset_projection(
+        projection: Mapping[str, Any] | None, sorting: list[tuple[str, int]]
+    ) -> Mapping[str, Any] | None:
+        """Returns list query projection which keeps all the keyset sorting fields.
+
+        Args:
+            projection (Mapping[str, Any] | None): List query projection.
+            sorting (list[tuple[str, int]]): Keyset sorting.
+
+        Returns:
+            Mapping[str, Any] | None: List query projection or None.
+
+        """
+
+        if projection is None:
+            return None
+
+        fields = [field for field, _ in sorting]
+
+        def overlaps(key: str) -> bool:
+            return any(
+                key == field
+                or field.startswith(f"{key}.")
+                or key.startswith(f"{field}.")
+                for field in fields
+            )
+
+        keyset_projection = {
+            key: value
+            for key, value in projection.items()
+            if not (value == ProjectionValuesEnum.EXCLUDE and overlaps(key))
+        }
+
+        if ProjectionValuesEnum.INCLUDE in keyset_projection.values():
+            for field in fields:
+                if not any(
+                    field == key or field.startswith(f"{key}.")
+                    for key in keyset_projection
+                ):
+                    keyset_projection[field] = ProjectionValuesEnum.INCLUDE
+
+        return keyset_projection
+
+    @staticmethod
+    def _get_keyset_condition(
+        cursor: Cursor, sorting: list[tuple[str, int]]
+    ) -> Mapping[str, Any]:
+        """Returns keyset condition which selects documents after cursor.
+
+        Documents are compared by sorting fields lexicographically, null values go
+        first in ascending order and last in descending order as MongoDB sorts them.
+
+        Args:
+            cursor (Cursor): Keyset pagination cursor.
+            sorting (list[tuple[str, int]]): Keyset sorting.
+
+        Returns:
+            Mapping[str, Any]: Keyset query condition.
+
+        Raises:
+            InvalidCursorError: In case cursor is built for another sorting.
+
+        """
+
+        if cursor.sorting != sorting:
+            raise InvalidCursorError
+
+        conditions: list[dict[str, Any]] = []
+
+        for index, (field, direction) in enumerate(sorting):
+            equality = {
+                previous_field: previous_value
+                for (previous_field, _), previous_value in zip(
+                    sorting[:index], cursor.values[:index], strict=True
+                )
+            }
+
+            value = cursor.values[index]
+
+            ranges: list[dict[str, Any]] = []
+
+            if direction == SortingValuesEnum.ASC:
+                ranges.append(
+                    {field: {"$ne": None} if value is None else {"$gt": value}}
+                )
+
+            elif value is not None:
+                ranges.extend([{field: {"$lt": value}}, {field: None}])
+
+            conditions.extend({**equality, **range_} for range_ in ranges)
+
+        return {"$or": conditions}
+
     @abc.abstractmethod
     async def _get_list_query_filter(
         self, filter_: Any, search: Search | None
@@ -337,6 +838,33 @@ class BaseRepository(abc.ABC):
         """
         raise NotImplementedError
 
+    async def _create(
+        self,
+        document: Mapping[str, Any],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> dict[str, Any]:
+        """Inserts a document and returns it in the form it is stored in.
+
+        Document passes BSON encoding, so created entity doesn't need to be read
+        again (e.g. datetime values lose timezone and microseconds precision).
+
+        Args:
+            document (Mapping[str, Any]): Document to be inserted.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            dict[str, Any]: The created document with its unique identifier.
+
+        """
+
+        id_ = await self._mongo_service.insert_one(
+            collection=self._collection_name, document=document, session=session
+        )
+
+        return {**bson.decode(bson.encode(document)), "_id": id_}
+
     @abc.abstractmethod
     async def create(
         self,
@@ -383,6 +911,36 @@ class BaseRepository(abc.ABC):
             session=session,
         )
 
+    async def bulk_write(
+        self,
+        operations: Sequence[
+            InsertOne[Mapping[str, Any]] | UpdateOne | UpdateMany | DeleteOne
+        ],
+        *,
+        ordered: bool = True,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> BulkWriteResult:
+        """Executes mixed write operations in the repository in batches.
+
+        Args:
+            operations (Sequence[InsertOne | UpdateOne | UpdateMany | DeleteOne]):
+            Write operations to be executed.
+            ordered (bool): Defines if operations should be executed in order.
+            Defaults to True.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            BulkWriteResult: Aggregated counts of executed operations.
+
+        """
+        return await self._mongo_service.bulk_write(
+            collection=self._collection_name,
+            operations=operations,
+            ordered=ordered,
+            session=session,
+        )
+
     @abc.abstractmethod
     async def update_by_id(
         self,
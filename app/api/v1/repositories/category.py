@@ -1,14 +1,18 @@
 """Module that contains category repository class."""
 
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, Mapping, Sequence
+from contextlib import aclosing
 from typing import Any
 
 from bson import ObjectId
+from fastapi import Depends
+from injector import inject
 from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import DeleteOne, InsertOne, UpdateMany, UpdateOne
 
-from app.api.v1.constants import ProductParameterTypesEnum
+from app.api.v1.caches.category import CategoryCache, CategoryTree, CategoryTreeCache
 from app.api.v1.models import Pagination, Search, Sorting
-from app.api.v1.models.category import Category, CategoryFilter
+from app.api.v1.models.category import Category, CategoryFilter, ShortCategory
 from app.api.v1.repositories import BaseRepository
 from app.exceptions import EntityIsNotFoundError
 from app.services.mongo.constants import (
@@ -16,13 +20,65 @@ from app.services.mongo.constants import (
     ProjectionValuesEnum,
     SortingValuesEnum,
 )
+from app.services.mongo.models import BulkWriteResult
+from app.services.mongo.service import MongoDBService
 
 
+@inject
 class CategoryRepository(BaseRepository):
-    """Category repository for handling data access operations."""
+    """Category repository for handling data access operations.
+
+    Tree relations are resolved by the in-memory category tree index, writes
+    drop it and cached categories.
+
+    """
 
     _collection_name: str = MongoCollectionsEnum.CATEGORIES
 
+    def __init__(
+        self,
+        mongo_service: MongoDBService = Depends(),
+        tree_cache: CategoryTreeCache = Depends(),
+        cache: CategoryCache = Depends(),
+    ) -> None:
+        """Initializes the CategoryRepository.
+
+        Args:
+            mongo_service (MongoDBService): An instance of the MongoDB service.
+            tree_cache (CategoryTreeCache): Category tree cache.
+            cache (CategoryCache): Category cache.
+
+        """
+
+        super().__init__(mongo_service=mongo_service)
+
+        self.tree_cache = tree_cache
+
+        self.cache = cache
+
+    async def get_tree(self, category_id: ObjectId | None = None) -> CategoryTree:
+        """Returns the category tree index.
+
+        Args:
+            category_id (ObjectId | None): The unique identifier of the existing
+            category which must be in the tree. Defaults to None.
+
+        Returns:
+            CategoryTree: Category tree index.
+
+        """
+
+        async def load_categories() -> list[Mapping[str, Any]]:
+            return await self._mongo_service.find(
+                collection=self._collection_name,
+                projection=self._get_list_query_projection(),
+                sort=self._get_list_default_sorting(),
+            )
+
+        return await self.tree_cache.get_or_load(
+            loader=load_categories, category_id=category_id
+        )
+
     async def get(
         self,
         *,
@@ -54,6 +110,75 @@ class CategoryRepository(BaseRepository):
             session=session,
         )
 
+    async def iter_get(
+        self,
+        *,
+        filter_: CategoryFilter | None = None,
+        sorting: Sorting | None = None,
+        batch_size: int | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        """Iterates over a list of categories based on parameters.
+
+        Args:
+            filter_ (CategoryFilter | None): Parameters for list filtering.
+            Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            batch_size (int | None): The number of categories fetched per round trip.
+            Defaults to None.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Yields:
+            Mapping[str, Any]: The retrieved category.
+
+        """
+
+        # Driver cursor is closed even if consumer stops early
+        async with aclosing(
+            self._iter_get(
+                filter_=await self._get_list_query_filter(filter_=filter_, search=None),
+                sorting=sorting,
+                batch_size=batch_size,
+                session=session,
+            )
+        ) as documents:
+            async for document in documents:
+                yield document
+
+    async def get_and_count(
+        self,
+        *,
+        filter_: CategoryFilter | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> Mapping[str, Any]:
+        """Retrieves a list of categories and their total count based on parameters.
+
+        Args:
+            filter_ (CategoryFilter | None): Parameters for list filtering.
+            Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of categories and their total count.
+
+        """
+        return await self._get_and_count(
+            filter_=await self._get_list_query_filter(filter_=filter_, search=None),
+            sorting=sorting,
+            pagination=pagination,
+            session=session,
+        )
+
     async def _get_list_query_filter(
         self, filter_: CategoryFilter | None, search: Search | None
     ) -> Mapping[str, Any] | None:
@@ -73,15 +198,21 @@ class CategoryRepository(BaseRepository):
         if filter_ is None:
             return query_filter  # pragma: no cover
 
-        if filter_.path is not None:
-            query_filter["path"] = {"$regex": f"^{filter_.path}"}
+        if filter_.path is None and filter_.leafs is False:
+            return query_filter
+
+        tree = await self.get_tree()
+
+        ids = (
+            tree.get_ids_by_path(path=filter_.path)
+            if filter_.path is not None
+            else tree.leaf_ids
+        )
 
         if filter_.leafs is True:
-            parent_ids = await self._mongo_service.distinct(
-                self._collection_name, "parent_id", filter_={"parent_id": {"$ne": None}}
-            )
+            ids &= tree.leaf_ids
 
-            query_filter["_id"] = {"$nin": parent_ids}
+        query_filter["_id"] = {"$in": sorted(ids)}
 
         return query_filter
 
@@ -163,15 +294,6 @@ class CategoryRepository(BaseRepository):
                         "as": "parameters",
                     }
                 },
-                {
-                    "$lookup": {
-                        "from": MongoCollectionsEnum.CATEGORIES,
-                        "localField": "_id",
-                        "foreignField": "parent_id",
-                        "as": "children",
-                    }
-                },
-                {"$addFields": {"has_children": {"$gt": [{"$size": "$children"}, 0]}}},
             ],
             session=session,
         )
@@ -179,7 +301,18 @@ class CategoryRepository(BaseRepository):
         if not result:
             raise EntityIsNotFoundError
 
-        return Category(**result[0])
+        tree = await self.get_tree(category_id=id_)
+
+        children = [ShortCategory(**child) for child in tree.get_children(id_=id_)]
+
+        return Category(
+            **result[0],
+            has_children=bool(children),
+            children=children,
+            breadcrumbs=[
+                ShortCategory(**category) for category in tree.get_breadcrumbs(id_=id_)
+            ],
+        )
 
     async def get_and_update_by_id(
         self,
@@ -252,13 +385,91 @@ class CategoryRepository(BaseRepository):
         """
         raise NotImplementedError
 
+    async def create_many(
+        self,
+        documents: list[dict[str, Any]],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> list[Any]:
+        """Creates bulk categories in the repository.
+
+        Args:
+            documents (list[dict[str, Any]]): Categories to be created.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            list[Any]: The IDs of created categories.
+
+        """
+
+        try:
+            return await super().create_many(documents=documents, session=session)
+
+        finally:
+            await self._invalidate_caches()
+
+    async def bulk_write(
+        self,
+        operations: Sequence[
+            InsertOne[Mapping[str, Any]] | UpdateOne | UpdateMany | DeleteOne
+        ],
+        *,
+        ordered: bool = True,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> BulkWriteResult:
+        """Executes mixed write operations in the repository in batches.
+
+        Args:
+            operations (Sequence[InsertOne | UpdateOne | UpdateMany | DeleteOne]):
+            Write operations to be executed.
+            ordered (bool): Defines if operations should be executed in order.
+            Defaults to True.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            BulkWriteResult: Aggregated counts of executed operations.
+
+        """
+
+        try:
+            return await super().bulk_write(
+                operations=operations, ordered=ordered, session=session
+            )
+
+        finally:
+            await self._invalidate_caches()
+
+    async def delete_all(
+        self, *, session: AsyncIOMotorClientSession | None = None
+    ) -> None:
+        """Deletes all categories from the repository.
+
+        Args:
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        """
+
+        await super().delete_all(session=session)
+
+        await self._invalidate_caches()
+
+    async def _invalidate_caches(self) -> None:
+        """Drops category tree index and cached categories after writes."""
+
+        await self.tree_cache.invalidate()
+
+        await self.cache.invalidate()
+
     async def calculate_category_parameters(
         self,
         id_: ObjectId,
         *,
         session: AsyncIOMotorClientSession | None = None,
-    ) -> dict[str, Any]:
-        """Calculates list of parameters for specific product category.
+    ) -> list[Mapping[str, Any]]:
+        """Counts products by values of parameters of specific product category.
 
         Args:
             id_ (ObjectId): The unique identifier of the category.
@@ -266,66 +477,45 @@ class CategoryRepository(BaseRepository):
             if operation is transactional. Defaults to None.
 
         Returns:
-            dict[str, Any]: The calculated category-parameters.
+            list[Mapping[str, Any]]: Parameter, value and count of products.
 
         """
 
         category = await self.get_by_id(id_=id_, session=session)
 
         # Ignore exception handling, category is validated earlier
-        parameters = category.parameters
-
-        pipeline: list[dict[str, Any]] = [{"$match": {"category_id": id_}}]
-
-        list_type_parameters = [
-            parameter
-            for parameter in parameters
-            if parameter.type == ProductParameterTypesEnum.LIST.name
-        ]
-
-        if list_type_parameters:
-            pipeline.extend(
-                [
-                    {
-                        "$unwind": {
-                            "path": f"$parameters.{parameter.machine_name}",
-                            "preserveNullAndEmptyArrays": True,
-                        }
-                    }
-                    for parameter in list_type_parameters
-                ]
-            )
-
-        pipeline.append(
-            {
-                "$group": {
-                    "_id": "$category_id",
-                    **{
-                        parameter.machine_name: {
-                            "$addToSet": f"$parameters.{parameter.machine_name}"
-                        }
-                        for parameter in parameters
-                    },
-                }
-            },
-        )
+        parameters = [parameter.machine_name for parameter in category.parameters]
 
-        result = await self._mongo_service.aggregate(
+        return await self._mongo_service.aggregate(
             collection=MongoCollectionsEnum.PRODUCTS,
-            pipeline=pipeline,
+            pipeline=[
+                {"$match": {"category_id": id_}},
+                {"$project": {"parameter": {"$objectToArray": "$parameters"}}},
+                {"$unwind": "$parameter"},
+                {"$match": {"parameter.k": {"$in": parameters}}},
+                # Elements of list parameters are counted one by one, empty lists
+                # are skipped, but null values are counted
+                {
+                    "$unwind": {
+                        "path": "$parameter.v",
+                        "preserveNullAndEmptyArrays": True,
+                    }
+                },
+                {"$match": {"parameter.v": {"$exists": True}}},
+                {
+                    "$group": {
+                        "_id": {"parameter": "$parameter.k", "value": "$parameter.v"},
+                        "count": {"$sum": 1},
+                    }
+                },
+                {
+                    "$project": {
+                        "_id": ProjectionValuesEnum.EXCLUDE,
+                        "parameter": "$_id.parameter",
+                        "value": "$_id.value",
+                        "count": ProjectionValuesEnum.INCLUDE,
+                    }
+                },
+            ],
             session=session,
         )
-
-        return {
-            parameter: sorted(
-                value,
-                # 'None' values will be in the end of list, not case-sensitive
-                key=lambda element: (
-                    element is None,
-                    element.lower() if isinstance(element, str) else element,
-                ),
-            )
-            if isinstance(value, list)
-            else value
-            for parameter, value in result[0].items()
-        }
@@ -0,0 +1,372 @@
+"""Module that contains category parameter values repository class."""
+
+from collections.abc import Mapping
+from typing import Any
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import UpdateOne
+
+from app.api.v1.models import Search
+from app.api.v1.repositories import BaseRepository
+from app.services.mongo.constants import MongoCollectionsEnum, ProjectionValuesEnum
+
+
+class CategoryParameterValuesRepository(BaseRepository):
+    """Category parameter values repository for handling data access operations.
+
+    Every document keeps the count of products of the category which have
+    the value of the parameter, so the category-parameters can be maintained by
+    changes of products instead of recalculation over the whole category.
+
+    """
+
+    _collection_name: str = MongoCollectionsEnum.CATEGORY_PARAMETER_VALUES
+
+    async def get(
+        self,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> list[Mapping[str, Any]]:
+        """Retrieves a list of category parameter values based on parameters.
+
+        Args:
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword parameters.
+
+        Returns:
+            list[Mapping[str, Any]]: The retrieved list of category parameter values.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    async def _get_list_query_filter(
+        self, filter_: Any, search: Search | None
+    ) -> Mapping[str, Any] | None:
+        """Returns a query filter for list of category parameter values.
+
+        Args:
+            filter_ (Any): Parameters for list filtering.
+            search (Search | None): Parameters for list searching.
+
+        Returns:
+            Mapping[str, Any] | None: List query filter or None.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _get_list_query_projection() -> Mapping[str, Any] | None:
+        """Returns a query projection for list of category parameter values.
+
+        Returns:
+            Mapping[str, Any] | None: List query projection or None.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _get_list_default_sorting() -> list[tuple[str, int | Mapping[str, Any]]] | None:
+        """Returns default sorting for category parameter values.
+
+        Returns:
+            list[tuple[str, int | Mapping[str, Any]]] | None: Default sorting.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    async def count(
+        self,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Counts category parameter values based on parameters.
+
+        Args:
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword parameters.
+
+        Returns:
+            int: Count of category parameter values.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    async def get_by_id(
+        self, id_: ObjectId, *, session: AsyncIOMotorClientSession | None = None
+    ) -> Any:
+        """Retrieves a category parameter value by its unique identifier.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the category parameter value.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            Any: The retrieved category parameter value.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    async def get_and_update_by_id(
+        self,
+        id_: ObjectId,
+        data: Any,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> Any:
+        """
+        Updates and retrieves a single category parameter value by its unique
+        identifier.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the category parameter value.
+            data (Any): Data to update category parameter value.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            Any: The retrieved category parameter value.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    async def create(
+        self,
+        data: Any,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> Any:
+        """Creates a new category parameter value in repository.
+
+        Args:
+            data (Any): The data for the new category parameter value.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            Any: The ID of created category parameter value.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    async def update_by_id(
+        self,
+        id_: ObjectId,
+        data: Any,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Updates a category parameter value in repository.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the category parameter value.
+            data (Any): Data to update category parameter value.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+
+        """
+        raise NotImplementedError
+
+    async def exists(
+        self,
+        category_id: ObjectId,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> bool:
+        """Checks if values of parameters of specific category are counted.
+
+        Args:
+            category_id (ObjectId): The unique identifier of the category.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            bool: True if values are counted else False.
+
+        """
+
+        document = await self._mongo_service.find_one(
+            collection=self._collection_name,
+            filter_={"category_id": category_id},
+            session=session,
+        )
+
+        return document is not None
+
+    async def get_category_ids(
+        self, *, session: AsyncIOMotorClientSession | None = None
+    ) -> list[ObjectId]:
+        """Retrieves identifiers of categories which values are counted.
+
+        Args:
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            list[ObjectId]: The unique identifiers of categories.
+
+        """
+        return await self._mongo_service.distinct(
+            collection=self._collection_name, field="category_id", session=session
+        )
+
+    async def increment(
+        self,
+        category_id: ObjectId,
+        changes: Mapping[tuple[str, Any], int],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> None:
+        """Increments counts of values of parameters of specific category.
+
+        Args:
+            category_id (ObjectId): The unique identifier of the category.
+            changes (Mapping[tuple[str, Any], int]): Count increments by parameter
+            and value pairs, negative for decrements.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        """
+
+        await self._mongo_service.bulk_write(
+            collection=self._collection_name,
+            operations=[
+                UpdateOne(
+                    {
+                        "category_id": category_id,
+                        "parameter": parameter,
+                        "value": value,
+                    },
+                    {"$inc": {"count": count}},
+                    upsert=True,
+                )
+                for (parameter, value), count in changes.items()
+            ],
+            ordered=False,
+            session=session,
+        )
+
+        # Values which are not used by any product anymore
+        if any(count < 0 for count in changes.values()):
+            await self._mongo_service.delete_many(
+                collection=self._collection_name,
+                filter_={"category_id": category_id, "count": {"$lte": 0}},
+                session=session,
+            )
+
+    async def replace(
+        self,
+        category_id: ObjectId,
+        counts: list[Mapping[str, Any]],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> None:
+        """Replaces counts of values of parameters of specific category.
+
+        Args:
+            category_id (ObjectId): The unique identifier of the category.
+            counts (list[Mapping[str, Any]]): Parameter, value and count of products.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        """
+
+        await self._mongo_service.delete_many(
+            collection=self._collection_name,
+            filter_={"category_id": category_id},
+            session=session,
+        )
+
+        if counts:
+            await self._mongo_service.insert_many(
+                collection=self._collection_name,
+                documents=[{"category_id": category_id, **count} for count in counts],
+                session=session,
+            )
+
+    async def get_values(
+        self,
+        category_id: ObjectId,
+        parameters: list[str],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> dict[str, list[Any]]:
+        """Retrieves sorted values of parameters of specific category.
+
+        Args:
+            category_id (ObjectId): The unique identifier of the category.
+            parameters (list[str]): Machine names of parameters.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            dict[str, list[Any]]: Values by parameters, parameters without values
+            have empty lists.
+
+        """
+
+        documents = await self._mongo_service.find(
+            collection=self._collection_name,
+            filter_={
+                "category_id": category_id,
+                "parameter": {"$in": parameters},
+                "count": {"$gt": 0},
+            },
+            projection={
+                "_id": ProjectionValuesEnum.EXCLUDE,
+                "parameter": ProjectionValuesEnum.INCLUDE,
+                "value": ProjectionValuesEnum.INCLUDE,
+            },
+            session=session,
+        )
+
+        values: dict[str, list[Any]] = {parameter: [] for parameter in parameters}
+
+        for document in documents:
+            values[document["parameter"]].append(document["value"])
+
+        return {
+            parameter: sorted(
+                value,
+                # 'None' values will be in the end of list, not case-sensitive
+                key=lambda element: (
+                    element is None,
+                    element.lower() if isinstance(element, str) else element,
+                ),
+            )
+            for parameter, value in values.items()
+        }
@@ -1,16 +1,22 @@
 """Module that contains comment repository class."""
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 import arrow
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClientSession
 
-from app.api.v1.models import Search
-from app.api.v1.models.comment import Comment, CommentCreateData, CommentUpdateData
+from app.api.v1.models import Pagination, Search, Sorting
+from app.api.v1.models.comment import (
+    Comment,
+    CommentCreateData,
+    CommentFilter,
+    CommentUpdateData,
+)
 from app.api.v1.repositories import BaseRepository
-from app.services.mongo.constants import MongoCollectionsEnum
+from app.services.mongo.constants import MongoCollectionsEnum, SortingValuesEnum
+from app.utils.ranking import Ranking
 
 
 class CommentRepository(BaseRepository):
@@ -21,42 +27,92 @@ class CommentRepository(BaseRepository):
     async def get(
         self,
         *,
+        filter_: CommentFilter | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
         session: AsyncIOMotorClientSession | None = None,
         **kwargs: Any,
     ) -> list[Mapping[str, Any]]:
-        """Retrieves a list of comments based on parameters.
+        """Retrieves a list of top-level comments based on parameters.
 
         Args:
+            filter_ (CommentFilter | None): Parameters for list filtering.
+            Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
             session (AsyncIOMotorClientSession | None): Defines a client session
             if operation is transactional. Defaults to None.
-            kwargs (Any): Keyword parameters.
+            kwargs (Any): Keyword arguments.
 
         Returns:
-            list[Mapping[str, Any]]: The retrieved list of comments.
+            list[Mapping[str, Any]]: The retrieved list of top-level comments.
 
-        Raises:
-            NotImplementedError: This method is not implemented.
+        """
+        return await self._get(
+            filter_=await self._get_list_query_filter(filter_=filter_, search=None),
+            sorting=sorting,
+            pagination=pagination,
+            session=session,
+        )
 
+    async def get_and_count(
+        self,
+        *,
+        filter_: CommentFilter | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> Mapping[str, Any]:
         """
-        raise NotImplementedError
+        Retrieves a list of top-level comments and their total count based on
+        parameters.
+
+        Args:
+            filter_ (CommentFilter | None): Parameters for list filtering.
+            Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of top-level comments and their
+            total count.
+
+        """
+        return await self._get_and_count(
+            filter_=await self._get_list_query_filter(filter_=filter_, search=None),
+            sorting=sorting,
+            pagination=pagination,
+            session=session,
+        )
 
     async def _get_list_query_filter(
-        self, filter_: Any, search: Search | None
+        self, filter_: CommentFilter | None, search: Search | None
     ) -> Mapping[str, Any] | None:
-        """Returns a query filter for list of comments.
+        """Returns a query filter for list of top-level comments.
+
+        Top-level comments are matched by empty parent, so the list is walked by
+        thread_id/parent_comment_id indexes in order of sorting without fetching
+        replies.
 
         Args:
-            filter_ (Any): Parameters for list filtering.
+            filter_ (CommentFilter | None): Parameters for list filtering.
             search (Search | None): Parameters for list searching.
 
         Returns:
             Mapping[str, Any] | None: List query filter or None.
 
-        Raises:
-            NotImplementedError: This method is not implemented.
-
         """
-        raise NotImplementedError
+
+        query_filter: dict[str, Any] = {"parent_comment_id": None}
+
+        if filter_ is not None:
+            query_filter["thread_id"] = filter_.thread_id
+
+        return query_filter
 
     @staticmethod
     def _get_list_query_projection() -> Mapping[str, Any] | None:
@@ -65,11 +121,8 @@ class CommentRepository(BaseRepository):
         Returns:
             Mapping[str, Any] | None: List query projection or None.
 
-        Raises:
-            NotImplementedError: This method is not implemented.
-
         """
-        raise NotImplementedError
+        return None
 
     @staticmethod
     def _get_list_default_sorting() -> list[tuple[str, int | Mapping[str, Any]]] | None:
@@ -78,33 +131,101 @@ class CommentRepository(BaseRepository):
         Returns:
             list[tuple[str, int | Mapping[str, Any]]] | None: Default sorting.
 
-        Raises:
-            NotImplementedError: This method is not implemented.
-
         """
-        raise NotImplementedError
+        return [("_id", SortingValuesEnum.ASC)]
 
     async def count(
         self,
         *,
+        filter_: CommentFilter | None = None,
         session: AsyncIOMotorClientSession | None = None,
         **kwargs: Any,
     ) -> int:
-        """Counts comments based on parameters.
+        """Counts top-level comments based on parameters.
 
         Args:
+            filter_ (CommentFilter | None): Parameters for list filtering.
+            Defaults to None.
             session (AsyncIOMotorClientSession | None): Defines a client session
             if operation is transactional. Defaults to None.
-            kwargs (Any): Keyword parameters.
+            kwargs (Any): Keyword arguments.
 
         Returns:
-            int: Count of comments.
+            int: Count of top-level comments.
 
-        Raises:
-            NotImplementedError: This method is not implemented.
+        """
+        return await self._count(
+            filter_=await self._get_list_query_filter(filter_=filter_, search=None),
+            session=session,
+        )
+
+    async def get_replies(
+        self,
+        thread_id: ObjectId,
+        paths: Sequence[str],
+        depth: int,
+        limit: int,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> list[Mapping[str, Any]]:
+        """Retrieves replies of top-level comments sorted by their paths.
+
+        Replies of each top-level comment are neighbours by path, so all of them
+        are fetched by one query which scans a range of thread_id/path index per
+        top-level comment. Replies which are deeper than requested are filtered
+        out by the same index.
+
+        Args:
+            thread_id (ObjectId): The unique identifier of the thread.
+            paths (Sequence[str]): Paths of top-level comments.
+            depth (int): Count of reply levels under top-level comments.
+            limit (int): Maximum count of replies.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            list[Mapping[str, Any]]: The retrieved list of replies.
 
         """
-        raise NotImplementedError
+
+        if not paths or depth <= 0:
+            return []
+
+        return await self._mongo_service.find(
+            collection=self._collection_name,
+            filter_=self.get_replies_query_filter(
+                thread_id=thread_id, paths=paths, depth=depth
+            ),
+            sort=[("path", SortingValuesEnum.ASC)],
+            limit=limit,
+            session=session,
+        )
+
+    @staticmethod
+    def get_replies_query_filter(
+        thread_id: ObjectId, paths: Sequence[str], depth: int
+    ) -> Mapping[str, Any]:
+        """Returns a query filter for replies of top-level comments.
+
+        Args:
+            thread_id (ObjectId): The unique identifier of the thread.
+            paths (Sequence[str]): Paths of top-level comments.
+            depth (int): Count of reply levels under top-level comments.
+
+        Returns:
+            Mapping[str, Any]: Replies query filter.
+
+        """
+        return {
+            "thread_id": thread_id,
+            # Replies of the comment are before its path followed by "0",
+            # since "/" is the preceding character
+            "$or": [
+                {"path": {"$gt": f"{path}/", "$lt": f"{path}0"}}
+                for path in sorted(paths)
+            ],
+            "path": {"$regex": f"^(/[^/]+){{2,{depth + 1}}}$"},
+        }
 
     async def get_by_id(
         self, id_: ObjectId, *, session: AsyncIOMotorClientSession | None = None
@@ -161,7 +282,7 @@ class CommentRepository(BaseRepository):
         data: CommentCreateData,
         *,
         session: AsyncIOMotorClientSession | None = None,
-    ) -> Any:
+    ) -> Comment:
         """Creates a new comment in repository.
 
         Args:
@@ -170,14 +291,14 @@ class CommentRepository(BaseRepository):
             if operation is transactional. Defaults to None.
 
         Returns:
-            Any: The ID of created comment.
+            Comment: Created comment.
 
         """
 
         comment_id = ObjectId()
+        created_at = arrow.utcnow().datetime
 
-        return await self._mongo_service.insert_one(
-            collection=self._collection_name,
+        comment = await self._create(
             document={
                 "_id": comment_id,
                 "body": data.body,
@@ -191,13 +312,21 @@ class CommentRepository(BaseRepository):
                 else f"/{comment_id}",
                 "upvotes": 0,
                 "downvotes": 0,
+                "scores": {
+                    "best": Ranking.get_best_score(upvotes=0, downvotes=0),
+                    "hot": Ranking.get_hot_score(
+                        upvotes=0, downvotes=0, created_at=created_at
+                    ),
+                },
                 "deleted": "False",
-                "created_at": arrow.utcnow().datetime,
+                "created_at": created_at,
                 "updated_at": None,
             },
             session=session,
         )
 
+        return Comment(**comment)
+
     async def update_by_id(
         self,
         id_: ObjectId,
@@ -268,7 +397,9 @@ class CommentRepository(BaseRepository):
         await self._mongo_service.update_one(
             collection=self._collection_name,
             filter_={"_id": id_},
-            update={"$inc": {"upvotes" if value is True else "downvotes": 1}},
+            update=self._get_votes_update(
+                {"upvotes" if value is True else "downvotes": 1}
+            ),
             session=session,
         )
 
@@ -292,11 +423,11 @@ class CommentRepository(BaseRepository):
         await self._mongo_service.update_one(
             collection=self._collection_name,
             filter_={"_id": id_},
-            update={
-                "$inc": {"upvotes": 1, "downvotes": -1}
+            update=self._get_votes_update(
+                {"upvotes": 1, "downvotes": -1}
                 if new_value is True
                 else {"upvotes": -1, "downvotes": 1}
-            },
+            ),
             session=session,
         )
 
@@ -320,6 +451,32 @@ class CommentRepository(BaseRepository):
         await self._mongo_service.update_one(
             collection=self._collection_name,
             filter_={"_id": id_},
-            update={"$inc": {"upvotes" if value is True else "downvotes": -1}},
+            update=self._get_votes_update(
+                {"upvotes" if value is True else "downvotes": -1}
+            ),
             session=session,
         )
+
+    @staticmethod
+    def _get_votes_update(changes: Mapping[str, int]) -> list[Mapping[str, Any]]:
+        """Returns update pipeline which changes vote counters and scores.
+
+        Scores are recalculated from the changed counters by the same atomic
+        update, so concurrent votes can't leave scores of outdated counters.
+
+        Args:
+            changes (Mapping[str, int]): Increments of vote counters.
+
+        Returns:
+            list[Mapping[str, Any]]: Update pipeline.
+
+        """
+        return [
+            {
+                "$set": {
+                    field: {"$add": [f"${field}", change]}
+                    for field, change in changes.items()
+                }
+            },
+            {"$set": {"scores": Ranking.get_scores_expression()}},
+        ]
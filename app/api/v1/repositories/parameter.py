@@ -1,21 +1,54 @@
 """Module that contains parameter repository class."""
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from bson import ObjectId
+from fastapi import Depends
+from injector import inject
 from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import DeleteOne, InsertOne, UpdateMany, UpdateOne
 
+from app.api.v1.caches.category import CategoryCache
+from app.api.v1.caches.parameter import ParametersCache
 from app.api.v1.models import Pagination, Search, Sorting
 from app.api.v1.repositories import BaseRepository
 from app.services.mongo.constants import MongoCollectionsEnum, ProjectionValuesEnum
+from app.services.mongo.models import BulkWriteResult
+from app.services.mongo.service import MongoDBService
 
 
+@inject
 class ParameterRepository(BaseRepository):
-    """Parameter repository for handling data access operations."""
+    """Parameter repository for handling data access operations.
+
+    Writes drop cached parameters and cached categories, which contain them.
+
+    """
 
     _collection_name: str = MongoCollectionsEnum.PARAMETERS
 
+    def __init__(
+        self,
+        mongo_service: MongoDBService = Depends(),
+        cache: ParametersCache = Depends(),
+        category_cache: CategoryCache = Depends(),
+    ) -> None:
+        """Initializes the ParameterRepository.
+
+        Args:
+            mongo_service (MongoDBService): An instance of the MongoDB service.
+            cache (ParametersCache): Parameters cache.
+            category_cache (CategoryCache): Category cache.
+
+        """
+
+        super().__init__(mongo_service=mongo_service)
+
+        self.cache = cache
+
+        self.category_cache = category_cache
+
     async def get(
         self,
         *,
@@ -192,3 +225,81 @@ class ParameterRepository(BaseRepository):
 
         """
         raise NotImplementedError
+
+    async def create_many(
+        self,
+        documents: list[dict[str, Any]],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> list[Any]:
+        """Creates bulk parameters in the repository.
+
+        Args:
+            documents (list[dict[str, Any]]): Parameters to be created.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            list[Any]: The IDs of created parameters.
+
+        """
+
+        try:
+            return await super().create_many(documents=documents, session=session)
+
+        finally:
+            await self._invalidate_caches()
+
+    async def bulk_write(
+        self,
+        operations: Sequence[
+            InsertOne[Mapping[str, Any]] | UpdateOne | UpdateMany | DeleteOne
+        ],
+        *,
+        ordered: bool = True,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> BulkWriteResult:
+        """Executes mixed write operations in the repository in batches.
+
+        Args:
+            operations (Sequence[InsertOne | UpdateOne | UpdateMany | DeleteOne]):
+            Write operations to be executed.
+            ordered (bool): Defines if operations should be executed in order.
+            Defaults to True.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            BulkWriteResult: Aggregated counts of executed operations.
+
+        """
+
+        try:
+            return await super().bulk_write(
+                operations=operations, ordered=ordered, session=session
+            )
+
+        finally:
+            await self._invalidate_caches()
+
+    async def delete_all(
+        self, *, session: AsyncIOMotorClientSession | None = None
+    ) -> None:
+        """Deletes all parameters from the repository.
+
+        Args:
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        """
+
+        await super().delete_all(session=session)
+
+        await self._invalidate_caches()
+
+    async def _invalidate_caches(self) -> None:
+        """Drops cached parameters and categories after writes."""
+
+        await self.cache.invalidate()
+
+        await self.category_cache.invalidate()
@@ -1,11 +1,13 @@
 """Module that contains product repository class."""
 
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import aclosing
 from typing import Any
 
 import arrow
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import UpdateOne
 
 from app.api.v1.models import Pagination, Search, Sorting
 from app.api.v1.models.product import (
@@ -61,6 +63,83 @@ class ProductRepository(BaseRepository):
             session=session,
         )
 
+    async def iter_get(
+        self,
+        *,
+        filter_: ProductFilter | None = None,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        batch_size: int | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        """Iterates over a list of products based on parameters.
+
+        Args:
+            filter_ (ProductFilter | None): Parameters for list filtering.
+            Defaults to None.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            batch_size (int | None): The number of products fetched per round trip.
+            Defaults to None.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Yields:
+            Mapping[str, Any]: The retrieved product.
+
+        """
+
+        # Driver cursor is closed even if consumer stops early
+        async with aclosing(
+            self._iter_get(
+                filter_=await self._get_list_query_filter(
+                    filter_=filter_, search=search
+                ),
+                search=search,
+                sorting=sorting,
+                batch_size=batch_size,
+                session=session,
+            )
+        ) as documents:
+            async for document in documents:
+                yield document
+
+    async def get_and_count(
+        self,
+        *,
+        filter_: ProductFilter | None = None,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> Mapping[str, Any]:
+        """Retrieves a list of products and their total count based on parameters.
+
+        Args:
+            filter_ (ProductFilter | None): Parameters for list filtering.
+            Defaults to None.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of products and their total count.
+
+        """
+        return await self._get_and_count(
+            filter_=await self._get_list_query_filter(filter_=filter_, search=search),
+            search=search,
+            sorting=sorting,
+            pagination=pagination,
+            session=session,
+        )
+
     async def _get_list_query_filter(
         self, filter_: ProductFilter | None, search: Search | None
     ) -> Mapping[str, Any] | None:
@@ -82,7 +161,16 @@ class ProductRepository(BaseRepository):
         if filter_ is None:
             return query_filter  # pragma: no cover
 
-        if filter_.category_id is not None:
+        if filter_.category_ids is not None:
+            query_filter["category_id"] = {
+                "$in": [
+                    category_id
+                    for category_id in filter_.category_ids
+                    if filter_.category_id in {None, category_id}
+                ]
+            }
+
+        elif filter_.category_id is not None:
             query_filter["category_id"] = filter_.category_id
 
         if filter_.available is not None:
@@ -175,11 +263,14 @@ class ProductRepository(BaseRepository):
         data: ProductData,
         *,
         session: AsyncIOMotorClientSession | None = None,
-    ) -> Product:
+    ) -> tuple[Product, Product]:
         """
         Updates and retrieves a single product from the repository by its
         unique identifier.
 
+        Product is returned as it was right before the update too, so changes are
+        calculated against it even if the product is updated concurrently.
+
         Args:
             id_ (ObjectId): The unique identifier of the product.
             data (ProductData): Data to update product.
@@ -187,38 +278,39 @@ class ProductRepository(BaseRepository):
             if operation is transactional. Defaults to None.
 
         Returns:
-            Product: The retrieved product object.
+            tuple[Product, Product]: The original and the updated product objects.
 
         """
 
+        changes = {
+            "name": data.name,
+            "synopsis": data.synopsis,
+            "description": data.description,
+            "quantity": data.quantity,
+            "price": data.price,
+            "category_id": data.category_id,
+            "available": data.available,
+            "html_body": data.html_body,
+            "parameters": data.parameters,
+            "updated_at": arrow.utcnow().datetime,
+        }
+
         product = await self._mongo_service.find_one_and_update(
             collection=self._collection_name,
             filter_={"_id": id_},
-            update={
-                "$set": {
-                    "name": data.name,
-                    "synopsis": data.synopsis,
-                    "description": data.description,
-                    "quantity": data.quantity,
-                    "price": data.price,
-                    "category_id": data.category_id,
-                    "available": data.available,
-                    "html_body": data.html_body,
-                    "parameters": data.parameters,
-                    "updated_at": arrow.utcnow().datetime,
-                }
-            },
+            update={"$set": changes},
+            return_updated=False,
             session=session,
         )
 
-        return Product(**product)
+        return Product(**product), Product(**{**product, **changes})
 
     async def create(
         self,
         data: ProductCreateData,
         *,
         session: AsyncIOMotorClientSession | None = None,
-    ) -> Any:
+    ) -> Product:
         """Creates a new product in repository.
 
         Args:
@@ -227,11 +319,11 @@ class ProductRepository(BaseRepository):
             if operation is transactional. Defaults to None.
 
         Returns:
-            Any: The ID of created product.
+            Product: Created product.
 
         """
-        return await self._mongo_service.insert_one(
-            collection=self._collection_name,
+
+        product = await self._create(
             document={
                 "name": data.name,
                 "synopsis": data.synopsis,
@@ -250,6 +342,8 @@ class ProductRepository(BaseRepository):
             session=session,
         )
 
+        return Product(**product)
+
     async def update_by_id(
         self,
         id_: ObjectId,
@@ -274,20 +368,90 @@ class ProductRepository(BaseRepository):
         raise NotImplementedError
 
     async def increment_views(
-        self, id_: ObjectId, *, session: AsyncIOMotorClientSession | None = None
+        self,
+        views: Mapping[ObjectId, int],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
     ) -> None:
-        """Increments a views field for product by its unique identifier.
+        """Increments views fields of products in one bulk write.
 
         Args:
-            id_ (ObjectId): The unique identifier of the product.
+            views (Mapping[ObjectId, int]): Count of views by unique identifiers
+            of products.
             session (AsyncIOMotorClientSession | None): Defines a client session
             if operation is transactional. Defaults to None.
 
         """
 
-        await self._mongo_service.update_one(
+        await self._mongo_service.bulk_write(
             collection=self._collection_name,
-            filter_={"_id": id_},
-            update={"$inc": {"views": 1}},
+            operations=[
+                UpdateOne({"_id": id_}, {"$inc": {"views": count}})
+                for id_, count in views.items()
+            ],
+            ordered=False,
+            session=session,
+        )
+
+    async def get_most_viewed(
+        self,
+        *,
+        category_id: ObjectId | None = None,
+        limit: int,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> list[Mapping[str, Any]]:
+        """Retrieves the most viewed available products with their views.
+
+        Args:
+            category_id (ObjectId | None): The unique identifier of the category.
+            Defaults to None.
+            limit (int): The maximum number of products.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            list[Mapping[str, Any]]: Identifiers and views of products.
+
+        """
+
+        filter_: dict[str, Any] = {"available": True}
+
+        if category_id is not None:
+            filter_["category_id"] = category_id
+
+        return await self._mongo_service.find(
+            collection=self._collection_name,
+            filter_=filter_,
+            projection={"views": ProjectionValuesEnum.INCLUDE},
+            sort=[("views", SortingValuesEnum.DESC), ("_id", SortingValuesEnum.DESC)],
+            limit=limit,
+            session=session,
+        )
+
+    async def get_views(
+        self,
+        ids: list[ObjectId],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> list[Mapping[str, Any]]:
+        """Retrieves views, category and availability of products.
+
+        Args:
+            ids (list[ObjectId]): The unique identifiers of products.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            list[Mapping[str, Any]]: Views, category and availability of products.
+
+        """
+        return await self._mongo_service.find(
+            collection=self._collection_name,
+            filter_={"_id": {"$in": ids}},
+            projection={
+                "views": ProjectionValuesEnum.INCLUDE,
+                "category_id": ProjectionValuesEnum.INCLUDE,
+                "available": ProjectionValuesEnum.INCLUDE,
+            },
             session=session,
         )
@@ -167,7 +167,7 @@ class ThreadRepository(BaseRepository):
         data: ThreadData,
         *,
         session: AsyncIOMotorClientSession | None = None,
-    ) -> Any:
+    ) -> Thread:
         """Creates a new thread in repository.
 
         Args:
@@ -176,11 +176,11 @@ class ThreadRepository(BaseRepository):
             if operation is transactional. Defaults to None.
 
         Returns:
-            Any: The ID of created thread.
+            Thread: Created thread.
 
         """
-        return await self._mongo_service.insert_one(
-            collection=self._collection_name,
+
+        thread = await self._create(
             document={
                 "name": data.name,
                 "body": data.body,
@@ -190,6 +190,8 @@ class ThreadRepository(BaseRepository):
             session=session,
         )
 
+        return Thread(**thread)
+
     async def update_by_id(
         self,
         id_: ObjectId,
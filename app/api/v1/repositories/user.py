@@ -1,6 +1,7 @@
 """Module that contains user repository class."""
 
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import aclosing
 from typing import Any
 
 import arrow
@@ -54,6 +55,83 @@ class UserRepository(BaseRepository):
             session=session,
         )
 
+    async def iter_get(
+        self,
+        *,
+        filter_: UserFilter | None = None,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        batch_size: int | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        """Iterates over a list of users based on parameters.
+
+        Args:
+            filter_ (UserFilter | None): Parameters for list filtering.
+            Defaults to None.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            batch_size (int | None): The number of users fetched per round trip.
+            Defaults to None.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Yields:
+            Mapping[str, Any]: The retrieved user.
+
+        """
+
+        # Driver cursor is closed even if consumer stops early
+        async with aclosing(
+            self._iter_get(
+                filter_=await self._get_list_query_filter(
+                    filter_=filter_, search=search
+                ),
+                search=search,
+                sorting=sorting,
+                batch_size=batch_size,
+                session=session,
+            )
+        ) as documents:
+            async for document in documents:
+                yield document
+
+    async def get_and_count(
+        self,
+        *,
+        filter_: UserFilter | None = None,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        **kwargs: Any,
+    ) -> Mapping[str, Any]:
+        """Retrieves a list of users and their total count based on parameters.
+
+        Args:
+            filter_ (UserFilter | None): Parameters for list filtering.
+            Defaults to None.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of users and their total count.
+
+        """
+        return await self._get_and_count(
+            filter_=await self._get_list_query_filter(filter_=filter_, search=search),
+            search=search,
+            sorting=sorting,
+            pagination=pagination,
+            session=session,
+        )
+
     async def _get_list_query_filter(
         self, filter_: UserFilter | None, search: Search | None
     ) -> Mapping[str, Any] | None:
@@ -165,7 +165,7 @@ class VoteRepository(BaseRepository):
         data: VoteCreateData,
         *,
         session: AsyncIOMotorClientSession | None = None,
-    ) -> Any:
+    ) -> Vote:
         """Creates a new vote in repository.
 
         Args:
@@ -174,13 +174,15 @@ class VoteRepository(BaseRepository):
             if operation is transactional. Defaults to None.
 
         Returns:
-            Any: The ID of created vote.
+            Vote: Created vote.
+
+        Raises:
+            EntityDuplicateKeyError: In case user has already voted for the comment.
 
         """
 
         try:
-            return await self._mongo_service.insert_one(
-                collection=self._collection_name,
+            vote = await self._create(
                 document={
                     "value": data.value,
                     "comment_id": data.comment_id,
@@ -194,6 +196,8 @@ class VoteRepository(BaseRepository):
         except DuplicateKeyError:
             raise EntityDuplicateKeyError
 
+        return Vote(**vote)
+
     async def update_by_id(
         self,
         id_: ObjectId,
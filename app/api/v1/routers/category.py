@@ -43,10 +43,7 @@ async def get_categories(
         dict[str, Any]: List of categories.
 
     """
-    return dict(
-        data=await category_service.get(filter_=filter_),
-        total=await category_service.count(filter_=filter_),
-    )
+    return dict(await category_service.get_and_count(filter_=filter_))
 
 
 @router.get(
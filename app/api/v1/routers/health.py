@@ -1,9 +1,17 @@
 """Module that contains health domain router."""
 
-from fastapi import APIRouter, Security, status
+from typing import Any
 
+from fastapi import APIRouter, Depends, Security, status
+
+from app.api.v1.buffers.product import ProductViewsBuffer
 from app.api.v1.constants import ScopesEnum
 from app.api.v1.dependencies.auth import StrictAuthorizationDependency
+from app.api.v1.models.health import Metrics
+from app.services.mongo.service import MongoDBService
+from app.services.redis.cache import TwoTierCache
+from app.utils.jwt import JWT
+from app.utils.password import Password
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -21,3 +29,33 @@ router = APIRouter(prefix="/health", tags=["health"])
 async def get_health() -> dict[str, str]:
     """API which checks the health of the application."""
     return {"status": "healthy"}
+
+
+@router.get(
+    "/metrics/",
+    response_model=Metrics,
+    status_code=status.HTTP_200_OK,
+    dependencies=[
+        Security(
+            StrictAuthorizationDependency(), scopes=[ScopesEnum.HEALTH_GET_METRICS.name]
+        )
+    ],
+)
+async def get_metrics(mongo_service: MongoDBService = Depends()) -> dict[str, Any]:
+    """API which returns metrics of the application worker.
+
+    Args:
+        mongo_service (MongoDBService): MongoDB service.
+
+    Returns:
+        Metrics: Metrics object.
+
+    """
+    return dict(
+        mongo_connection_pools=mongo_service.get_pool_statistics(),
+        mongo_commands=mongo_service.get_command_statistics(),
+        password_hashing=Password.get_statistics(),
+        jwt_cache=JWT.get_cache_statistics(),
+        local_cache=TwoTierCache.get_statistics(),
+        product_views=ProductViewsBuffer.get_statistics(),
+    )
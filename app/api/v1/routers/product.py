@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Security, status
+from fastapi import APIRouter, Depends, HTTPException, Security, status
 
 from app.api.v1.constants import ScopesEnum
 from app.api.v1.dependencies.auth import (
@@ -22,6 +22,8 @@ from app.api.v1.models.product import (
     ProductList,
 )
 from app.api.v1.services.product import ProductService
+from app.constants import HTTPErrorMessagesEnum
+from app.exceptions import InvalidCursorError
 
 router = APIRouter(prefix="/products", tags=["products"])
 
@@ -85,11 +87,22 @@ async def get_products(
         ProductList: List of products object.
 
     """
-    return dict(
-        data=await product_service.get(
+    try:
+        products = await product_service.get_and_count(
             filter_=filter_, search=search, sorting=sorting, pagination=pagination
+        )
+
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=HTTPErrorMessagesEnum.INVALID_PAGINATION_CURSOR,
+        )
+
+    return dict(
+        **products,
+        next_cursor=product_service.get_next_cursor(
+            products["data"], search=search, sorting=sorting, pagination=pagination
         ),
-        total=await product_service.count(filter_=filter_, search=search),
     )
 
 
@@ -1,6 +1,8 @@
 """Module that contains thread domain routers."""
 
-from fastapi import APIRouter, Depends, Security, status
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
 
 from app.api.v1.constants import ScopesEnum
 from app.api.v1.dependencies.auth import (
@@ -8,11 +10,20 @@ from app.api.v1.dependencies.auth import (
     StrictAuthorizationDependency,
 )
 from app.api.v1.dependencies.thread import ThreadByIdGetDependency
+from app.api.v1.models import Pagination
+from app.api.v1.models.comment import (
+    CommentFilter,
+    CommentTreeFilter,
+    CommentTreeList,
+)
 from app.api.v1.models.thread import (
     Thread,
     ThreadData,
 )
+from app.api.v1.services.comment import CommentService
 from app.api.v1.services.thread import ThreadService
+from app.constants import HTTPErrorMessagesEnum
+from app.exceptions import InvalidCursorError
 
 router = APIRouter(prefix="/threads", tags=["threads"])
 
@@ -41,6 +52,56 @@ async def get_thread(thread: Thread = Depends(ThreadByIdGetDependency())) -> Thr
     return thread
 
 
+@router.get(
+    "/{thread_id}/comments/",
+    response_model=CommentTreeList,
+    status_code=status.HTTP_200_OK,
+    dependencies=[
+        Security(
+            OptionalAuthorizationDependency(),
+            scopes=[ScopesEnum.COMMENTS_GET_COMMENT.name],
+        )
+    ],
+)
+async def get_thread_comments(
+    filter_: Annotated[CommentTreeFilter, Query()],
+    pagination: Pagination = Depends(),
+    thread: Thread = Depends(ThreadByIdGetDependency()),
+    comment_service: CommentService = Depends(),
+) -> dict[str, Any]:
+    """API which returns tree of thread comments paginated by top-level comments.
+
+    Args:
+        filter_ (CommentTreeFilter): Parameters for tree filtering.
+        pagination (Pagination): Parameters for pagination.
+        thread (Thread): Thread object.
+        comment_service (CommentService): Comment service.
+
+    Returns:
+        dict[str, Any]: List of comment trees.
+
+    """
+    try:
+        comments = await comment_service.get_tree(
+            filter_=CommentFilter(thread_id=thread.id),
+            tree_filter=filter_,
+            pagination=pagination,
+        )
+
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=HTTPErrorMessagesEnum.INVALID_PAGINATION_CURSOR,
+        )
+
+    return dict(
+        **comments,
+        next_cursor=comment_service.get_next_cursor(
+            comments["data"], tree_filter=filter_, pagination=pagination
+        ),
+    )
+
+
 @router.post(
     "/",
     response_model=Thread,
@@ -35,7 +35,11 @@ from app.api.v1.models.user import (
 )
 from app.api.v1.services.user import UserService
 from app.constants import HTTPErrorMessagesEnum
-from app.exceptions import EntityDuplicateKeyError, InvalidVerificationTokenError
+from app.exceptions import (
+    EntityDuplicateKeyError,
+    InvalidCursorError,
+    InvalidVerificationTokenError,
+)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -45,17 +49,19 @@ async def get_user_me(
     current_user: CurrentUser = Security(
         StrictAuthorizationDependency(), scopes=[ScopesEnum.USERS_GET_ME.name]
     ),
+    user_service: UserService = Depends(),
 ) -> User:
     """API which returns current user object.
 
     Args:
         current_user (CurrentUser): Current authorized user with permitted scopes.
+        user_service (UserService): User service.
 
     Returns:
         User: Current user object.
 
     """
-    return current_user.object
+    return await user_service.get_by_id(id_=current_user.object.id)
 
 
 @router.get(
@@ -88,11 +94,22 @@ async def get_users(
         UserList: List of users object.
 
     """
-    return dict(
-        data=await user_service.get(
+    try:
+        users = await user_service.get_and_count(
             filter_=filter_, search=search, sorting=sorting, pagination=pagination
+        )
+
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=HTTPErrorMessagesEnum.INVALID_PAGINATION_CURSOR,
+        )
+
+    return dict(
+        **users,
+        next_cursor=user_service.get_next_cursor(
+            users["data"], search=search, sorting=sorting, pagination=pagination
         ),
-        total=await user_service.count(filter_=filter_, search=search),
     )
 
 
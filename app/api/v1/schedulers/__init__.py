@@ -0,0 +1,10 @@
+"""Contains domain scheduler classes.
+
+Scheduler rules:
+
+- Defer expensive recalculations of one entity and run them in background.
+- Recommended name format: {Entity}{Field}Scheduler.
+- Are not aware of HTTP requests.
+- Scheduled work is shared by workers through Redis, so it is run once.
+
+"""
@@ -0,0 +1,274 @@
+"""Module that contains category scheduler classes."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+import arrow
+from bson import ObjectId
+from fastapi import Depends
+from injector import inject
+from redis.exceptions import RedisError
+
+from app.api.v1.repositories.category import CategoryRepository
+from app.api.v1.repositories.category_parameter_values import (
+    CategoryParameterValuesRepository,
+)
+from app.api.v1.repositories.category_parameters import CategoryParametersRepository
+from app.services.mongo.transaction_manager import TransactionManager
+from app.services.redis.constants import RedisNamesEnum
+from app.services.redis.service import RedisService
+from app.settings import SETTINGS
+
+
+@inject
+class CategoryParametersScheduler:
+    """Scheduler of recalculation of category parameters.
+
+    Categories are marked dirty in Redis sorted set with the time they are due
+    to be recalculated. Repeated requests don't move the time, so any count of
+    requests within the delay window is collapsed into one recalculation. Every
+    worker polls due categories, the one which takes the category lock and
+    removes the mark runs the recalculation.
+
+    Time of the last recalculation is kept per category, so product writes made
+    before it are not counted twice. All counted categories are recalculated
+    once per repair interval too.
+
+    """
+
+    # Number of seconds the recalculation of one category can take
+    _LOCK_TIMEOUT = 60
+
+    # Number of seconds clocks of workers can differ by
+    _CLOCK_SKEW = 5
+
+    def __init__(
+        self,
+        transaction_manager: TransactionManager = Depends(),
+        redis_service: RedisService = Depends(),
+        category_repository: CategoryRepository = Depends(),
+        category_parameters_repository: CategoryParametersRepository = Depends(),
+        category_parameter_values_repository: CategoryParameterValuesRepository = (
+            Depends()
+        ),
+    ) -> None:
+        """Initializes category parameters scheduler.
+
+        Args:
+            transaction_manager (TransactionManager): Transaction manager.
+            redis_service (RedisService): Redis service.
+            category_repository (CategoryRepository): An instance of the category
+            repository.
+            category_parameters_repository (CategoryParametersRepository): An instance
+            of the category-parameters repository.
+            category_parameter_values_repository (CategoryParameterValuesRepository):
+            An instance of the category parameter values repository.
+
+        """
+
+        self.transaction_manager = transaction_manager
+        self.redis_service = redis_service
+        self.category_repository = category_repository
+        self.category_parameters_repository = category_parameters_repository
+        self.category_parameter_values_repository = category_parameter_values_repository
+
+    async def schedule(self, category_id: ObjectId) -> None:
+        """Marks category parameters to be recalculated after the delay.
+
+        Args:
+            category_id (ObjectId): The unique identifier of the category.
+
+        """
+        await self.redis_service.zadd_nx(
+            name=RedisNamesEnum.DIRTY_CATEGORY_PARAMETERS,
+            mapping={
+                str(category_id): time.time()
+                + SETTINGS.CATEGORY_PARAMETERS_RECALCULATION_DELAY
+            },
+        )
+
+    async def is_recalculated_after(
+        self, category_id: ObjectId, written_at: datetime
+    ) -> bool:
+        """Checks if the category could be recalculated after the product write.
+
+        Such write could be counted by the recalculation already, so its changes
+        must not be applied on top of it.
+
+        Args:
+            category_id (ObjectId): The unique identifier of the category.
+            written_at (datetime): Time of the product write.
+
+        Returns:
+            bool: True if the write could be counted by the recalculation else False.
+
+        """
+
+        calculated_at = await self.redis_service.hget(
+            name=RedisNamesEnum.CATEGORY_PARAMETERS_CALCULATED_AT, key=str(category_id)
+        )
+
+        return (
+            calculated_at is not None
+            and arrow.get(written_at).timestamp()
+            <= float(calculated_at) + self._CLOCK_SKEW
+        )
+
+    async def recalculate(self, *, force: bool = False) -> None:
+        """Recalculates parameters of dirty categories which are due.
+
+        Args:
+            force (bool): Recalculates all dirty categories, even if their delay
+            is not over. Defaults to False.
+
+        """
+
+        category_ids = await self.redis_service.zrangebyscore(
+            name=RedisNamesEnum.DIRTY_CATEGORY_PARAMETERS,
+            max_=None if force else time.time(),
+        )
+
+        for category_id in category_ids:
+            await self._recalculate_category(category_id=ObjectId(category_id))
+
+    async def _recalculate_category(self, category_id: ObjectId) -> None:
+        """Recalculates parameters of the category unless other worker does it.
+
+        Args:
+            category_id (ObjectId): The unique identifier of the category.
+
+        """
+
+        lock = self.redis_service.lock(
+            name=RedisNamesEnum.CATEGORY_PARAMETERS_LOCK.format(
+                category_id=category_id
+            ),
+            timeout=self._LOCK_TIMEOUT,
+        )
+
+        # Category stays dirty, it is picked up once the lock is released
+        if await lock.acquire() is False:
+            return
+
+        try:
+            # Mark is removed before recalculation, so requests which come during
+            # recalculation mark the category dirty again
+            if not await self.redis_service.zrem(
+                name=RedisNamesEnum.DIRTY_CATEGORY_PARAMETERS,
+                members=[str(category_id)],
+            ):
+                return
+
+            try:
+                await self.calculate_category_parameters(category_id=category_id)
+
+            except Exception as e:
+                logging.error(
+                    f"Parameters of category '{category_id}' can't be recalculated: {e}"
+                )
+
+                await self.schedule(category_id=category_id)
+
+        finally:
+            if await lock.owned():
+                await lock.release()
+
+    async def calculate_category_parameters(self, category_id: ObjectId) -> None:
+        """Recalculates list of parameters for specific product category.
+
+        Counts of values are calculated from all products of the category, it
+        repairs counts which are missing or out of sync.
+
+        Args:
+            category_id (ObjectId): The unique identifier of the category.
+
+        """
+
+        async with self.transaction_manager as session:
+            counts = await self.category_repository.calculate_category_parameters(
+                id_=category_id, session=session
+            )
+
+            await self.category_parameter_values_repository.replace(
+                category_id=category_id, counts=counts, session=session
+            )
+
+            category = await self.category_repository.get_by_id(
+                id_=category_id, session=session
+            )
+
+            category_parameters = (
+                await self.category_parameter_values_repository.get_values(
+                    category_id=category_id,
+                    parameters=[
+                        parameter.machine_name for parameter in category.parameters
+                    ],
+                    session=session,
+                )
+            )
+
+            await self.category_parameters_repository.update_by_id(
+                id_=category_id,
+                data=category_parameters,
+                upsert=True,
+                session=session,
+            )
+
+        # Set once committed, all writes made earlier are counted
+        await self.redis_service.hset(
+            name=RedisNamesEnum.CATEGORY_PARAMETERS_CALCULATED_AT,
+            key=str(category_id),
+            value=str(arrow.utcnow().timestamp()),
+        )
+
+    async def repair(self) -> None:
+        """Schedules recalculation of all categories which values are counted."""
+
+        category_ids = (
+            await self.category_parameter_values_repository.get_category_ids()
+        )
+
+        for category_id in category_ids:
+            await self.schedule(category_id=category_id)
+
+    async def _repair_once_per_interval(self) -> None:
+        """Repairs counts of values unless other worker did it within interval."""
+
+        # Lock is not released, so it expires once the interval is over
+        lock = self.redis_service.lock(
+            name=RedisNamesEnum.CATEGORY_PARAMETERS_REPAIR_LOCK,
+            timeout=SETTINGS.CATEGORY_PARAMETERS_REPAIR_INTERVAL,
+        )
+
+        if await lock.acquire(blocking=False) is False:
+            return
+
+        try:
+            await self.repair()
+
+        except Exception as e:
+            logging.error(f"Category parameters can't be repaired: {e}")
+
+    async def run(self) -> None:
+        """Recalculates due categories by interval, runs till cancelled."""
+
+        while True:
+            await asyncio.sleep(SETTINGS.CATEGORY_PARAMETERS_RECALCULATION_INTERVAL)
+
+            try:
+                await self._repair_once_per_interval()
+
+                await self.recalculate()
+
+            except RedisError as e:
+                logging.error(f"Dirty category parameters can't be read: {e}")
+
+    async def clear(self) -> None:
+        """Drops marks of all dirty categories and times of recalculations."""
+
+        await self.redis_service.unlink(name=RedisNamesEnum.DIRTY_CATEGORY_PARAMETERS)
+        await self.redis_service.unlink(
+            name=RedisNamesEnum.CATEGORY_PARAMETERS_CALCULATED_AT
+        )
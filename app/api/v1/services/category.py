@@ -1,10 +1,12 @@
 """Module that contains category service class."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from bson import ObjectId
 from fastapi import BackgroundTasks, Depends
 
+from app.api.v1.caches.category import CategoryCache, CategoryTree
 from app.api.v1.models.category import Category, CategoryFilter, CategoryParameters
 from app.api.v1.repositories.category import CategoryRepository
 from app.api.v1.repositories.category_parameters import CategoryParametersRepository
@@ -17,13 +19,14 @@ from app.services.redis.service import RedisService
 class CategoryService(BaseService):
     """Category service for encapsulating business logic."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         background_tasks: BackgroundTasks,
         redis_service: RedisService = Depends(),
         transaction_manager: TransactionManager = Depends(),
         repository: CategoryRepository = Depends(),
         category_parameters_repository: CategoryParametersRepository = Depends(),
+        cache: CategoryCache = Depends(),
     ) -> None:
         """Initializes the category service.
 
@@ -34,6 +37,7 @@ class CategoryService(BaseService):
             repository (CategoryRepository): An instance of the Category repository.
             category_parameters_repository (CategoryParametersRepository): An instance
             of the category-parameters repository.
+            cache (CategoryCache): Category cache.
 
         """
 
@@ -47,6 +51,8 @@ class CategoryService(BaseService):
 
         self.category_parameters_repository = category_parameters_repository
 
+        self.cache = cache
+
     async def get(
         self,
         *,
@@ -66,6 +72,22 @@ class CategoryService(BaseService):
         """
         return await self.repository.get(filter_=filter_)
 
+    async def get_and_count(
+        self, *, filter_: CategoryFilter | None = None, **kwargs: Any
+    ) -> Mapping[str, Any]:
+        """Retrieves a list of categories and their total count based on parameters.
+
+        Args:
+            filter_ (CategoryFilter | None): Parameters for list filtering.
+            Defaults to None.
+            kwargs (Any): Keyword parameters.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of categories and their total count.
+
+        """
+        return await self.repository.get_and_count(filter_=filter_)
+
     async def count(
         self, *, filter_: CategoryFilter | None = None, **kwargs: Any
     ) -> int:
@@ -82,6 +104,19 @@ class CategoryService(BaseService):
         """
         return await self.repository.count(filter_=filter_)
 
+    async def get_tree(self, category_id: ObjectId | None = None) -> CategoryTree:
+        """Retrieves the category tree index.
+
+        Args:
+            category_id (ObjectId | None): The unique identifier of the existing
+            category which must be in the tree. Defaults to None.
+
+        Returns:
+            CategoryTree: Category tree index.
+
+        """
+        return await self.repository.get_tree(category_id=category_id)
+
     async def get_by_id(self, id_: ObjectId) -> Category:
         """Retrieves a category by its unique identifier.
 
@@ -92,7 +127,15 @@ class CategoryService(BaseService):
             Category: The retrieved category.
 
         """
-        return await self.repository.get_by_id(id_=id_)
+
+        async def load_category() -> dict[str, Any]:
+            category = await self.repository.get_by_id(id_=id_)
+
+            return category.model_dump()
+
+        category = await self.cache.get_or_load(id_=id_, loader=load_category)
+
+        return Category(**category)
 
     async def create(self, data: Any) -> Any:
         """Creates a new category.
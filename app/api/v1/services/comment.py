@@ -1,13 +1,23 @@
 """Module that contains comment service class."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from bson import ObjectId
 from fastapi import BackgroundTasks, Depends
 
-from app.api.v1.models.comment import Comment, CommentCreateData, CommentUpdateData
+from app.api.v1.constants import CommentRankingEnum
+from app.api.v1.models import Pagination, Sorting
+from app.api.v1.models.comment import (
+    Comment,
+    CommentCreateData,
+    CommentFilter,
+    CommentTreeFilter,
+    CommentUpdateData,
+)
 from app.api.v1.repositories.comment import CommentRepository
 from app.api.v1.services import BaseService
+from app.services.mongo.constants import SortingTypesEnum
 from app.services.mongo.transaction_manager import TransactionManager
 from app.services.redis.service import RedisService
 
@@ -15,6 +25,9 @@ from app.services.redis.service import RedisService
 class CommentService(BaseService):
     """Comment service for encapsulating business logic."""
 
+    # Count of replies which are returned with one page of comments
+    _MAX_REPLIES = 500
+
     def __init__(
         self,
         background_tasks: BackgroundTasks,
@@ -40,35 +53,213 @@ class CommentService(BaseService):
 
         self.repository = repository
 
-    async def get(self, **kwargs: Any) -> Any:
-        """Retrieves a list of comments based on parameters.
+    async def get(
+        self,
+        *,
+        filter_: CommentFilter | None = None,
+        pagination: Pagination | None = None,
+        **kwargs: Any,
+    ) -> list[Mapping[str, Any]]:
+        """Retrieves a list of top-level comments based on parameters.
 
         Args:
-            kwargs (Any): Keyword parameters.
+            filter_ (CommentFilter | None): Parameters for list filtering.
+            Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+            kwargs (Any): Keyword arguments.
 
         Returns:
-            list[Mapping[str, Any]]: The retrieved list of comments.
+            list[Mapping[str, Any]]: The retrieved list of top-level comments.
+
+        """
+        return await self.repository.get(filter_=filter_, pagination=pagination)
+
+    async def get_tree(
+        self,
+        *,
+        filter_: CommentFilter,
+        tree_filter: CommentTreeFilter,
+        pagination: Pagination | None = None,
+    ) -> Mapping[str, Any]:
+        """Retrieves a page of top-level comments with their replies.
+
+        Args:
+            filter_ (CommentFilter): Parameters for list filtering.
+            tree_filter (CommentTreeFilter): Parameters for tree filtering.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of comment trees and total count
+            of top-level comments.
 
         Raises:
-            NotImplementedError: This method is not implemented.
+            InvalidCursorError: In case pagination cursor is invalid.
 
         """
-        raise NotImplementedError
 
-    async def count(self, **kwargs: Any) -> int:
-        """Counts comments based on parameters.
+        comments = await self.repository.get_and_count(
+            filter_=filter_,
+            sorting=self._get_ranking_sorting(ranking=tree_filter.ranking),
+            pagination=pagination,
+        )
+
+        # One more reply is fetched to find out if replies are truncated
+        replies = await self.repository.get_replies(
+            thread_id=filter_.thread_id,
+            paths=[comment["path"] for comment in comments["data"]],
+            depth=tree_filter.depth,
+            limit=self._MAX_REPLIES + 1,
+        )
+
+        # Replies go before the first omitted one by paths
+        omitted_path = (
+            replies.pop()["path"] if len(replies) > self._MAX_REPLIES else None
+        )
+
+        nodes: dict[str, dict[str, Any]] = {}
+
+        data = []
+
+        for comment in comments["data"]:
+            nodes[comment["path"]] = self._get_node(
+                comment=comment, omitted_path=omitted_path
+            )
+
+            data.append(nodes[comment["path"]])
+
+        # Replies are sorted by paths, so parents are always placed before them
+        for reply in replies:
+            nodes[reply["path"]] = self._get_node(
+                comment=reply, omitted_path=omitted_path
+            )
+
+            parent = nodes.get(reply["path"].rsplit("/", 1)[0])
+
+            if parent is not None:
+                parent["replies"].append(nodes[reply["path"]])
+
+        ranking = tree_filter.ranking
+
+        # Replies are ranked among their siblings, there are a few of them
+        if ranking is not None:
+            for node in nodes.values():
+                node["replies"].sort(
+                    key=lambda reply: self._get_rank(comment=reply, ranking=ranking),
+                    reverse=True,
+                )
+
+        return {"data": data, "total": comments["total"]}
+
+    @staticmethod
+    def _get_node(
+        comment: Mapping[str, Any], omitted_path: str | None
+    ) -> dict[str, Any]:
+        """Returns a node of comments tree.
 
         Args:
-            kwargs (Any): Keyword parameters.
+            comment (Mapping[str, Any]): Comment document.
+            omitted_path (str | None): Path of the first omitted reply or None if
+            replies are not truncated.
 
         Returns:
-            int: Count of comments.
+            dict[str, Any]: Comment with its replies to be filled.
 
-        Raises:
-            NotImplementedError: This method is not implemented.
+        """
+        return {
+            **comment,
+            "replies": [],
+            # Replies of the comment are between its path followed by "/" and "0",
+            # all of them are returned if they go before the omitted one
+            "has_more_replies": omitted_path is not None
+            and omitted_path < f"{comment['path']}0",
+        }
+
+    @staticmethod
+    def _get_ranking_sorting(ranking: CommentRankingEnum | None) -> Sorting | None:
+        """Returns sorting of top-level comments by ranking.
+
+        Args:
+            ranking (CommentRankingEnum | None): Comment ranking.
+
+        Returns:
+            Sorting | None: Sorting or None, in case of order of creation.
 
         """
-        raise NotImplementedError
+
+        if ranking is None:
+            return None
+
+        return Sorting(
+            sort_by="_id" if ranking == CommentRankingEnum.NEW else f"scores.{ranking}",
+            sort_order=SortingTypesEnum.DESC,
+        )
+
+    @staticmethod
+    def _get_rank(
+        comment: Mapping[str, Any], ranking: CommentRankingEnum
+    ) -> tuple[float, ObjectId]:
+        """Returns rank of the comment, higher ranks go first.
+
+        Args:
+            comment (Mapping[str, Any]): Comment document.
+            ranking (CommentRankingEnum): Comment ranking.
+
+        Returns:
+            tuple[float, ObjectId]: Score and the unique identifier of the comment.
+
+        """
+
+        score = (
+            0.0
+            if ranking == CommentRankingEnum.NEW
+            else comment.get("scores", {}).get(ranking, 0.0)
+        )
+
+        return score, comment["_id"]
+
+    def get_next_cursor(
+        self,
+        comments: list[Mapping[str, Any]],
+        *,
+        tree_filter: CommentTreeFilter,
+        pagination: Pagination | None = None,
+    ) -> str | None:
+        """Returns a cursor which points to the next page of top-level comments.
+
+        Args:
+            comments (list[Mapping[str, Any]]): Top-level comments of the current
+            page.
+            tree_filter (CommentTreeFilter): Parameters for tree filtering.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+
+        Returns:
+            str | None: Next page cursor or None.
+
+        """
+        return self.repository.get_next_cursor(
+            documents=comments,
+            sorting=self._get_ranking_sorting(ranking=tree_filter.ranking),
+            pagination=pagination,
+        )
+
+    async def count(
+        self,
+        *,
+        filter_: CommentFilter | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Counts top-level comments based on parameters.
+
+        Args:
+            filter_ (CommentFilter | None): Parameters for list filtering.
+            Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Returns:
+            int: Count of top-level comments.
+
+        """
+        return await self.repository.count(filter_=filter_)
 
     async def get_by_id(self, id_: ObjectId) -> Comment:
         """Retrieves a comment by its unique identifier.
@@ -93,9 +284,7 @@ class CommentService(BaseService):
 
         """
 
-        id_ = await self.repository.create(data=data)
-
-        return await self.get_by_id(id_=id_)
+        return await self.repository.create(data=data)
 
     async def update(self, item: Any, data: Any) -> Any:
         """Updates a comment object.
@@ -3,13 +3,13 @@
 from collections.abc import Mapping
 from typing import Any
 
-from bson import ObjectId, json_util
+from bson import ObjectId
 from fastapi import BackgroundTasks, Depends
 
+from app.api.v1.caches.parameter import ParametersCache
 from app.api.v1.repositories.parameter import ParameterRepository
 from app.api.v1.services import BaseService
 from app.services.mongo.transaction_manager import TransactionManager
-from app.services.redis.constants import RedisNamesEnum, RedisNamesTTLEnum
 from app.services.redis.service import RedisService
 
 
@@ -22,6 +22,7 @@ class ParameterService(BaseService):
         redis_service: RedisService = Depends(),
         transaction_manager: TransactionManager = Depends(),
         repository: ParameterRepository = Depends(),
+        cache: ParametersCache = Depends(),
     ) -> None:
         """Initializes the parameter service.
 
@@ -30,6 +31,7 @@ class ParameterService(BaseService):
             redis_service (RedisService): Redis service.
             transaction_manager (TransactionManager): Transaction manager.
             repository (ParameterRepository): An instance of the Parameter repository.
+            cache (ParametersCache): Parameters cache.
 
         """
 
@@ -41,6 +43,8 @@ class ParameterService(BaseService):
 
         self.repository = repository
 
+        self.cache = cache
+
     async def get(self, **kwargs: Any) -> list[Mapping[str, Any]]:
         """Retrieves a list of parameters based on parameters.
 
@@ -52,22 +56,7 @@ class ParameterService(BaseService):
 
         """
 
-        cached_parameters = await self.redis_service.get(
-            name=RedisNamesEnum.PRODUCT_PARAMETERS_LIST
-        )
-
-        if cached_parameters is not None:
-            return json_util.loads(cached_parameters)  # type: ignore
-
-        parameters = await self.repository.get()
-
-        await self.redis_service.set(
-            name=RedisNamesEnum.PRODUCT_PARAMETERS_LIST,
-            value=json_util.dumps(parameters),
-            ttl=RedisNamesTTLEnum.PRODUCT_PARAMETERS_LIST.value,
-        )
-
-        return parameters
+        return await self.cache.get_or_load(loader=self.repository.get)
 
     async def count(self, **kwargs: Any) -> int:
         """Counts parameters based on parameters.
@@ -1,11 +1,16 @@
 """Module that contains product service class."""
 
+import logging
+from collections import Counter
 from collections.abc import Mapping
+from datetime import datetime
 from typing import Any
 
 from bson import ObjectId
 from fastapi import BackgroundTasks, Depends
 
+from app.api.v1.buffers.product import ProductViewsBuffer
+from app.api.v1.caches.product import ProductsLeaderboardCache
 from app.api.v1.models import Pagination, Search, Sorting
 from app.api.v1.models.product import (
     Product,
@@ -15,12 +20,17 @@ from app.api.v1.models.product import (
 )
 from app.api.v1.models.thread import ThreadData
 from app.api.v1.repositories.category import CategoryRepository
+from app.api.v1.repositories.category_parameter_values import (
+    CategoryParameterValuesRepository,
+)
 from app.api.v1.repositories.category_parameters import CategoryParametersRepository
 from app.api.v1.repositories.product import ProductRepository
 from app.api.v1.repositories.thread import ThreadRepository
+from app.api.v1.schedulers.category import CategoryParametersScheduler
 from app.api.v1.services import BaseService
 from app.services.mongo.transaction_manager import TransactionManager
 from app.services.redis.service import RedisService
+from app.settings import SETTINGS
 
 
 class ProductService(BaseService):
@@ -34,7 +44,13 @@ class ProductService(BaseService):
         repository: ProductRepository = Depends(),
         category_repository: CategoryRepository = Depends(),
         category_parameters_repository: CategoryParametersRepository = Depends(),
+        category_parameter_values_repository: CategoryParameterValuesRepository = (
+            Depends()
+        ),
         thread_repository: ThreadRepository = Depends(),
+        views_buffer: ProductViewsBuffer = Depends(),
+        leaderboard_cache: ProductsLeaderboardCache = Depends(),
+        category_parameters_scheduler: CategoryParametersScheduler = Depends(),
     ) -> None:
         """Initializes the product service.
 
@@ -47,7 +63,13 @@ class ProductService(BaseService):
             repository.
             category_parameters_repository (CategoryParametersRepository): An instance
             of the category-parameters repository.
+            category_parameter_values_repository (CategoryParameterValuesRepository):
+            An instance of the category parameter values repository.
             thread_repository (ThreadRepository): An instance of the thread repository.
+            views_buffer (ProductViewsBuffer): Buffer of product views.
+            leaderboard_cache (ProductsLeaderboardCache): Products leaderboard cache.
+            category_parameters_scheduler (CategoryParametersScheduler): Scheduler
+            of recalculation of category parameters.
 
         """
 
@@ -63,8 +85,16 @@ class ProductService(BaseService):
 
         self.category_parameters_repository = category_parameters_repository
 
+        self.category_parameter_values_repository = category_parameter_values_repository
+
         self.thread_repository = thread_repository
 
+        self.views_buffer = views_buffer
+
+        self.leaderboard_cache = leaderboard_cache
+
+        self.category_parameters_scheduler = category_parameters_scheduler
+
     async def get(
         self,
         *,
@@ -95,6 +125,156 @@ class ProductService(BaseService):
             pagination=pagination,
         )
 
+    async def get_and_count(
+        self,
+        *,
+        filter_: ProductFilter | None = None,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+        **kwargs: Any,
+    ) -> Mapping[str, Any]:
+        """Retrieves a list of products and their total count based on parameters.
+
+        Args:
+            filter_ (ProductFilter | None): Parameters for list filtering.
+            Defaults to None.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of products and their total count.
+
+        """
+
+        if self._is_top_products_query(
+            filter_=filter_, search=search, sorting=sorting, pagination=pagination
+        ):
+            return await self._get_top_and_count(
+                filter_=filter_,  # type: ignore[arg-type]
+                pagination=pagination,  # type: ignore[arg-type]
+            )
+
+        return await self.repository.get_and_count(
+            filter_=filter_,
+            search=search,
+            sorting=sorting,
+            pagination=pagination,
+        )
+
+    @staticmethod
+    def _is_top_products_query(
+        filter_: ProductFilter | None,
+        search: Search | None,
+        sorting: Sorting | None,
+        pagination: Pagination | None,
+    ) -> bool:
+        """Checks if the list query asks for a page of the most viewed products.
+
+        Args:
+            filter_ (ProductFilter | None): Parameters for list filtering.
+            search (Search | None): Parameters for list searching.
+            sorting (Sorting | None): Parameters for sorting.
+            pagination (Pagination | None): Parameters for pagination.
+
+        Returns:
+            bool: True if the page can be served from leaderboards else False.
+
+        """
+
+        # Leaderboards contain available products only
+        if filter_ is None or filter_.available is not True:
+            return False
+
+        if filter_.ids or filter_.parameters or filter_.category_ids is not None:
+            return False
+
+        if search is not None and search.search is not None:
+            return False
+
+        # Products are sorted by views by default
+        if sorting is not None and sorting.sort_by is not None:
+            return False
+
+        return (
+            pagination is not None
+            and pagination.after is None
+            and pagination.page * pagination.page_size
+            <= SETTINGS.PRODUCTS_LEADERBOARD_SIZE
+        )
+
+    async def _get_top_and_count(
+        self, filter_: ProductFilter, pagination: Pagination
+    ) -> Mapping[str, Any]:
+        """Retrieves a page of the most viewed products and their total count.
+
+        Identifiers of products are taken from the leaderboard, which is built once
+        on the first requests, and products are fetched by them in one query.
+
+        Args:
+            filter_ (ProductFilter): Parameters for list filtering.
+            pagination (Pagination): Parameters for pagination.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of products and their total count.
+
+        """
+
+        start = (pagination.page - 1) * pagination.page_size
+        end = start + pagination.page_size - 1
+
+        ids = await self.leaderboard_cache.get_or_build(
+            category_id=filter_.category_id,
+            start=start,
+            end=end,
+            loader=lambda: self.repository.get_most_viewed(
+                category_id=filter_.category_id,
+                limit=SETTINGS.PRODUCTS_LEADERBOARD_SIZE,
+            ),
+        )
+
+        products = (
+            await self.repository.get(
+                filter_=filter_.model_copy(update={"ids": ids}),
+            )
+            if ids
+            else []
+        )
+
+        # Products keep the order of the leaderboard
+        ranks = {id_: rank for rank, id_ in enumerate(ids)}
+
+        return {
+            "data": sorted(products, key=lambda product: ranks[product["_id"]]),
+            "total": await self.repository.count(filter_=filter_),
+        }
+
+    def get_next_cursor(
+        self,
+        products: list[Mapping[str, Any]],
+        *,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+    ) -> str | None:
+        """Returns a cursor which points to the next page of products.
+
+        Args:
+            products (list[Mapping[str, Any]]): Products of the current page.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+
+        Returns:
+            str | None: Next page cursor or None.
+
+        """
+        return self.repository.get_next_cursor(
+            documents=products, search=search, sorting=sorting, pagination=pagination
+        )
+
     async def count(
         self,
         *,
@@ -143,20 +323,25 @@ class ProductService(BaseService):
         """
 
         # Initialize product thread
-        thread_id = await self.thread_repository.create(
+        thread = await self.thread_repository.create(
             data=ThreadData(name=data.name, body=data.synopsis)
         )
 
-        id_ = await self.repository.create(
-            data=ProductCreateData(**data.model_dump(), thread_id=thread_id)
+        product = await self.repository.create(
+            data=ProductCreateData(**data.model_dump(), thread_id=thread.id)
         )
 
+        await self.leaderboard_cache.invalidate(category_ids=[data.category_id])
+
         self.background_tasks.add_task(
-            self.calculate_category_parameters,
+            self.update_category_parameters,
             category_id=data.category_id,
+            old_parameters=None,
+            new_parameters=data.parameters,
+            written_at=product.created_at,
         )
 
-        return await self.get_by_id(id_=id_)
+        return product
 
     async def update(self, item: Product, data: ProductData) -> Product:
         """Updates a product object.
@@ -170,18 +355,44 @@ class ProductService(BaseService):
 
         """
 
-        product = await self.repository.get_and_update_by_id(id_=item.id, data=data)
+        # Changes are calculated against the product right before this update
+        original, product = await self.repository.get_and_update_by_id(
+            id_=item.id, data=data
+        )
 
-        self.background_tasks.add_task(
-            self.calculate_category_parameters,
-            category_id=data.category_id,
+        # Product could be moved from other category or become not available
+        await self.leaderboard_cache.invalidate(
+            category_ids=list({original.category_id, data.category_id})
         )
 
-        # Recalculate parameters for "old" category, if category field is updated
-        if item.category_id != data.category_id:
+        # Updated product always has the time of update
+        written_at = product.updated_at or product.created_at
+
+        if original.category_id == data.category_id:
             self.background_tasks.add_task(
-                self.calculate_category_parameters,
-                category_id=item.category_id,
+                self.update_category_parameters,
+                category_id=data.category_id,
+                old_parameters=original.parameters,
+                new_parameters=data.parameters,
+                written_at=written_at,
+            )
+
+        # Product is moved, so it is removed from "old" category parameters
+        else:
+            self.background_tasks.add_task(
+                self.update_category_parameters,
+                category_id=original.category_id,
+                old_parameters=original.parameters,
+                new_parameters=None,
+                written_at=written_at,
+            )
+
+            self.background_tasks.add_task(
+                self.update_category_parameters,
+                category_id=data.category_id,
+                old_parameters=None,
+                new_parameters=data.parameters,
+                written_at=written_at,
             )
 
         return product
@@ -233,25 +444,124 @@ class ProductService(BaseService):
             id_ (ObjectId): The unique identifier of the product.
 
         """
-        self.background_tasks.add_task(self.repository.increment_views, id_=id_)
+        self.views_buffer.add(id_=id_)
 
-    async def calculate_category_parameters(self, category_id: ObjectId) -> None:
-        """Calculates and stores list of parameters for specific product category.
+    async def update_category_parameters(
+        self,
+        category_id: ObjectId,
+        old_parameters: Mapping[str, Any] | None,
+        new_parameters: Mapping[str, Any] | None,
+        written_at: datetime,
+    ) -> None:
+        """Updates list of parameters for specific product category by product change.
+
+        Counts of values are adjusted by the difference between old and new product
+        parameters, so only changed parameters are touched. Parameters of category
+        are scheduled to be recalculated from all its products if values are not
+        counted yet or the last recalculation could count this change already, the
+        recalculation counts this change too.
+
+        Args:
+            category_id (ObjectId): The unique identifier of the category.
+            old_parameters (Mapping[str, Any] | None): Product parameters before
+            change, None if product is added to category.
+            new_parameters (Mapping[str, Any] | None): Product parameters after
+            change, None if product is removed from category.
+            written_at (datetime): Time of the product change.
+
+        """
+
+        try:
+            if await self.category_parameters_scheduler.is_recalculated_after(
+                category_id=category_id, written_at=written_at
+            ):
+                await self.category_parameters_scheduler.schedule(
+                    category_id=category_id
+                )
+
+                return
+
+            await self._increment_category_parameters(
+                category_id=category_id,
+                old_parameters=old_parameters,
+                new_parameters=new_parameters,
+            )
+
+        # Change is not applied, so counts are repaired by recalculation
+        except Exception as e:
+            logging.error(
+                f"Parameters of category '{category_id}' can't be updated: {e}"
+            )
+
+            await self.category_parameters_scheduler.schedule(category_id=category_id)
+
+    async def _increment_category_parameters(
+        self,
+        category_id: ObjectId,
+        old_parameters: Mapping[str, Any] | None,
+        new_parameters: Mapping[str, Any] | None,
+    ) -> None:
+        """Adjusts counts of values of category parameters by product change.
 
         Args:
             category_id (ObjectId): The unique identifier of the category.
+            old_parameters (Mapping[str, Any] | None): Product parameters before
+            change, None if product is added to category.
+            new_parameters (Mapping[str, Any] | None): Product parameters after
+            change, None if product is removed from category.
 
         """
 
         async with self.transaction_manager as session:
+            if not await self.category_parameter_values_repository.exists(
+                category_id=category_id, session=session
+            ):
+                await self.category_parameters_scheduler.schedule(
+                    category_id=category_id
+                )
+
+                return
+
+            category = await self.category_repository.get_by_id(
+                id_=category_id, session=session
+            )
+
+            parameters = {parameter.machine_name for parameter in category.parameters}
+
+            increments: Counter[tuple[str, Any]] = Counter()
+
+            for product_parameters, increment in (
+                (old_parameters, -1),
+                (new_parameters, 1),
+            ):
+                for parameter, value in (product_parameters or {}).items():
+                    if parameter not in parameters:
+                        continue
+
+                    # Every element of list parameter is counted separately
+                    for element in value if isinstance(value, list) else [value]:
+                        increments[parameter, element] += increment
+
+            # Values which are kept by the product are not touched
+            changes = {key: count for key, count in increments.items() if count}
+
+            if not changes:
+                return
+
+            await self.category_parameter_values_repository.increment(
+                category_id=category_id, changes=changes, session=session
+            )
+
             category_parameters = (
-                await self.category_repository.calculate_category_parameters(
-                    id_=category_id, session=session
+                await self.category_parameter_values_repository.get_values(
+                    category_id=category_id,
+                    parameters=sorted({parameter for parameter, _ in changes}),
+                    session=session,
                 )
             )
 
             await self.category_parameters_repository.update_by_id(
-                id_=category_parameters["_id"],
+                id_=category_id,
                 data=category_parameters,
                 upsert=True,
                 session=session,
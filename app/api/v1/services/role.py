@@ -3,14 +3,14 @@
 from collections.abc import Mapping
 from typing import Any
 
-from bson import ObjectId, json_util
+from bson import ObjectId
 from fastapi import BackgroundTasks, Depends
 
+from app.api.v1.caches.role import RolesCache
 from app.api.v1.constants import RolesEnum
 from app.api.v1.repositories.role import RoleRepository
 from app.api.v1.services import BaseService
 from app.services.mongo.transaction_manager import TransactionManager
-from app.services.redis.constants import RedisNamesEnum, RedisNamesTTLEnum
 from app.services.redis.service import RedisService
 
 
@@ -23,6 +23,7 @@ class RoleService(BaseService):
         redis_service: RedisService = Depends(),
         transaction_manager: TransactionManager = Depends(),
         repository: RoleRepository = Depends(),
+        cache: RolesCache = Depends(),
     ) -> None:
         """Initializes the role service.
 
@@ -31,6 +32,7 @@ class RoleService(BaseService):
             redis_service (RedisService): Redis service.
             transaction_manager (TransactionManager): Transaction manager.
             repository (RoleRepository): An instance of the Role repository.
+            cache (RolesCache): Roles cache.
 
         """
 
@@ -42,6 +44,8 @@ class RoleService(BaseService):
 
         self.repository = repository
 
+        self.cache = cache
+
     async def get(self, **kwargs: Any) -> list[Mapping[str, Any]]:
         """Retrieves a list of roles based on parameters.
 
@@ -53,20 +57,7 @@ class RoleService(BaseService):
 
         """
 
-        cached_roles = await self.redis_service.get(name=RedisNamesEnum.ROLES_LIST)
-
-        if cached_roles is not None:
-            return json_util.loads(cached_roles)  # type: ignore
-
-        roles = await self.repository.get()
-
-        await self.redis_service.set(
-            name=RedisNamesEnum.ROLES_LIST,
-            value=json_util.dumps(roles),
-            ttl=RedisNamesTTLEnum.ROLES_LIST.value,
-        )
-
-        return roles
+        return await self.cache.get_or_load(loader=self.repository.get)
 
     async def count(self, **kwargs: Any) -> int:
         """Counts roles based on parameters.
@@ -79,10 +70,10 @@ class RoleService(BaseService):
 
         """
 
-        cached_roles = await self.redis_service.get(name=RedisNamesEnum.ROLES_LIST)
+        cached_roles = await self.cache.get()
 
         if cached_roles is not None:
-            return len(json_util.loads(cached_roles))
+            return len(cached_roles)
 
         return await self.repository.count()
 
@@ -93,9 +93,7 @@ class ThreadService(BaseService):
 
         """
 
-        id_ = await self.repository.create(data=data)
-
-        return await self.get_by_id(id_=id_)
+        return await self.repository.create(data=data)
 
     async def update(self, item: Any, data: Any) -> Any:
         """Updates a thread object.
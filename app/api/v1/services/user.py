@@ -6,9 +6,11 @@ from typing import Any
 from bson import ObjectId
 from fastapi import BackgroundTasks, Depends
 
+from app.api.v1.caches.user import AuthorizedUserCache
 from app.api.v1.models import Pagination, Search, Sorting
 from app.api.v1.models.cart import CartCreateData
 from app.api.v1.models.user import (
+    AuthorizedUser,
     BaseUserCreateData,
     BaseUserUpdateData,
     User,
@@ -30,7 +32,12 @@ from app.utils.token import VerificationToken
 
 
 class UserService(BaseService):
-    """User service for encapsulating business logic."""
+    """User service for encapsulating business logic.
+
+    Writes invalidate authorized user cache once they are committed, so
+    authorization doesn't see outdated users.
+
+    """
 
     def __init__(  # noqa: PLR0913
         self,
@@ -40,6 +47,7 @@ class UserService(BaseService):
         repository: UserRepository = Depends(),
         cart_repository: CartRepository = Depends(),
         send_grid_service: SendGridService = Depends(),
+        authorized_user_cache: AuthorizedUserCache = Depends(),
     ) -> None:
         """Initializes the UserService.
 
@@ -50,6 +58,7 @@ class UserService(BaseService):
             repository (UserRepository): An instance of the User repository.
             cart_repository (CartRepository): An instance of the cart repository.
             send_grid_service (SendGridService): SendGrid service.
+            authorized_user_cache (AuthorizedUserCache): Authorized user cache.
 
         """
 
@@ -65,6 +74,8 @@ class UserService(BaseService):
 
         self.send_grid_service = send_grid_service
 
+        self.authorized_user_cache = authorized_user_cache
+
     async def get(
         self,
         *,
@@ -95,6 +106,60 @@ class UserService(BaseService):
             pagination=pagination,
         )
 
+    async def get_and_count(
+        self,
+        *,
+        filter_: UserFilter | None = None,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+        **kwargs: Any,
+    ) -> Mapping[str, Any]:
+        """Retrieves a list of users and their total count based on parameters.
+
+        Args:
+            filter_ (UserFilter | None): Parameters for list filtering.
+            Defaults to None.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+            kwargs (Any): Keyword arguments.
+
+        Returns:
+            Mapping[str, Any]: The retrieved list of users and their total count.
+
+        """
+        return await self.repository.get_and_count(
+            filter_=filter_,
+            search=search,
+            sorting=sorting,
+            pagination=pagination,
+        )
+
+    def get_next_cursor(
+        self,
+        users: list[Mapping[str, Any]],
+        *,
+        search: Search | None = None,
+        sorting: Sorting | None = None,
+        pagination: Pagination | None = None,
+    ) -> str | None:
+        """Returns a cursor which points to the next page of users.
+
+        Args:
+            users (list[Mapping[str, Any]]): Users of the current page.
+            search (Search | None): Parameters for list searching. Defaults to None.
+            sorting (Sorting | None): Parameters for sorting. Defaults to None.
+            pagination (Pagination | None): Parameters for pagination. Defaults to None.
+
+        Returns:
+            str | None: Next page cursor or None.
+
+        """
+        return self.repository.get_next_cursor(
+            documents=users, search=search, sorting=sorting, pagination=pagination
+        )
+
     async def count(
         self,
         *,
@@ -127,6 +192,26 @@ class UserService(BaseService):
         """
         return await self.repository.get_by_id(id_=id_)
 
+    async def get_authorized_by_id(self, id_: ObjectId) -> AuthorizedUser:
+        """Retrieves a user on authorization, cached user is returned if any.
+
+        Args:
+            id_ (ObjectId): The unique identifier of the item.
+
+        Returns:
+            AuthorizedUser: Authorized user object.
+
+        """
+
+        user = await self.authorized_user_cache.get(id_=id_)
+
+        if user is None:
+            user = await self.repository.get_by_id(id_=id_)
+
+            await self.authorized_user_cache.set(user=user)
+
+        return user
+
     async def create(self, data: BaseUserCreateData) -> User:
         """Creates a new user.
 
@@ -138,7 +223,7 @@ class UserService(BaseService):
 
         """
 
-        password = Password.get_password_hash(password=data.password)
+        password = await Password.get_password_hash(password=data.password)
 
         id_ = await self.repository.create(
             data=UserCreateData(**data.model_dump(), hashed_password=password)
@@ -174,6 +259,8 @@ class UserService(BaseService):
             ),
         )
 
+        await self.authorized_user_cache.invalidate(id_=item.id)
+
         if emails_match is False:
             await self.request_verify_email(item=user)
 
@@ -204,10 +291,12 @@ class UserService(BaseService):
 
         """
 
-        password = Password.get_password_hash(password=password)
+        password = await Password.get_password_hash(password=password)
 
         await self.repository.update_password(id_=id_, hashed_password=password)
 
+        await self.authorized_user_cache.invalidate(id_=id_)
+
     async def delete_by_id(self, id_: ObjectId) -> None:
         """Softly deletes a user by its unique identifier.
 
@@ -218,6 +307,8 @@ class UserService(BaseService):
 
         await self.repository.delete_by_id(id_=id_)
 
+        await self.authorized_user_cache.invalidate(id_=id_)
+
     async def delete(self, item: Any) -> None:
         """Deletes a user.
 
@@ -284,6 +375,8 @@ class UserService(BaseService):
             name=RedisNamesEnum.RESET_PASSWORD.format(user_id=id_)
         )
 
+        # Token is kept on wrong attempts and till it is applied, so it can't be
+        # burnt by anyone who guesses a user identifier
         if cached_token is None or cached_token != hashed_token:
             raise InvalidVerificationTokenError
 
@@ -336,6 +429,8 @@ class UserService(BaseService):
             name=RedisNamesEnum.EMAIL_VERIFICATION.format(user_id=id_)
         )
 
+        # Token is kept on wrong attempts and till it is applied, so it can't be
+        # burnt by anyone who guesses a user identifier
         if cached_token is None or cached_token != hashed_token:
             raise InvalidVerificationTokenError
 
@@ -344,3 +439,5 @@ class UserService(BaseService):
         await self.redis_service.delete(
             name=RedisNamesEnum.EMAIL_VERIFICATION.format(user_id=id_)
         )
+
+        await self.authorized_user_cache.invalidate(id_=id_)
@@ -100,14 +100,14 @@ class VoteService(BaseService):
         """
 
         async with self.transaction_manager as session:
-            id_ = await self.repository.create(data=data, session=session)
+            vote = await self.repository.create(data=data, session=session)
 
             # increments upvote/downvote counter by one
             await self.comment_repository.add_vote(
                 id_=data.comment_id, value=data.value, session=session
             )
 
-        return await self.get_by_id(id_=id_)
+        return vote
 
     async def update(self, item: Any, data: Any) -> Any:
         """Updates a vote object.
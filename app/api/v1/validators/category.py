@@ -111,7 +111,9 @@ class CategoryLeafValidator(BaseCategoryValidator):
 
         category = await self.category_by_id_validator.validate(category_id=category_id)
 
-        if category.has_children is True:
+        tree = await self.category_service.get_tree(category_id=category.id)
+
+        if tree.is_leaf(id_=category.id) is False:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=HTTPErrorMessagesEnum.LEAF_PRODUCT_CATEGORY_REQUIRED,
@@ -1,6 +1,7 @@
 """Contains product domain validators."""
 
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, ClassVar
 
 from bson import ObjectId
 from fastapi import Depends, HTTPException, Request, status
@@ -8,6 +9,7 @@ from pydantic import BaseModel, ValidationError, create_model
 
 from app.api.v1.constants import ProductParameterTypesEnum
 from app.api.v1.models.product import Product
+from app.api.v1.services.category import CategoryService
 from app.api.v1.services.parameter import ParameterService
 from app.api.v1.services.product import ProductService
 from app.api.v1.validators import BaseValidator
@@ -229,8 +231,79 @@ class ProductAvailableFilterValidator(BaseProductValidator):
             )
 
 
+class ProductCategorySubtreeFilterValidator(BaseProductValidator):
+    """Product category subtree filter validator."""
+
+    def __init__(
+        self,
+        request: Request,
+        product_service: ProductService = Depends(),
+        category_service: CategoryService = Depends(),
+    ):
+        """Initializes product category subtree filter validator.
+
+        Args:
+            request (Request): Current request object.
+            product_service (ProductService): Product service.
+            category_service (CategoryService): Category service.
+
+        """
+
+        super().__init__(request=request, product_service=product_service)
+
+        self.category_service = category_service
+
+    async def validate(self, category_id: ObjectId | None) -> list[ObjectId] | None:
+        """Validates category subtree and expands it to the leaf categories.
+
+        Args:
+            category_id (ObjectId | None): BSON object identifier of the subtree
+            root category.
+
+        Returns:
+            list[ObjectId] | None: Identifiers of leaf categories of the subtree.
+
+        Raises:
+            HTTPException: If requested category is not found.
+
+        """
+
+        if category_id is None:
+            return None
+
+        tree = await self.category_service.get_tree()
+
+        if category_id not in tree:
+            # Category could be created after categories were cached
+            try:
+                await self.category_service.get_by_id(id_=category_id)
+
+            except EntityIsNotFoundError:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=HTTPErrorMessagesEnum.ENTITY_IS_NOT_FOUND.format(
+                        entity="Category"
+                    ),
+                )
+
+            tree = await self.category_service.get_tree(category_id=category_id)
+
+        # Subtree is empty if category is deleted meanwhile
+        return sorted(tree.get_subtree_ids(id_=category_id) & tree.leaf_ids)
+
+
 class ProductParametersFilterValidator(BaseProductValidator):
-    """Product parameters filter validator."""
+    """Product parameters filter validator.
+
+    Building of the filter model compiles its validation schema, so the model is
+    shared by requests and rebuilt only if the list of parameters is changed.
+
+    """
+
+    # Version of the parameters list and the filter model built for it
+    _parameters_model: ClassVar[
+        tuple[tuple[tuple[str, str], ...], type[BaseModel]] | None
+    ] = None
 
     def __init__(
         self,
@@ -251,14 +324,17 @@ class ProductParametersFilterValidator(BaseProductValidator):
 
         self.parameter_service = parameter_service
 
-    async def validate(self) -> dict[str, Any]:
-        """Validates product parameters filter.
+    @staticmethod
+    def build_parameters_model(
+        parameters: list[Mapping[str, Any]],
+    ) -> type[BaseModel]:
+        """Builds a product parameters filter model.
 
-        Returns:
-            dict[str, Any]: Product parameter filter.
+        Args:
+            parameters (list[Mapping[str, Any]]): List of parameters.
 
-        Raises:
-            HTTPException: If product parameter filter is invalid.
+        Returns:
+            type[BaseModel]: Product parameters filter model.
 
         """
 
@@ -269,11 +345,50 @@ class ProductParametersFilterValidator(BaseProductValidator):
                 else list[str],
                 None,
             )
-            for parameter in await self.parameter_service.get()
+            for parameter in parameters
         }
 
-        parameters_model = create_model(
-            "ProductParameterFilter", **fields, __base__=BaseModel
+        return create_model("ProductParameterFilter", **fields, __base__=BaseModel)
+
+    @classmethod
+    def get_parameters_model(
+        cls, parameters: list[Mapping[str, Any]]
+    ) -> type[BaseModel]:
+        """Returns a product parameters filter model built for the parameters.
+
+        Args:
+            parameters (list[Mapping[str, Any]]): List of parameters.
+
+        Returns:
+            type[BaseModel]: Product parameters filter model.
+
+        """
+
+        version = tuple(
+            (parameter["machine_name"], parameter["type"]) for parameter in parameters
+        )
+
+        if cls._parameters_model is None or cls._parameters_model[0] != version:
+            cls._parameters_model = (
+                version,
+                cls.build_parameters_model(parameters=parameters),
+            )
+
+        return cls._parameters_model[1]
+
+    async def validate(self) -> dict[str, Any]:
+        """Validates product parameters filter.
+
+        Returns:
+            dict[str, Any]: Product parameter filter.
+
+        Raises:
+            HTTPException: If product parameter filter is invalid.
+
+        """
+
+        parameters_model = self.get_parameters_model(
+            parameters=await self.parameter_service.get()
         )
 
         try:
@@ -6,7 +6,7 @@ from bson import ObjectId
 from fastapi import Depends, HTTPException, Request, status
 
 from app.api.v1.constants import RolesEnum
-from app.api.v1.models.user import CurrentUser, User
+from app.api.v1.models.user import AuthorizedUser, CurrentUser, User
 from app.api.v1.services.user import UserService
 from app.api.v1.validators import BaseValidator
 from app.constants import HTTPErrorMessagesEnum
@@ -81,14 +81,14 @@ class UserAuthenticationValidator(BaseUserValidator):
 class UserAuthorizationValidator(BaseUserValidator):
     """User authorization validator."""
 
-    async def validate(self, user_id: ObjectId) -> User:
+    async def validate(self, user_id: ObjectId) -> AuthorizedUser:
         """Validates user on authorization.
 
         Args:
             user_id (ObjectId): BSON object identifier of requested user.
 
         Returns:
-            User: User object.
+            AuthorizedUser: Authorized user object.
 
         Raises:
             HTTPException: If requested user is not found or deleted or
@@ -97,7 +97,7 @@ class UserAuthorizationValidator(BaseUserValidator):
         """
 
         try:
-            user = await self.user_service.get_by_id(id_=user_id)
+            user = await self.user_service.get_authorized_by_id(id_=user_id)
 
         except EntityIsNotFoundError:
             raise HTTPException(
@@ -295,7 +295,7 @@ class UserPasswordValidator(BaseUserValidator):
 
         """
 
-        if not Password.verify_password(password, user.hashed_password):
+        if not await Password.verify_password(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=HTTPErrorMessagesEnum.INCORRECT_CREDENTIALS,
@@ -322,9 +322,11 @@ class UserPasswordUpdateValidator(BaseUserValidator):
 
         current_user = self.request.state.current_user
 
-        if not Password.verify_password(
-            plain_password=old_password,
-            hashed_password=current_user.object.hashed_password,
+        # Authorized user object doesn't contain password hash
+        user = await self.user_service.get_by_id(id_=current_user.object.id)
+
+        if not await Password.verify_password(
+            plain_password=old_password, hashed_password=user.hashed_password
         ):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -1,5 +1,7 @@
 """Main module for running the FastAPI application."""
 
+import asyncio
+import contextlib
 from typing import Any
 
 import uvicorn
@@ -7,15 +9,34 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import ROUTERS
+from app.api.v1.buffers.product import ProductViewsBuffer
+from app.api.v1.caches.category import CategoryCache, CategoryTreeCache
+from app.api.v1.caches.product import ProductsLeaderboardCache
+from app.api.v1.repositories.category import CategoryRepository
+from app.api.v1.repositories.category_parameter_values import (
+    CategoryParameterValuesRepository,
+)
+from app.api.v1.repositories.category_parameters import CategoryParametersRepository
+from app.api.v1.repositories.product import ProductRepository
+from app.api.v1.schedulers.category import CategoryParametersScheduler
 from app.constants import AppEventsEnum
 from app.services import SERVICE_CLIENTS
+from app.services.mongo.client import MongoDBClient
 from app.services.mongo.service import MongoDBService
+from app.services.mongo.transaction_manager import TransactionManager
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.client import RedisClient
+from app.services.redis.service import RedisService
 from app.settings import SETTINGS
 
 
 class App(FastAPI):
     """Main application class for running the FastAPI app."""
 
+    _cache_invalidation_task: asyncio.Task[None] | None = None
+    _product_views_task: asyncio.Task[None] | None = None
+    _category_parameters_task: asyncio.Task[None] | None = None
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize the App class."""
 
@@ -50,15 +71,100 @@ class App(FastAPI):
         self.add_event_handler(AppEventsEnum.STARTUP, self._startup)
         self.add_event_handler(AppEventsEnum.SHUTDOWN, self._shutdown)
 
-    @staticmethod
-    async def _startup() -> None:
+    @classmethod
+    async def _startup(cls) -> None:
         """Executes on application startup."""
         # Runs Mongo migrations
         MongoDBService.run_migrations(upgrade=True)
 
+        redis_service = RedisService(redis_client=RedisClient())
+
+        # Listens for cache entries invalidated by other workers
+        cache = TwoTierCache(redis_service=redis_service)
+
+        cls._cache_invalidation_task = asyncio.create_task(cache.listen_invalidations())
+
+        # Flushes buffered product views by interval
+        cls._product_views_task = asyncio.create_task(
+            cls._get_product_views_buffer().run()
+        )
+
+        # Recalculates parameters of dirty categories by interval
+        cls._category_parameters_task = asyncio.create_task(
+            cls._get_category_parameters_scheduler().run()
+        )
+
+    @staticmethod
+    def _get_product_views_buffer() -> ProductViewsBuffer:
+        """Returns buffer of product views."""
+        redis_service = RedisService(redis_client=RedisClient())
+
+        return ProductViewsBuffer(
+            repository=ProductRepository(
+                mongo_service=MongoDBService(mongo_client=MongoDBClient())
+            ),
+            redis_service=redis_service,
+            leaderboard_cache=ProductsLeaderboardCache(
+                redis_service=redis_service,
+                cache=TwoTierCache(redis_service=redis_service),
+            ),
+        )
+
     @staticmethod
-    async def _shutdown() -> None:
+    def _get_category_parameters_scheduler() -> CategoryParametersScheduler:
+        """Returns scheduler of recalculation of category parameters."""
+        mongo_client = MongoDBClient()
+        mongo_service = MongoDBService(mongo_client=mongo_client)
+        redis_service = RedisService(redis_client=RedisClient())
+        cache = TwoTierCache(redis_service=redis_service)
+
+        return CategoryParametersScheduler(
+            transaction_manager=TransactionManager(mongo_client=mongo_client),
+            redis_service=redis_service,
+            category_repository=CategoryRepository(
+                mongo_service=mongo_service,
+                tree_cache=CategoryTreeCache(cache=cache),
+                cache=CategoryCache(redis_service=redis_service, cache=cache),
+            ),
+            category_parameters_repository=CategoryParametersRepository(
+                mongo_service=mongo_service
+            ),
+            category_parameter_values_repository=CategoryParameterValuesRepository(
+                mongo_service=mongo_service
+            ),
+        )
+
+    @classmethod
+    async def _shutdown(cls) -> None:
         """Executes on application shutdown."""
+        if cls._cache_invalidation_task is not None:
+            cls._cache_invalidation_task.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await cls._cache_invalidation_task
+
+            cls._cache_invalidation_task = None
+
+        if cls._product_views_task is not None:
+            cls._product_views_task.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await cls._product_views_task
+
+            cls._product_views_task = None
+
+            # Views counted since the last flush
+            await cls._get_product_views_buffer().flush()
+
+        # Dirty categories are left for other workers
+        if cls._category_parameters_task is not None:
+            cls._category_parameters_task.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await cls._category_parameters_task
+
+            cls._category_parameters_task = None
+
         # close clients of external services
         for client in SERVICE_CLIENTS:
             await client.close()
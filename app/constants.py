@@ -8,6 +8,9 @@ class AppConstantsEnum(IntEnum):
 
     PAGINATION_MAX_PAGE_SIZE = 100
 
+    COMMENTS_TREE_DEFAULT_DEPTH = 3
+    COMMENTS_TREE_MAX_DEPTH = 10
+
     BACKGROUND_TASK_RETRY_ATTEMPTS = 3
     BACKGROUND_TASK_RETRY_WAIT = 5
 
@@ -34,6 +37,8 @@ class HTTPErrorMessagesEnum(StrEnum):
     INVALID_RESET_PASSWORD_TOKEN = "Invalid or expired reset password token."
     INVALID_EMAIL_VERIFICATION_TOKEN = "Invalid or expired email verification token."
 
+    INVALID_PAGINATION_CURSOR = "Invalid pagination cursor."
+
     LEAF_PRODUCT_CATEGORY_REQUIRED = (
         "Invalid category. Operation is allowed only for 'leaf' categories."
     )
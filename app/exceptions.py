@@ -23,3 +23,11 @@ class EntityDuplicateKeyError(ApplicationError):
 
 class InvalidVerificationTokenError(ApplicationError):
     """Invalid verification token error."""
+
+
+class InvalidCursorError(ApplicationError):
+    """Invalid pagination cursor error."""
+
+
+class InvalidCachedValueError(ApplicationError):
+    """Cached value is encoded by other codec or can't be decoded."""
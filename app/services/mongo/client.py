@@ -3,16 +3,39 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from app.services.base import BaseClient
+from app.services.mongo.listeners import (
+    CommandStatisticsListener,
+    ConnectionPoolStatisticsListener,
+)
+from app.services.mongo.models import CommandStatistics, ConnectionPoolStatistics
 from app.settings import SETTINGS
 
 
 class MongoDBClient(BaseClient):
     """MongoDB client."""
 
+    _pool_listener = ConnectionPoolStatisticsListener()
+    _command_listener = CommandStatisticsListener()
+
     _client = AsyncIOMotorClient(
         f"mongodb://{SETTINGS.MONGODB_USER}:{SETTINGS.MONGODB_PASSWORD}"
         f"@{SETTINGS.MONGODB_HOST}:{SETTINGS.MONGODB_PORT}/"
-        f"?authMechanism=SCRAM-SHA-256&authSource={SETTINGS.MONGO_AUTH_SOURCE}"
+        f"?authMechanism=SCRAM-SHA-256&authSource={SETTINGS.MONGO_AUTH_SOURCE}",
+        maxPoolSize=SETTINGS.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=SETTINGS.MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=SETTINGS.MONGODB_MAX_IDLE_TIME_MS,
+        waitQueueTimeoutMS=SETTINGS.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        serverSelectionTimeoutMS=SETTINGS.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        connectTimeoutMS=SETTINGS.MONGODB_CONNECT_TIMEOUT_MS,
+        socketTimeoutMS=SETTINGS.MONGODB_SOCKET_TIMEOUT_MS,
+        compressors=[
+            compressor.strip()
+            for compressor in SETTINGS.MONGODB_COMPRESSORS.split(",")
+            if compressor.strip()
+        ],
+        event_listeners=[_pool_listener, _command_listener]
+        if SETTINGS.MONGODB_COMMAND_MONITORING is True
+        else [_pool_listener],
     )
 
     @property
@@ -20,6 +43,24 @@ class MongoDBClient(BaseClient):
         """Mongo client getter."""
         return self._client
 
+    def get_pool_statistics(self) -> list[ConnectionPoolStatistics]:
+        """Returns live statistics of the client connection pools.
+
+        Returns:
+            list[ConnectionPoolStatistics]: Pools statistics.
+
+        """
+        return self._pool_listener.get_statistics()
+
+    def get_command_statistics(self) -> list[CommandStatistics]:
+        """Returns latency statistics of the client commands.
+
+        Returns:
+            list[CommandStatistics]: Commands statistics.
+
+        """
+        return self._command_listener.get_statistics()
+
     @classmethod
     async def close(cls) -> None:
         """Closes MongoDB client."""
@@ -12,6 +12,7 @@ class MongoCollectionsEnum(StrEnum):
     PRODUCTS = auto()
     PARAMETERS = auto()
     CATEGORY_PARAMETERS = auto()
+    CATEGORY_PARAMETER_VALUES = auto()
     CARTS = auto()
     THREADS = auto()
     COMMENTS = auto()
@@ -37,3 +38,9 @@ class ProjectionValuesEnum(IntEnum):
 
     INCLUDE = 1
     EXCLUDE = 0
+
+
+class MongoDBConstantsEnum(IntEnum):
+    """MongoDB constants enumerate."""
+
+    BULK_WRITE_BATCH_SIZE = 1000
@@ -0,0 +1,348 @@
+"""Contains MongoDB client event listeners."""
+
+import bisect
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+import bson
+from bson.raw_bson import RawBSONDocument
+from pymongo import monitoring
+
+from app.services.mongo.models import CommandStatistics, ConnectionPoolStatistics
+
+
+class ConnectionPoolStatisticsListener(monitoring.ConnectionPoolListener):
+    """Connection pool listener which keeps live statistics of the pools.
+
+    Events are published from driver threads, so statistics are guarded by lock.
+    Events of unknown pools (e.g. connection closed after its pool is closed) are
+    ignored, so statistics of a closed pool are not re-created.
+
+    """
+
+    def __init__(self) -> None:
+        """Initializes the connection pool statistics listener."""
+
+        self._lock = threading.Lock()
+
+        self._pools: dict[str, ConnectionPoolStatistics] = {}
+
+    @staticmethod
+    def _get_address_key(address: tuple[str, int | None]) -> str:
+        """Returns a key of the server address.
+
+        Args:
+            address (tuple[str, int | None]): Server address.
+
+        Returns:
+            str: Server address key.
+
+        """
+
+        host, port = address
+
+        return f"{host}:{port}"
+
+    def _get_pool(
+        self, address: tuple[str, int | None]
+    ) -> ConnectionPoolStatistics | None:
+        """Returns statistics of the pool to the server.
+
+        Args:
+            address (tuple[str, int | None]): Server address.
+
+        Returns:
+            ConnectionPoolStatistics | None: Pool statistics or None, in case pool
+            is not created or already closed.
+
+        """
+        return self._pools.get(self._get_address_key(address))
+
+    def get_statistics(self) -> list[ConnectionPoolStatistics]:
+        """Returns a snapshot of statistics of all the pools.
+
+        Returns:
+            list[ConnectionPoolStatistics]: Pools statistics.
+
+        """
+
+        with self._lock:
+            return [pool.model_copy() for pool in self._pools.values()]
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        """Handles pool created event."""
+
+        key = self._get_address_key(event.address)
+
+        with self._lock:
+            self._pools.setdefault(key, ConnectionPoolStatistics(address=key))
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        """Handles pool ready event."""
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        """Handles pool cleared event."""
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        """Handles pool closed event."""
+
+        with self._lock:
+            self._pools.pop(self._get_address_key(event.address), None)
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        """Handles connection created event."""
+
+        with self._lock:
+            pool = self._get_pool(event.address)
+
+            if pool is not None:
+                pool.connections += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        """Handles connection ready event."""
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        """Handles connection closed event."""
+
+        with self._lock:
+            pool = self._get_pool(event.address)
+
+            if pool is not None:
+                pool.connections -= 1
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        """Handles connection check-out started event."""
+
+        with self._lock:
+            pool = self._get_pool(event.address)
+
+            if pool is not None:
+                pool.waiting += 1
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        """Handles connection check-out failed event."""
+
+        with self._lock:
+            pool = self._get_pool(event.address)
+
+            if pool is None:
+                return
+
+            pool.waiting -= 1
+            pool.check_out_failures += 1
+
+            if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+                pool.wait_queue_timeouts += 1
+
+    def connection_checked_out(
+        self, event: monitoring.ConnectionCheckedOutEvent
+    ) -> None:
+        """Handles connection checked out event."""
+
+        with self._lock:
+            pool = self._get_pool(event.address)
+
+            if pool is None:
+                return
+
+            pool.waiting -= 1
+            pool.checked_out += 1
+            pool.check_outs += 1
+            pool.check_out_wait_time += event.duration or 0.0
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        """Handles connection checked in event."""
+
+        with self._lock:
+            pool = self._get_pool(event.address)
+
+            if pool is not None:
+                pool.checked_out -= 1
+
+
+class CommandStatisticsListener(monitoring.CommandListener):
+    """Command listener which keeps latency histograms of the commands.
+
+    Statistics are collected per command name and collection in the current
+    process, so each application worker has its own statistics.
+
+    Size of raw replies is taken as is. Decoded replies would have to be encoded
+    again on the driver thread, so only each N-th of them is measured and its
+    size is counted N times.
+
+    """
+
+    # Upper bounds of duration histogram buckets in milliseconds
+    _DURATION_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    # Each N-th decoded reply is encoded to estimate size of replies
+    _BYTES_SAMPLE_RATE = 100
+
+    def __init__(self) -> None:
+        """Initializes the command statistics listener."""
+
+        self._lock = threading.Lock()
+
+        # Collections of started commands by request and connection
+        self._started: dict[tuple[int, Any], str] = {}
+
+        self._commands: dict[tuple[str, str], CommandStatistics] = {}
+
+        self._decoded_replies = 0
+
+    @staticmethod
+    def _get_collection(command_name: str, command: Mapping[str, Any]) -> str | None:
+        """Returns a name of the collection command is executed on.
+
+        Args:
+            command_name (str): Command name.
+            command (Mapping[str, Any]): Command document.
+
+        Returns:
+            str | None: Collection name or None, in case command is not related to
+            a collection (e.g. authentication or session commands).
+
+        """
+
+        if command_name == "getMore":
+            return command.get("collection")
+
+        collection = command.get(command_name)
+
+        return collection if isinstance(collection, str) else None
+
+    @staticmethod
+    def _count_documents(reply: Mapping[str, Any]) -> int:
+        """Counts documents returned or affected by command.
+
+        Args:
+            reply (Mapping[str, Any]): Command reply.
+
+        Returns:
+            int: Count of documents.
+
+        """
+
+        cursor = reply.get("cursor")
+
+        if isinstance(cursor, Mapping):
+            return len(cursor.get("firstBatch", cursor.get("nextBatch", [])))
+
+        return int(reply.get("n", 0))
+
+    def _measure_reply(self, reply: Mapping[str, Any]) -> int:
+        """Returns size of command reply in bytes or its sampled estimate.
+
+        Args:
+            reply (Mapping[str, Any]): Command reply.
+
+        Returns:
+            int: Size of reply in bytes.
+
+        """
+
+        if isinstance(reply, RawBSONDocument):
+            return len(reply.raw)
+
+        with self._lock:
+            self._decoded_replies += 1
+
+            if self._decoded_replies % self._BYTES_SAMPLE_RATE != 0:
+                return 0
+
+        return len(bson.encode(reply)) * self._BYTES_SAMPLE_RATE
+
+    def get_statistics(self) -> list[CommandStatistics]:
+        """Returns a snapshot of statistics of all the commands.
+
+        Returns:
+            list[CommandStatistics]: Commands statistics.
+
+        """
+
+        with self._lock:
+            return [
+                command.model_copy(deep=True) for command in self._commands.values()
+            ]
+
+    def _record(
+        self,
+        event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent,
+        documents: int = 0,
+        bytes_: int = 0,
+    ) -> None:
+        """Records a finished command to the statistics.
+
+        Args:
+            event (CommandSucceededEvent | CommandFailedEvent): Command event.
+            documents (int): Count of returned or affected documents. Defaults to 0.
+            bytes_ (int): Size of command reply in bytes. Defaults to 0.
+
+        """
+
+        duration = event.duration_micros / 1000
+
+        bucket = bisect.bisect_left(self._DURATION_BUCKETS, duration)
+
+        with self._lock:
+            collection = self._started.pop(
+                (event.request_id, event.connection_id), None
+            )
+
+            if collection is None:
+                return
+
+            key = (event.command_name, collection)
+
+            if key not in self._commands:
+                self._commands[key] = CommandStatistics(
+                    command=event.command_name,
+                    collection=collection,
+                    duration_histogram={
+                        **{str(bound): 0 for bound in self._DURATION_BUCKETS},
+                        "+Inf": 0,
+                    },
+                )
+
+            command = self._commands[key]
+
+            command.count += 1
+            command.failures += isinstance(event, monitoring.CommandFailedEvent)
+            command.total_duration += duration
+            command.max_duration = max(command.max_duration, duration)
+            command.documents += documents
+            command.bytes += bytes_
+
+            command.duration_histogram[
+                str(self._DURATION_BUCKETS[bucket])
+                if bucket < len(self._DURATION_BUCKETS)
+                else "+Inf"
+            ] += 1
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        """Handles command started event."""
+
+        collection = self._get_collection(event.command_name, event.command)
+
+        if collection is not None:
+            with self._lock:
+                self._started[(event.request_id, event.connection_id)] = collection
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        """Handles command succeeded event."""
+
+        self._record(
+            event,
+            documents=self._count_documents(event.reply),
+            bytes_=self._measure_reply(event.reply),
+        )
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        """Handles command failed event."""
+
+        self._record(event)
@@ -0,0 +1,41 @@
+"""Module that contains MongoDB service models."""
+
+from pydantic import BaseModel
+
+
+class BulkWriteResult(BaseModel):
+    """Aggregated result of bulk write operations."""
+
+    inserted_count: int = 0
+    matched_count: int = 0
+    modified_count: int = 0
+    deleted_count: int = 0
+    upserted_count: int = 0
+
+
+class ConnectionPoolStatistics(BaseModel):
+    """Live statistics of the connection pool to one MongoDB server."""
+
+    address: str
+    connections: int = 0
+    checked_out: int = 0
+    waiting: int = 0
+    check_outs: int = 0
+    check_out_failures: int = 0
+    wait_queue_timeouts: int = 0
+    check_out_wait_time: float = 0.0  # total time in seconds spent on check-outs
+
+
+class CommandStatistics(BaseModel):
+    """Statistics of one MongoDB command executed on one collection."""
+
+    command: str
+    collection: str
+    count: int = 0
+    failures: int = 0
+    total_duration: float = 0.0  # milliseconds
+    max_duration: float = 0.0  # milliseconds
+    documents: int = 0
+    bytes: int = 0  # size of replies, decoded replies are sampled
+    # count of commands by upper bound of duration bucket in milliseconds
+    duration_histogram: dict[str, int]
@@ -0,0 +1,202 @@
+"""Contains MongoDB query profiler."""
+
+from collections.abc import Mapping
+from typing import Any
+
+
+class QueryProfiler:
+    """Utility class for describing slow MongoDB operations."""
+
+    _REDACTED_VALUE = "?"
+
+    # Command fields that may contain user data
+    _REDACTED_FIELDS = frozenset(
+        ("filter", "query", "pipeline", "update", "updates", "deletes")
+    )
+
+    @classmethod
+    def _redact(cls, value: Any) -> Any:
+        """Replaces values of the query with placeholder and keeps its shape.
+
+        Args:
+            value (Any): Query or its part.
+
+        Returns:
+            Any: Redacted query.
+
+        """
+
+        if isinstance(value, Mapping):
+            return {key: cls._redact(value_) for key, value_ in value.items()}
+
+        if (
+            isinstance(value, list)
+            and value
+            and all(isinstance(item, Mapping) for item in value)
+        ):
+            return [cls._redact(item) for item in value]
+
+        return cls._REDACTED_VALUE
+
+    @classmethod
+    def get_command_shape(cls, command: Mapping[str, Any]) -> dict[str, Any]:
+        """Returns a shape of the command with redacted filter values.
+
+        Args:
+            command (Mapping[str, Any]): Database command.
+
+        Returns:
+            dict[str, Any]: Command shape.
+
+        """
+        return {
+            key: cls._redact(value) if key in cls._REDACTED_FIELDS else value
+            for key, value in command.items()
+        }
+
+    @classmethod
+    def _get_plan_stages(cls, plan: Mapping[str, Any]) -> list[str]:
+        """Returns stages of the query plan from top to bottom.
+
+        Args:
+            plan (Mapping[str, Any]): Query plan.
+
+        Returns:
+            list[str]: Stage names.
+
+        """
+
+        # Slot based execution engine wraps classic plan into "queryPlan"
+        plan = plan.get("queryPlan", plan)
+
+        stages = [plan["stage"]] if "stage" in plan else []
+
+        if "inputStage" in plan:
+            stages.extend(cls._get_plan_stages(plan["inputStage"]))
+
+        for input_stage in plan.get("inputStages", []):
+            stages.extend(cls._get_plan_stages(input_stage))
+
+        return stages
+
+    @classmethod
+    def get_plan_summary(cls, explanation: Mapping[str, Any]) -> dict[str, Any]:
+        """Returns a summary of the "executionStats" explanation.
+
+        Args:
+            explanation (Mapping[str, Any]): Result of explain command.
+
+        Returns:
+            dict[str, Any]: Winning plan stages, count of examined documents and
+            keys and flags of collection scan and in-memory sort.
+
+        """
+
+        source = explanation
+
+        # Aggregation pipelines explain their query in the first "$cursor" stage
+        pipeline_stages = [next(iter(stage)) for stage in explanation.get("stages", [])]
+
+        if "queryPlanner" not in source and pipeline_stages:
+            source = explanation["stages"][0]["$cursor"]
+
+        execution_stats = source.get("executionStats", {})
+
+        stages = cls._get_plan_stages(
+            source.get("queryPlanner", {}).get("winningPlan", {})
+        ) + [stage for stage in pipeline_stages if stage != "$cursor"]
+
+        return {
+            "winning_plan": stages,
+            "total_docs_examined": execution_stats.get("totalDocsExamined"),
+            "total_keys_examined": execution_stats.get("totalKeysExamined"),
+            "returned": execution_stats.get("nReturned"),
+            "collection_scan": "COLLSCAN" in stages,
+            "in_memory_sort": "SORT" in stages or "$sort" in stages,
+        }
+
+    @classmethod
+    def get_index_suggestion(
+        cls,
+        filter_: Mapping[str, Any],
+        sort: Mapping[str, Any] | None = None,
+    ) -> list[tuple[str, int]] | None:
+        """Returns a compound index which supports the query.
+
+        Index keys follow "equality, sort, range" rule: fields matched by exact
+        value go first, then sort fields and fields matched by range at the end.
+
+        Args:
+            filter_ (Mapping[str, Any]): Query filter.
+            sort (Mapping[str, Any] | None): Query sorting. Defaults to None.
+
+        Returns:
+            list[tuple[str, int]] | None: Index keys and directions or None if
+            query is served by the text index.
+
+        """
+
+        equality: list[str] = []
+        range_: list[str] = []
+
+        if not cls._collect_filter_fields(filter_, equality=equality, range_=range_):
+            return None
+
+        keys: dict[str, int] = dict.fromkeys(equality, 1)
+
+        for field, direction in (sort or {}).items():
+            # Text score is not a field, it can't be a part of the index
+            if isinstance(direction, Mapping):
+                return None
+
+            keys.setdefault(field, direction)
+
+        for field in range_:
+            keys.setdefault(field, 1)
+
+        return list(keys.items()) or None
+
+    @classmethod
+    def _collect_filter_fields(
+        cls,
+        filter_: Mapping[str, Any],
+        equality: list[str],
+        range_: list[str],
+    ) -> bool:
+        """Splits fields of the filter into equality and range ones.
+
+        Args:
+            filter_ (Mapping[str, Any]): Query filter.
+            equality (list[str]): Fields matched by exact value.
+            range_ (list[str]): Fields matched by range.
+
+        Returns:
+            bool: False if filter contains text search, otherwise True.
+
+        """
+
+        for field, value in filter_.items():
+            if field == "$text":
+                return False
+
+            if field == "$and":
+                if not all(
+                    cls._collect_filter_fields(item, equality=equality, range_=range_)
+                    for item in value
+                ):
+                    return False
+
+                continue
+
+            # Keyset conditions use the sort fields, which are indexed anyway
+            if field.startswith("$"):
+                continue
+
+            is_equality = not isinstance(value, Mapping) or set(value) <= {"$eq", "$in"}
+
+            fields = equality if is_equality else range_
+
+            if field not in fields:
+                fields.append(field)
+
+        return True
@@ -1,7 +1,10 @@
 """Module that contains MongoDB service."""
 
-from collections.abc import Iterable, Mapping, Sequence
-from typing import Any
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Iterable, Mapping, Sequence
+from typing import Any, ClassVar
 
 from fastapi import Depends
 from injector import inject
@@ -12,10 +15,18 @@ from motor.motor_asyncio import (
     AsyncIOMotorCollection,
     AsyncIOMotorDatabase,
 )
-from pymongo import ReturnDocument
+from pymongo import DeleteOne, InsertOne, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
 
 from app.services.base import BaseService
 from app.services.mongo.client import MongoDBClient
+from app.services.mongo.constants import MongoDBConstantsEnum
+from app.services.mongo.models import (
+    BulkWriteResult,
+    CommandStatistics,
+    ConnectionPoolStatistics,
+)
+from app.services.mongo.profiler import QueryProfiler
 from app.settings import SETTINGS
 
 
@@ -25,6 +36,10 @@ class MongoDBService(BaseService):
 
     _name: str = "mongo_db"
 
+    # Time of the latest slow operation explain and explains in progress
+    _explained_at: ClassVar[float] = float("-inf")
+    _explain_tasks: ClassVar[set[asyncio.Task[None]]] = set()
+
     def __init__(self, mongo_client: MongoDBClient = Depends()) -> None:
         """MongoDB service initialization method.
 
@@ -33,8 +48,30 @@ class MongoDBService(BaseService):
 
         """
 
+        self._mongo_client = mongo_client
+
         self._db: AsyncIOMotorDatabase = mongo_client.client[SETTINGS.MONGODB_NAME]
 
+    def get_pool_statistics(self) -> list[ConnectionPoolStatistics]:
+        """Returns live statistics of the MongoDB connection pools.
+
+        Returns:
+            list[ConnectionPoolStatistics]: Pools statistics, e.g. count of
+            checked out connections and count of operations waiting for one.
+
+        """
+        return self._mongo_client.get_pool_statistics()
+
+    def get_command_statistics(self) -> list[CommandStatistics]:
+        """Returns latency statistics of MongoDB commands by collection.
+
+        Returns:
+            list[CommandStatistics]: Commands statistics, e.g. duration histogram,
+            count of returned documents and size of replies.
+
+        """
+        return self._mongo_client.get_command_statistics()
+
     @staticmethod
     def run_migrations(upgrade: bool = True, to_datetime: str | None = None) -> None:
         """Runs MongoDB migrations.
@@ -82,6 +119,101 @@ class MongoDBService(BaseService):
         """
         return self._db[collection]
 
+    async def explain(
+        self, command: Mapping[str, Any], verbosity: str = "executionStats"
+    ) -> Mapping[str, Any]:
+        """Explains a database command.
+
+        Args:
+            command (Mapping[str, Any]): Database command, e.g. find or aggregate.
+            verbosity (str): Explain verbosity mode. Defaults to "executionStats".
+
+        Returns:
+            Mapping[str, Any]: Command explanation.
+
+        """
+        return await self._db.command({"explain": command, "verbosity": verbosity})
+
+    async def _log_slow_operation(
+        self,
+        started_at: float,
+        command: Mapping[str, Any],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> None:
+        """Logs an operation in case it takes longer than configured threshold.
+
+        Filter values are redacted from the log. If it is configured, operation is
+        explained in background, not often than once per configured interval, and
+        summary of the winning plan is logged separately.
+
+        Args:
+            started_at (float): Performance counter value before the operation.
+            command (Mapping[str, Any]): Database command equivalent of the
+            operation.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        """
+
+        duration = (time.perf_counter() - started_at) * 1000
+
+        threshold = SETTINGS.MONGODB_SLOW_OPERATION_THRESHOLD_MS
+
+        if threshold is None or duration < threshold:
+            return
+
+        # Options which are not passed are not the part of the command
+        command = {key: value for key, value in command.items() if value is not None}
+
+        shape = QueryProfiler.get_command_shape(command)
+
+        logging.warning(f"Slow MongoDB operation took {duration:.1f} ms: {shape}")
+
+        now = time.monotonic()
+
+        # Explain command is not allowed in multi-document transactions, it also
+        # re-executes the operation, so it is rate limited
+        if (
+            SETTINGS.MONGODB_SLOW_OPERATION_EXPLAIN is True
+            and session is None
+            and now - MongoDBService._explained_at
+            >= SETTINGS.MONGODB_SLOW_OPERATION_EXPLAIN_INTERVAL
+        ):
+            MongoDBService._explained_at = now
+
+            task = asyncio.create_task(
+                self._log_slow_operation_plan(command=command, shape=shape)
+            )
+
+            # Keeps reference to the task till it is done
+            MongoDBService._explain_tasks.add(task)
+
+            task.add_done_callback(MongoDBService._explain_tasks.discard)
+
+    async def _log_slow_operation_plan(
+        self, command: Mapping[str, Any], shape: Mapping[str, Any]
+    ) -> None:
+        """Explains a slow operation and logs summary of its winning plan.
+
+        Args:
+            command (Mapping[str, Any]): Database command equivalent of the
+            operation.
+            shape (Mapping[str, Any]): Command shape with redacted filter values.
+
+        """
+
+        try:
+            explanation = await self.explain(command=command)
+
+            logging.warning(
+                f"Plan of slow MongoDB operation {shape}: "
+                f"{QueryProfiler.get_plan_summary(explanation)}"
+            )
+
+        except PyMongoError as e:
+            logging.warning(f"Slow MongoDB operation {shape} is not explained: {e}")
+
     async def find(  # noqa: PLR0913
         self,
         collection: str,
@@ -134,7 +266,89 @@ class MongoDBService(BaseService):
         if limit is not None:
             cursor = cursor.limit(limit)
 
-        return await cursor.to_list(length=limit)
+        started_at = time.perf_counter()
+
+        documents = await cursor.to_list(length=limit)
+
+        await self._log_slow_operation(
+            started_at,
+            command={
+                "find": collection,
+                "filter": filter_ or {},
+                "projection": projection,
+                "sort": dict(sort) if sort is not None else None,
+                "skip": skip,
+                "limit": limit,
+            },
+            session=session,
+        )
+
+        return documents
+
+    async def iter_find(  # noqa: PLR0913
+        self,
+        collection: str,
+        skip: int | None = None,
+        limit: int | None = None,
+        filter_: Mapping[str, Any] | None = None,
+        projection: Mapping[str, Any] | None = None,
+        sort: Sequence[tuple[str, int | str | Mapping[str, Any]]] | None = None,
+        batch_size: int | None = None,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        """
+        Finds documents that satisfy the specified query criteria in the chosen
+        collection and yields them as the driver fetches them in batches.
+
+        Args:
+            collection (str): Collection name.
+            skip (int): The number of documents to skip in the results set.
+            Defaults to None.
+            limit (int): Specifies the maximum number of documents will be
+            returned. Defaults to None.
+            filter_ (Mapping[str, Any] | None): Specifies query selection
+            criteria. Defaults to None.
+            projection (Mapping[str, Any] | None): Specifies list of field names that
+            should be returned in the result set or a dict specifying the fields
+            to include or exclude. Defaults to None.
+            sort (Sequence[tuple[str, int | str | Mapping[str, Any]]] | None):
+            Specifies the order in which the query returns matching documents.
+            Defaults to None.
+            batch_size (int | None): The number of documents fetched per round trip.
+            Defaults to None (driver default).
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Yields:
+            Mapping[str, Any]: Document.
+
+        """
+
+        collection_ = self._get_collection_by_name(collection=collection)
+
+        cursor = collection_.find(
+            filter=filter_, projection=projection, session=session
+        )
+
+        if sort is not None:
+            cursor = cursor.sort(sort)
+
+        if skip is not None:
+            cursor = cursor.skip(skip)
+
+        if limit is not None:
+            cursor = cursor.limit(limit)
+
+        if batch_size is not None:
+            cursor = cursor.batch_size(batch_size)
+
+        try:
+            async for document in cursor:
+                yield document
+
+        finally:
+            await cursor.close()
 
     async def count_documents(
         self,
@@ -159,12 +373,18 @@ class MongoDBService(BaseService):
 
         collection_ = self._get_collection_by_name(collection=collection)
 
-        return (
-            await collection_.count_documents(filter=filter_, session=session)
-            if filter_ is not None
-            else await collection_.count_documents(filter={}, session=session)
+        started_at = time.perf_counter()
+
+        count = await collection_.count_documents(filter=filter_ or {}, session=session)
+
+        await self._log_slow_operation(
+            started_at,
+            command={"count": collection, "query": filter_ or {}},
+            session=session,
         )
 
+        return count
+
     async def distinct(
         self,
         collection: str,
@@ -191,7 +411,17 @@ class MongoDBService(BaseService):
 
         collection_ = self._get_collection_by_name(collection=collection)
 
-        return await collection_.distinct(field, filter=filter_, session=session)
+        started_at = time.perf_counter()
+
+        values = await collection_.distinct(field, filter=filter_, session=session)
+
+        await self._log_slow_operation(
+            started_at,
+            command={"distinct": collection, "key": field, "query": filter_ or {}},
+            session=session,
+        )
+
+        return values
 
     async def find_one(
         self,
@@ -217,7 +447,17 @@ class MongoDBService(BaseService):
 
         collection_ = self._get_collection_by_name(collection=collection)
 
-        return await collection_.find_one(filter=filter_, session=session)
+        started_at = time.perf_counter()
+
+        document = await collection_.find_one(filter=filter_, session=session)
+
+        await self._log_slow_operation(
+            started_at,
+            command={"find": collection, "filter": filter_, "limit": 1},
+            session=session,
+        )
+
+        return document
 
     async def find_one_and_update(  # noqa: PLR0913
         self,
@@ -248,7 +488,9 @@ class MongoDBService(BaseService):
 
         collection_ = self._get_collection_by_name(collection=collection)
 
-        return await collection_.find_one_and_update(
+        started_at = time.perf_counter()
+
+        document = await collection_.find_one_and_update(
             filter=filter_,
             update=update,
             upsert=upsert,
@@ -258,6 +500,20 @@ class MongoDBService(BaseService):
             session=session,
         )
 
+        await self._log_slow_operation(
+            started_at,
+            command={
+                "findAndModify": collection,
+                "query": filter_,
+                "update": update,
+                "upsert": upsert,
+                "new": return_updated,
+            },
+            session=session,
+        )
+
+        return document
+
     async def insert_one(
         self,
         collection: str,
@@ -312,11 +568,101 @@ class MongoDBService(BaseService):
 
         return result.inserted_ids
 
+    async def bulk_write(
+        self,
+        collection: str,
+        operations: Sequence[
+            InsertOne[Mapping[str, Any]] | UpdateOne | UpdateMany | DeleteOne
+        ],
+        ordered: bool = True,
+        batch_size: int = MongoDBConstantsEnum.BULK_WRITE_BATCH_SIZE,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> BulkWriteResult:
+        """Executes mixed write operations in batches in the chosen collection.
+
+        Each batch is sent to the database in one round trip. In ordered mode
+        execution stops on the first failed operation, in unordered mode all the
+        batches are executed and failed operations are reported at the end.
+
+        Args:
+            collection (str): Collection name.
+            operations (Sequence[InsertOne | UpdateOne | UpdateMany | DeleteOne]):
+            Write operations to be executed.
+            ordered (bool): Defines if operations should be executed in order.
+            Defaults to True.
+            batch_size (int): The maximum number of operations per round trip.
+            Defaults to MongoDBConstantsEnum.BULK_WRITE_BATCH_SIZE.
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Returns:
+            BulkWriteResult: Aggregated counts of executed operations.
+
+        Raises:
+            BulkWriteError: In case some of the operations are failed. Error details
+            contain write errors of all the executed batches.
+
+        """
+
+        collection_ = self._get_collection_by_name(collection=collection)
+
+        result = BulkWriteResult()
+        write_errors: list[Mapping[str, Any]] = []
+        write_concern_errors: list[Mapping[str, Any]] = []
+
+        for offset in range(0, len(operations), batch_size):
+            batch = operations[offset : offset + batch_size]
+
+            try:
+                batch_result = await collection_.bulk_write(
+                    requests=batch, ordered=ordered, session=session
+                )
+
+                result.inserted_count += batch_result.inserted_count
+                result.matched_count += batch_result.matched_count
+                result.modified_count += batch_result.modified_count
+                result.deleted_count += batch_result.deleted_count
+                result.upserted_count += batch_result.upserted_count
+
+            except BulkWriteError as exc:
+                result.inserted_count += exc.details.get("nInserted", 0)
+                result.matched_count += exc.details.get("nMatched", 0)
+                result.modified_count += exc.details.get("nModified", 0)
+                result.deleted_count += exc.details.get("nRemoved", 0)
+                result.upserted_count += exc.details.get("nUpserted", 0)
+
+                # Error indexes are relative to the batch
+                write_errors.extend(
+                    {**error, "index": offset + error["index"]}
+                    for error in exc.details.get("writeErrors", [])
+                )
+                write_concern_errors.extend(exc.details.get("writeConcernErrors", []))
+
+                if ordered is True:
+                    break
+
+        if write_errors or write_concern_errors:
+            raise BulkWriteError(
+                {
+                    "writeErrors": write_errors,
+                    "writeConcernErrors": write_concern_errors,
+                    "nInserted": result.inserted_count,
+                    "nUpserted": result.upserted_count,
+                    "nMatched": result.matched_count,
+                    "nModified": result.modified_count,
+                    "nRemoved": result.deleted_count,
+                    "upserted": [],
+                }
+            )
+
+        return result
+
     async def update_one(
         self,
         collection: str,
         filter_: Mapping[str, Any],
-        update: Mapping[str, Any],
+        update: Mapping[str, Any] | Sequence[Mapping[str, Any]],
         upsert: bool = False,
         *,
         session: AsyncIOMotorClientSession | None = None,
@@ -326,7 +672,8 @@ class MongoDBService(BaseService):
         Args:
             collection (str): Collection name.
             filter_ (Mapping[str, Any]): Specifies query selection criteria.
-            update (Mapping[str, Any]): Data to be updated.
+            update (Mapping[str, Any] | Sequence[Mapping[str, Any]]): Data to be
+            updated or update pipeline.
             upsert (bool): Use update or insert. Defaults to False.
             session (AsyncIOMotorClientSession | None): Defines a client session
             if operation is transactional. Defaults to None.
@@ -335,10 +682,21 @@ class MongoDBService(BaseService):
 
         collection_ = self._get_collection_by_name(collection=collection)
 
+        started_at = time.perf_counter()
+
         await collection_.update_one(
             filter=filter_, update=update, upsert=upsert, session=session
         )
 
+        await self._log_slow_operation(
+            started_at,
+            command={
+                "update": collection,
+                "updates": [{"q": filter_, "u": update, "upsert": upsert}],
+            },
+            session=session,
+        )
+
     async def delete_one(
         self,
         collection: str,
@@ -358,15 +716,29 @@ class MongoDBService(BaseService):
 
         collection_ = self._get_collection_by_name(collection=collection)
 
+        started_at = time.perf_counter()
+
         await collection_.delete_one(filter=filter_, session=session)
 
+        await self._log_slow_operation(
+            started_at,
+            command={"delete": collection, "deletes": [{"q": filter_, "limit": 1}]},
+            session=session,
+        )
+
     async def delete_many(
-        self, collection: str, *, session: AsyncIOMotorClientSession | None = None
+        self,
+        collection: str,
+        filter_: Mapping[str, Any] | None = None,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
     ) -> None:
         """Deletes multiple documents from the chosen collection.
 
         Args:
             collection (str): Collection name.
+            filter_ (Mapping[str, Any] | None): Specifies deletion criteria,
+            all documents are deleted if it is None. Defaults to None.
             session (AsyncIOMotorClientSession | None): Defines a client session
             if operation is transactional. Defaults to None.
 
@@ -374,7 +746,7 @@ class MongoDBService(BaseService):
 
         collection_ = self._get_collection_by_name(collection=collection)
 
-        await collection_.delete_many(filter={}, session=session)
+        await collection_.delete_many(filter=filter_ or {}, session=session)
 
     async def aggregate(
         self,
@@ -403,6 +775,56 @@ class MongoDBService(BaseService):
 
         collection_ = self._get_collection_by_name(collection=collection)
 
+        started_at = time.perf_counter()
+
         cursor = collection_.aggregate(pipeline=pipeline, session=session)
 
-        return await cursor.to_list(length=cursor_length)
+        documents = await cursor.to_list(length=cursor_length)
+
+        await self._log_slow_operation(
+            started_at,
+            command={"aggregate": collection, "pipeline": pipeline, "cursor": {}},
+            session=session,
+        )
+
+        return documents
+
+    async def iter_aggregate(
+        self,
+        collection: str,
+        pipeline: Sequence[Mapping[str, Any]],
+        batch_size: int | None = None,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        """
+        Aggregates a pipeline in the chosen collection and yields resulting
+        documents as the driver fetches them in batches.
+
+        Args:
+            collection (str): Collection name.
+            pipeline (Mapping[str, Any]): A single command or list of
+            aggregation commands.
+            batch_size (int | None): The number of documents fetched per round trip.
+            Defaults to None (driver default).
+            session (AsyncIOMotorClientSession | None): Defines a client session
+            if operation is transactional. Defaults to None.
+
+        Yields:
+            Mapping[str, Any]: Document.
+
+        """
+
+        collection_ = self._get_collection_by_name(collection=collection)
+
+        cursor = collection_.aggregate(pipeline=pipeline, session=session)
+
+        if batch_size is not None:
+            cursor = cursor.batch_size(batch_size)
+
+        try:
+            async for document in cursor:
+                yield document
+
+        finally:
+            await cursor.close()
@@ -0,0 +1,462 @@
+"""Contains two-tier cache on top of Redis."""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, ClassVar
+
+from fastapi import Depends
+from injector import inject
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from app.services.redis.constants import RedisNamesEnum
+from app.services.redis.service import RedisService
+from app.settings import SETTINGS
+from app.utils.lru import LRUCache, LRUCacheStatistics
+
+
+class LocalCacheEntry(BaseModel):
+    """Value kept in process memory with details of its Redis expiration."""
+
+    value: Any
+    expires_at: float = math.inf  # unix timestamp of expiration in Redis
+    load_duration: float  # seconds
+
+
+@inject
+class TwoTierCache:
+    """Cache which keeps decoded Redis values in process memory.
+
+    Reads are served from the in-process LRU cache first, so hot values cost
+    neither Redis round trip nor decoding. Deleted names are published into
+    invalidation channel, which every worker listens to and drops own entries.
+
+    Values are loaded on miss in "single-flight" manner: concurrent loads of the
+    same name in the worker share one call and only one worker, which holds the
+    Redis lock, calls the loader while the others wait for its result.
+
+    """
+
+    _local_cache: LRUCache[LocalCacheEntry] = LRUCache(
+        maxsize=SETTINGS.REDIS_LOCAL_CACHE_SIZE, ttl=SETTINGS.REDIS_LOCAL_CACHE_TTL
+    )
+
+    _INVALIDATION_RETRY_WAIT = 1  # seconds
+
+    _LOCK_TIMEOUT = 10  # seconds
+    _LOCK_WAIT_INTERVAL = 0.05  # seconds
+
+    # The greater value is, the earlier values are refreshed before expiration
+    _EARLY_REFRESH_BETA = 1.0
+
+    # Pending loads and duration of the last load in seconds by name
+    _loads: ClassVar[dict[str, asyncio.Future[LocalCacheEntry]]] = {}
+    _load_durations: ClassVar[dict[str, float]] = {}
+
+    # Keeps references to background refresh tasks by name
+    _refresh_tasks: ClassVar[dict[str, asyncio.Task[None]]] = {}
+
+    def __init__(self, redis_service: RedisService = Depends()) -> None:
+        """Initializes two-tier cache.
+
+        Args:
+            redis_service (RedisService): Redis service.
+
+        """
+
+        self.redis_service = redis_service
+
+    async def get(self, name: str) -> Any:
+        """Returns cached value by name.
+
+        Args:
+            name (str): Name to find.
+
+        Returns:
+            Any: Decoded value or None if it is not cached.
+
+        """
+
+        entry = await self._get_entry(name=name)
+
+        return entry.value if entry is not None else None
+
+    async def _get_entry(
+        self, name: str, *, with_expiration: bool = False
+    ) -> LocalCacheEntry | None:
+        """Returns cached value by name along with its expiration details.
+
+        Args:
+            name (str): Name to find.
+            with_expiration (bool): Defines if remaining TTL of the value is read
+            from Redis on in-process cache miss. Defaults to False.
+
+        Returns:
+            LocalCacheEntry | None: Cached entry or None if value is not cached.
+
+        """
+
+        entry = self._local_cache.get(name)
+
+        if entry is not None:
+            return entry
+
+        value = await self.redis_service.get_value(name=name)
+
+        if value is None:
+            return None
+
+        expires_at = math.inf
+
+        if with_expiration is True:
+            remaining_ttl = await self.redis_service.ttl(name=name)
+
+            # Name has no expiration or is deleted meanwhile
+            if remaining_ttl >= 0:
+                expires_at = time.time() + remaining_ttl
+
+        return self._set_local(name=name, value=value, expires_at=expires_at)
+
+    def _set_local(self, name: str, value: Any, expires_at: float) -> LocalCacheEntry:
+        """Caches a value in process memory.
+
+        Args:
+            name (str): Name to set.
+            value (Any): Value to set.
+            expires_at (float): Unix timestamp of value expiration in Redis.
+
+        Returns:
+            LocalCacheEntry: Cached entry.
+
+        """
+
+        entry = LocalCacheEntry(
+            value=value,
+            expires_at=expires_at,
+            load_duration=self._load_durations.get(name, self._LOCK_WAIT_INTERVAL),
+        )
+
+        self._local_cache.set(name, entry)
+
+        return entry
+
+    async def set(self, name: str, value: Any, ttl: int) -> None:
+        """Caches a value in Redis and process memory.
+
+        Value is shared between callers in the worker, so it must not be mutated.
+
+        Args:
+            name (str): Name to set.
+            value (Any): Value to set, must be supported by the Redis codec.
+            ttl (int): Number of seconds the value is cached in Redis.
+
+        """
+
+        await self._set(name=name, value=value, ttl=ttl)
+
+    async def _set(self, name: str, value: Any, ttl: int) -> LocalCacheEntry:
+        """Caches a value in Redis and process memory.
+
+        Args:
+            name (str): Name to set.
+            value (Any): Value to set.
+            ttl (int): Number of seconds the value is cached in Redis.
+
+        Returns:
+            LocalCacheEntry: Entry cached in process memory.
+
+        """
+
+        expires_at = time.time() + ttl
+
+        await self.redis_service.set_value(name=name, value=value, ttl=ttl)
+
+        return self._set_local(name=name, value=value, expires_at=expires_at)
+
+    async def get_or_load(
+        self,
+        name: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        *,
+        early_refresh: bool = False,
+    ) -> Any:
+        """Returns cached value by name or loads and caches it on miss.
+
+        Args:
+            name (str): Name to find.
+            loader (Callable[[], Awaitable[Any]]): Loads a value on cache miss.
+            ttl (int): Number of seconds the value is cached in Redis.
+            early_refresh (bool): Defines if value is refreshed in background with
+            growing probability as its expiration approaches, so concurrent
+            requests rarely observe a miss. Defaults to False.
+
+        Returns:
+            Any: Cached or loaded value.
+
+        """
+
+        entry = self._local_cache.get(name)
+
+        if entry is None:
+            entry = await self._get_or_load_entry(
+                name=name, loader=loader, ttl=ttl, early_refresh=early_refresh
+            )
+
+        # Checked on every hit, as values outlive in-process cache TTL in Redis
+        if early_refresh is True and self._should_refresh(entry=entry):
+            self._refresh(name=name, loader=loader, ttl=ttl)
+
+        return entry.value
+
+    async def _get_or_load_entry(
+        self,
+        name: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        *,
+        early_refresh: bool,
+    ) -> LocalCacheEntry:
+        """Returns entry cached in Redis or loads it, one load per name at once.
+
+        Args:
+            name (str): Name to find.
+            loader (Callable[[], Awaitable[Any]]): Loads a value on cache miss.
+            ttl (int): Number of seconds the value is cached in Redis.
+            early_refresh (bool): Defines if remaining TTL of the value is read.
+
+        Returns:
+            LocalCacheEntry: Cached or loaded entry.
+
+        """
+
+        pending_load = self._loads.get(name)
+
+        if pending_load is not None:
+            return await asyncio.shield(pending_load)
+
+        future: asyncio.Future[LocalCacheEntry] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+        self._loads[name] = future
+
+        try:
+            entry = await self._get_entry(name=name, with_expiration=early_refresh)
+
+            if entry is None:
+                entry = await self._load(name=name, loader=loader, ttl=ttl)
+
+            future.set_result(entry)
+
+            return entry
+
+        except BaseException as e:
+            future.set_exception(e)
+
+            # Exception is raised to the caller, waiters handle it on their own
+            future.exception()
+
+            raise
+
+        finally:
+            del self._loads[name]
+
+    async def _load(
+        self, name: str, loader: Callable[[], Awaitable[Any]], ttl: int
+    ) -> LocalCacheEntry:
+        """Loads a value under the Redis lock and caches it.
+
+        If the lock is held by other worker, value it loads is awaited till the
+        lock timeout, afterwards value is loaded regardless of the lock.
+
+        Args:
+            name (str): Name to set.
+            loader (Callable[[], Awaitable[Any]]): Loads a value.
+            ttl (int): Number of seconds the value is cached in Redis.
+
+        Returns:
+            LocalCacheEntry: Loaded entry.
+
+        """
+
+        lock = self.redis_service.lock(
+            name=RedisNamesEnum.CACHE_LOCK.format(name=name),
+            timeout=self._LOCK_TIMEOUT,
+        )
+
+        if await lock.acquire() is False:
+            deadline = time.monotonic() + self._LOCK_TIMEOUT
+
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self._LOCK_WAIT_INTERVAL)
+
+                entry = await self._get_entry(name=name, with_expiration=True)
+
+                if entry is not None:
+                    return entry
+
+            logging.warning(f"Cache lock of '{name}' is not released in time.")
+
+            return await self._load_and_set(name=name, loader=loader, ttl=ttl)
+
+        try:
+            return await self._load_and_set(name=name, loader=loader, ttl=ttl)
+
+        finally:
+            # Lock could expire if loading took longer than timeout
+            if await lock.owned():
+                await lock.release()
+
+    async def _load_and_set(
+        self, name: str, loader: Callable[[], Awaitable[Any]], ttl: int
+    ) -> LocalCacheEntry:
+        """Loads a value, caches it and measures load duration.
+
+        Args:
+            name (str): Name to set.
+            loader (Callable[[], Awaitable[Any]]): Loads a value.
+            ttl (int): Number of seconds the value is cached in Redis.
+
+        Returns:
+            LocalCacheEntry: Loaded entry.
+
+        """
+
+        started_at = time.monotonic()
+
+        value = await loader()
+
+        self._load_durations[name] = time.monotonic() - started_at
+
+        return await self._set(name=name, value=value, ttl=ttl)
+
+    def _should_refresh(self, entry: LocalCacheEntry) -> bool:
+        """Decides if value should be refreshed before it expires.
+
+        Probability grows as expiration approaches and it is higher for values
+        which take longer to load ("XFetch" algorithm).
+
+        Args:
+            entry (LocalCacheEntry): Cached entry to check.
+
+        Returns:
+            bool: True if value should be refreshed else False.
+
+        """
+
+        # 1 - random() is in (0, 1], so logarithm is defined
+        return (
+            -entry.load_duration
+            * self._EARLY_REFRESH_BETA
+            * math.log(1 - random.random())
+            >= entry.expires_at - time.time()
+        )
+
+    def _refresh(
+        self, name: str, loader: Callable[[], Awaitable[Any]], ttl: int
+    ) -> None:
+        """Refreshes a value in background, if no one else is refreshing it.
+
+        Args:
+            name (str): Name to set.
+            loader (Callable[[], Awaitable[Any]]): Loads a value.
+            ttl (int): Number of seconds the value is cached in Redis.
+
+        """
+
+        async def refresh() -> None:
+            entry = self._local_cache.get(name)
+
+            try:
+                remaining_ttl = await self.redis_service.ttl(name=name)
+
+                # Value is refreshed by other worker, so it is read from Redis again
+                if (
+                    entry is not None
+                    and time.time() + remaining_ttl > entry.expires_at + 1
+                ):
+                    self._local_cache.pop(name)
+
+                    return
+
+                lock = self.redis_service.lock(
+                    name=RedisNamesEnum.CACHE_LOCK.format(name=name),
+                    timeout=self._LOCK_TIMEOUT,
+                )
+
+                if await lock.acquire() is False:
+                    return
+
+                try:
+                    await self._load_and_set(name=name, loader=loader, ttl=ttl)
+
+                finally:
+                    if await lock.owned():
+                        await lock.release()
+
+            except Exception as e:
+                logging.error(f"Cache refresh of '{name}' failed: {e}")
+
+        if name in self._refresh_tasks:
+            return
+
+        task = asyncio.create_task(refresh())
+
+        self._refresh_tasks[name] = task
+
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(name, None))
+
+    async def delete(self, name: str) -> None:
+        """Deletes a cached value in Redis and in memory of all workers.
+
+        Args:
+            name (str): Name to delete.
+
+        """
+
+        self._local_cache.pop(name)
+
+        await self.redis_service.delete(name=name)
+
+        await self.redis_service.publish(
+            channel=RedisNamesEnum.CACHE_INVALIDATION_CHANNEL, message=name
+        )
+
+    async def listen_invalidations(self) -> None:
+        """Drops in-process values deleted by any worker, runs till cancelled."""
+
+        while True:
+            try:
+                async with self.redis_service.subscribe(
+                    channel=RedisNamesEnum.CACHE_INVALIDATION_CHANNEL
+                ) as messages:
+                    # Messages published while worker was not subscribed are lost
+                    self._local_cache.clear()
+
+                    async for name in messages:
+                        self._local_cache.pop(name)
+
+            except RedisError as e:
+                logging.error(f"Cache invalidation listener failed: {e}")
+
+                await asyncio.sleep(self._INVALIDATION_RETRY_WAIT)
+
+    @classmethod
+    def clear_local(cls) -> None:
+        """Removes all in-process values of the worker."""
+        cls._local_cache.clear()
+
+    @classmethod
+    def get_statistics(cls) -> LRUCacheStatistics:
+        """Returns statistics of the in-process cache.
+
+        Returns:
+            LRUCacheStatistics: Size of the cache and count of hits and misses.
+
+        """
+        return cls._local_cache.get_statistics()
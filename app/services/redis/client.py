@@ -1,27 +1,57 @@
 """Contains Redis client."""
 
-from redis.asyncio import StrictRedis
+from typing import Any
+
+from redis.asyncio import BlockingConnectionPool, StrictRedis
 
 from app.services.base import BaseClient
 from app.settings import SETTINGS
 
 
-class RedisClient(BaseClient):
-    """Redis client."""
+def _get_connection_pool(**kwargs: Any) -> BlockingConnectionPool:
+    """Returns a bounded Redis connection pool.
 
-    _client: StrictRedis = StrictRedis(
+    Args:
+        kwargs (Any): Additional connection parameters.
+
+    Returns:
+        BlockingConnectionPool: Connection pool.
+
+    """
+    return BlockingConnectionPool(
         host=SETTINGS.REDIS_HOST,
         port=SETTINGS.REDIS_PORT,
         password=SETTINGS.REDIS_PASSWORD,
-        decode_responses=True,
+        max_connections=SETTINGS.REDIS_MAX_CONNECTIONS,
+        timeout=SETTINGS.REDIS_POOL_TIMEOUT,
+        socket_timeout=SETTINGS.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=SETTINGS.REDIS_SOCKET_CONNECT_TIMEOUT,
+        **kwargs,
+    )
+
+
+class RedisClient(BaseClient):
+    """Redis client."""
+
+    _client: StrictRedis = StrictRedis(
+        connection_pool=_get_connection_pool(decode_responses=True)
     )
 
+    # Shares nothing with the text client, so binary values are not decoded
+    _binary_client: StrictRedis = StrictRedis(connection_pool=_get_connection_pool())
+
     @property
     def client(self) -> StrictRedis:
         """Redis client getter."""
         return self._client
 
+    @property
+    def binary_client(self) -> StrictRedis:
+        """Redis client getter, which returns raw bytes."""
+        return self._binary_client
+
     @classmethod
     async def close(cls) -> None:
         """Closes Redis client."""
-        await cls._client.aclose()
+        await cls._client.aclose(close_connection_pool=True)
+        await cls._binary_client.connection_pool.disconnect()
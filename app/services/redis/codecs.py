@@ -0,0 +1,238 @@
+"""Contains codecs of values cached in Redis."""
+
+import abc
+import zlib
+from typing import Any
+
+import bson
+from bson import json_util
+from bson.errors import InvalidBSON
+
+from app.exceptions import InvalidCachedValueError
+
+
+class BaseCodec(abc.ABC):
+    """Base codec of Redis values.
+
+    Encoded values start with the header of their format, so values written by
+    other codec or in outdated format are detected on decoding instead of being
+    misread. Header has to be changed whenever the format changes.
+
+    """
+
+    # Leading byte can't start JSON text or BSON document of cached size
+    _HEADER: bytes
+
+    @abc.abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encodes a value.
+
+        Args:
+            value (Any): Value to encode.
+
+        Returns:
+            bytes: Encoded value.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decodes a value.
+
+        Args:
+            data (bytes): Encoded value.
+
+        Returns:
+            Any: Decoded value.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+
+        """
+        raise NotImplementedError
+
+    def _strip_header(self, data: bytes) -> bytes:
+        """Returns encoded value without the header of the codec.
+
+        Args:
+            data (bytes): Encoded value.
+
+        Returns:
+            bytes: Encoded value without the header.
+
+        Raises:
+            InvalidCachedValueError: If value is not encoded by the codec.
+
+        """
+
+        if not data.startswith(self._HEADER):
+            raise InvalidCachedValueError
+
+        return data[len(self._HEADER) :]
+
+
+class JSONCodec(BaseCodec):
+    """MongoDB extended JSON codec."""
+
+    _HEADER = b"\xc1J"
+
+    def encode(self, value: Any) -> bytes:
+        """Encodes a value to extended JSON.
+
+        Args:
+            value (Any): Value to encode.
+
+        Returns:
+            bytes: Encoded value.
+
+        """
+        return self._HEADER + json_util.dumps(value).encode()
+
+    def decode(self, data: bytes) -> Any:
+        """Decodes a value from extended JSON.
+
+        Args:
+            data (bytes): Encoded value.
+
+        Returns:
+            Any: Decoded value.
+
+        Raises:
+            InvalidCachedValueError: If value is not valid extended JSON.
+
+        """
+
+        try:
+            return json_util.loads(self._strip_header(data))
+
+        except ValueError:
+            raise InvalidCachedValueError
+
+
+class BSONCodec(BaseCodec):
+    """BSON codec, keeps ObjectId and datetime values without text conversion."""
+
+    _HEADER = b"\xc1B"
+
+    # BSON document can't be a list or scalar, so value is wrapped
+    _VALUE_KEY = "v"
+
+    def encode(self, value: Any) -> bytes:
+        """Encodes a value to BSON.
+
+        Args:
+            value (Any): Value to encode.
+
+        Returns:
+            bytes: Encoded value.
+
+        """
+        return self._HEADER + bson.encode({self._VALUE_KEY: value})
+
+    def decode(self, data: bytes) -> Any:
+        """Decodes a value from BSON.
+
+        Args:
+            data (bytes): Encoded value.
+
+        Returns:
+            Any: Decoded value.
+
+        Raises:
+            InvalidCachedValueError: If value is not valid BSON.
+
+        """
+
+        try:
+            return bson.decode(self._strip_header(data))[self._VALUE_KEY]
+
+        except (InvalidBSON, KeyError):
+            raise InvalidCachedValueError
+
+
+class CompressedCodec(BaseCodec):
+    """Codec which compresses values of other codec above size threshold."""
+
+    _HEADER = b"\xc1Z"
+
+    def __init__(self, codec: BaseCodec, threshold: int) -> None:
+        """Initialize compressed codec.
+
+        Args:
+            codec (BaseCodec): Codec of values.
+            threshold (int): Minimal size of encoded value in bytes to compress.
+
+        """
+
+        self.codec = codec
+        self.threshold = threshold
+
+    def encode(self, value: Any) -> bytes:
+        """Encodes a value and compresses it if it is large.
+
+        Args:
+            value (Any): Value to encode.
+
+        Returns:
+            bytes: Encoded value, prefixed with the header if it is compressed.
+
+        """
+
+        data = self.codec.encode(value)
+
+        if len(data) < self.threshold:
+            return data
+
+        return self._HEADER + zlib.compress(data)
+
+    def decode(self, data: bytes) -> Any:
+        """Decodes a value, decompresses it if needed.
+
+        Args:
+            data (bytes): Encoded value, prefixed with the header if it is
+            compressed.
+
+        Returns:
+            Any: Decoded value.
+
+        Raises:
+            InvalidCachedValueError: If value can't be decompressed.
+
+        """
+
+        if data.startswith(self._HEADER):
+            try:
+                data = zlib.decompress(self._strip_header(data))
+
+            except zlib.error:
+                raise InvalidCachedValueError
+
+        return self.codec.decode(data)
+
+
+CODECS: dict[str, type[BaseCodec]] = {"json": JSONCodec, "bson": BSONCodec}
+
+
+def get_codec(name: str, compression_threshold: int | None = None) -> BaseCodec:
+    """Returns a codec by name.
+
+    Args:
+        name (str): Codec name, "json" or "bson".
+        compression_threshold (int | None): Minimal size of encoded value in bytes
+        to compress, values are not compressed if it is None. Defaults to None.
+
+    Returns:
+        BaseCodec: Codec.
+
+    """
+
+    codec = CODECS[name]()
+
+    if compression_threshold is None:
+        return codec
+
+    return CompressedCodec(codec=codec, threshold=compression_threshold)
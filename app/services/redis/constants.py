@@ -10,6 +10,21 @@ class RedisNamesEnum(StrEnum):
     RESET_PASSWORD = "reset_password_{user_id}"
     PRODUCT_PARAMETERS_LIST = "product_parameters"
     ROLES_LIST = "roles"
+    AUTHORIZED_USER = "authorized_user_{user_id}"
+    CATEGORY = "category_{category_id}"
+    CATEGORIES = "categories"
+    CATEGORY_TREE = "category_tree"
+    CACHE_INVALIDATION_CHANNEL = "cache_invalidation"
+    CACHE_LOCK = "{name}_lock"
+    PRODUCT_VIEWS = "product_views"
+    PRODUCTS_LEADERBOARD = "products_leaderboard"
+    CATEGORY_PRODUCTS_LEADERBOARD = "products_leaderboard_{category_id}"
+    PRODUCTS_LEADERBOARD_SNAPSHOT = "{name}_snapshot"
+    PRODUCTS_LEADERBOARDS = "products_leaderboards"
+    DIRTY_CATEGORY_PARAMETERS = "dirty_category_parameters"
+    CATEGORY_PARAMETERS_LOCK = "category_parameters_{category_id}_lock"
+    CATEGORY_PARAMETERS_CALCULATED_AT = "category_parameters_calculated_at"
+    CATEGORY_PARAMETERS_REPAIR_LOCK = "category_parameters_repair_lock"
 
 
 class RedisNamesTTLEnum(IntEnum):
@@ -19,3 +34,7 @@ class RedisNamesTTLEnum(IntEnum):
     RESET_PASSWORD = 3600  # 1 hour
     PRODUCT_PARAMETERS_LIST = 3600  # 1 hour
     ROLES_LIST = 3600  # 1 hour
+    AUTHORIZED_USER = 60  # 1 minute
+    CATEGORY = 3600  # 1 hour
+    CATEGORY_TREE = 3600  # 1 hour
+    PRODUCTS_LEADERBOARD = 3600  # 1 hour
@@ -1,18 +1,48 @@
 """Module that contains Redis service."""
 
+import logging
+from collections.abc import AsyncGenerator, AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import Depends
+from injector import inject
+from redis.asyncio.client import Pipeline, PubSub
+from redis.asyncio.lock import Lock
 
+from app.exceptions import InvalidCachedValueError
 from app.services.base import BaseService
 from app.services.redis.client import RedisClient
+from app.services.redis.codecs import BaseCodec, get_codec
+from app.settings import SETTINGS
 
 
+@inject
 class RedisService(BaseService):
     """Redis service facade."""
 
     _name: str = "redis"
 
+    codec: BaseCodec = get_codec(
+        name=SETTINGS.REDIS_CODEC,
+        compression_threshold=SETTINGS.REDIS_COMPRESSION_THRESHOLD,
+    )
+
+    # Explicit read timeout doesn't drop subscription, unlike the socket timeout
+    _SUBSCRIPTION_READ_TIMEOUT = 60.0  # seconds
+
+    # Adds members to the existing sorted set and trims it to the maximal size
+    _ZUPDATE_SCRIPT = """
+        if redis.call("EXISTS", KEYS[1]) == 0 then
+            return 0
+        end
+
+        redis.call("ZADD", KEYS[1], unpack(ARGV, 2))
+
+        return redis.call("ZREMRANGEBYRANK", KEYS[1], 0, -tonumber(ARGV[1]) - 1)
+    """
+    _ZUPDATE_BATCH_SIZE = 1000
+
     def __init__(self, redis_client: RedisClient = Depends()) -> None:
         """Redis service initialization method.
 
@@ -22,6 +52,7 @@ class RedisService(BaseService):
         """
 
         self._client = redis_client.client
+        self._binary_client = redis_client.binary_client
 
     async def get(self, name: str) -> Any:
         """Returns value by name.
@@ -46,6 +77,90 @@ class RedisService(BaseService):
         """
         await self._client.setex(name=name, time=ttl, value=value)
 
+    async def mget(self, names: list[str]) -> list[Any]:
+        """Returns values by names in one round trip.
+
+        Args:
+            names (list[str]): Names to find.
+
+        Returns:
+            list[Any]: Values in order of names, None for missing ones.
+
+        """
+        return list(await self._client.mget(names))
+
+    async def mset_with_ttl(self, mapping: Mapping[str, str], ttl: int) -> None:
+        """Sets name-value pairs with the same TTL into Redis in one round trip.
+
+        Args:
+            mapping (Mapping[str, str]): Values by names.
+            ttl (int): Number of seconds the records will exist.
+
+        """
+
+        async with self.pipeline(transaction=False) as pipeline:
+            for name, value in mapping.items():
+                pipeline.setex(name=name, time=ttl, value=value)
+
+    @asynccontextmanager
+    async def pipeline(
+        self, *, transaction: bool = True
+    ) -> AsyncGenerator[Pipeline, None]:
+        """Buffers commands and sends them in one round trip on exit.
+
+        Args:
+            transaction (bool): Defines if commands are wrapped into MULTI/EXEC,
+            so they are executed atomically. Defaults to True.
+
+        Yields:
+            Pipeline: Pipeline to queue commands in.
+
+        """
+
+        async with self._client.pipeline(transaction=transaction) as pipeline:
+            yield pipeline
+
+            await pipeline.execute()
+
+    async def get_value(self, name: str) -> Any:
+        """Returns decoded value by name.
+
+        Args:
+            name (str): Name to find.
+
+        Returns:
+            Any: Decoded value or None if name is missing or value is encoded by
+            other codec.
+
+        """
+
+        data = await self._binary_client.get(name)
+
+        if data is None:
+            return None
+
+        try:
+            return self.codec.decode(data)
+
+        except InvalidCachedValueError:
+            # Value is overwritten once it is loaded again
+            logging.warning(f"Cached value of '{name}' can't be decoded.")
+
+            return None
+
+    async def set_value(self, name: str, value: Any, ttl: int) -> None:
+        """Encodes a value and sets it by name with TTL into Redis.
+
+        Args:
+            name (str): Name to set.
+            value (Any): Value to set, must be supported by the codec.
+            ttl (int): Number of seconds the record will exist.
+
+        """
+        await self._binary_client.setex(
+            name=name, time=ttl, value=self.codec.encode(value)
+        )
+
     async def delete(self, name: str) -> None:
         """Deletes name-value pair by name.
 
@@ -54,3 +169,299 @@ class RedisService(BaseService):
 
         """
         await self._client.delete(name)
+
+    async def ttl(self, name: str) -> int:
+        """Returns remaining time to live of the name.
+
+        Args:
+            name (str): Name to check.
+
+        Returns:
+            int: Number of seconds, -1 if name doesn't expire or -2 if it is missing.
+
+        """
+        return int(await self._client.ttl(name))
+
+    def lock(self, name: str, timeout: float) -> Lock:
+        """Returns a distributed lock, which is released automatically on timeout.
+
+        Args:
+            name (str): Lock name.
+            timeout (float): Number of seconds the lock can be held.
+
+        Returns:
+            Lock: Non-blocking lock.
+
+        """
+        return self._client.lock(name, timeout=timeout, blocking=False)
+
+    async def unlink(self, name: str) -> None:
+        """Deletes name-value pair by name, memory is reclaimed in background.
+
+        Args:
+            name (str): Name to delete.
+
+        """
+        await self._client.unlink(name)
+
+    async def publish(self, channel: str, message: str) -> None:
+        """Publishes a message to the channel.
+
+        Args:
+            channel (str): Channel name.
+            message (str): Message to publish.
+
+        """
+        await self._client.publish(channel, message)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncGenerator[AsyncIterator[str], None]:
+        """Subscribes to the channel, subscription is confirmed on enter.
+
+        Args:
+            channel (str): Channel name.
+
+        Yields:
+            AsyncIterator[str]: Messages published after subscription.
+
+        """
+
+        async with self._client.pubsub() as pubsub:
+            await pubsub.subscribe(channel)
+
+            # SUBSCRIBE reply is read, so no message published afterwards is lost
+            while True:
+                message = await pubsub.get_message(
+                    timeout=self._SUBSCRIPTION_READ_TIMEOUT
+                )
+
+                if message is not None and message["type"] == "subscribe":
+                    break
+
+            yield self._get_messages(pubsub=pubsub)
+
+    async def _get_messages(self, pubsub: PubSub) -> AsyncGenerator[str, None]:
+        """Yields messages of the subscribed channels.
+
+        Args:
+            pubsub (PubSub): Subscribed pubsub.
+
+        Yields:
+            str: Published message.
+
+        """
+
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=self._SUBSCRIPTION_READ_TIMEOUT,
+            )
+
+            if message is not None:
+                yield message["data"]
+
+    async def zrevrange(self, name: str, start: int, end: int) -> list[str] | None:
+        """Returns members of the sorted set in order of descending scores.
+
+        Args:
+            name (str): Sorted set name.
+            start (int): Index of the first member.
+            end (int): Index of the last member, inclusive.
+
+        Returns:
+            list[str] | None: Members of the range or None if sorted set is missing.
+
+        """
+
+        async with self._client.pipeline(transaction=True) as pipeline:
+            pipeline.exists(name)
+            pipeline.zrevrange(name, start, end)
+
+            exists, members = await pipeline.execute()
+
+        return list(members) if exists else None
+
+    async def zreplace(self, name: str, mapping: Mapping[str, float], ttl: int) -> None:
+        """Replaces the sorted set with members and TTL atomically.
+
+        Args:
+            name (str): Sorted set name.
+            mapping (Mapping[str, float]): Scores by members.
+            ttl (int): Number of seconds the sorted set will exist.
+
+        """
+
+        async with self.pipeline() as pipeline:
+            pipeline.delete(name)
+
+            if mapping:
+                pipeline.zadd(name, dict(mapping))
+                pipeline.expire(name, ttl)
+
+    async def zupdate(
+        self, name: str, mapping: Mapping[str, float], max_size: int
+    ) -> None:
+        """Sets scores of members of the sorted set if it exists.
+
+        The lowest ranked members are removed, so the sorted set doesn't exceed
+        the maximal size. Missing sorted set is not created, so it is never
+        partially filled.
+
+        Args:
+            name (str): Sorted set name.
+            mapping (Mapping[str, float]): Scores by members.
+            max_size (int): Maximal count of members.
+
+        """
+
+        arguments = [
+            str(item) for member, score in mapping.items() for item in (score, member)
+        ]
+
+        # Lua limits count of values to unpack, so members are added in batches
+        for index in range(0, len(arguments), self._ZUPDATE_BATCH_SIZE * 2):
+            await self._client.eval(  # type: ignore[misc]
+                self._ZUPDATE_SCRIPT,
+                1,
+                name,
+                str(max_size),
+                *arguments[index : index + self._ZUPDATE_BATCH_SIZE * 2],
+            )
+
+    async def zadd_nx(self, name: str, mapping: Mapping[str, float]) -> None:
+        """Adds members to the sorted set, scores of existing members are kept.
+
+        Args:
+            name (str): Sorted set name.
+            mapping (Mapping[str, float]): Scores by members.
+
+        """
+        await self._client.zadd(name, dict(mapping), nx=True)
+
+    async def zrangebyscore(self, name: str, max_: float | None = None) -> list[str]:
+        """Returns members of the sorted set which scores don't exceed the maximum.
+
+        Args:
+            name (str): Sorted set name.
+            max_ (float | None): Maximal score, all members are returned if it
+            is None. Defaults to None.
+
+        Returns:
+            list[str]: Members in order of ascending scores.
+
+        """
+        return list(
+            await self._client.zrangebyscore(
+                name, "-inf", "+inf" if max_ is None else max_
+            )
+        )
+
+    async def sadd(self, name: str, members: list[str]) -> None:
+        """Adds members to the set.
+
+        Args:
+            name (str): Set name.
+            members (list[str]): Members to add.
+
+        """
+
+        if members:
+            await self._client.sadd(name, *members)  # type: ignore[misc]
+
+    async def smembers(self, name: str) -> list[str]:
+        """Returns members of the set.
+
+        Args:
+            name (str): Set name.
+
+        Returns:
+            list[str]: Members, empty if set is missing.
+
+        """
+        return list(await self._client.smembers(name))  # type: ignore[misc]
+
+    async def zrem(self, name: str, members: list[str]) -> int:
+        """Removes members from the sorted set.
+
+        Args:
+            name (str): Sorted set name.
+            members (list[str]): Members to remove.
+
+        Returns:
+            int: Count of removed members.
+
+        """
+
+        if not members:
+            return 0
+
+        return int(await self._client.zrem(name, *members))
+
+    async def unlink_by_pattern(self, pattern: str) -> None:
+        """Deletes names which match the pattern, memory is reclaimed in background.
+
+        Args:
+            pattern (str): Glob-style pattern of names.
+
+        """
+
+        names = [name async for name in self._client.scan_iter(match=pattern)]
+
+        if names:
+            await self._client.unlink(*names)
+
+    async def hget(self, name: str, key: str) -> Any:
+        """Returns value of the hash field.
+
+        Args:
+            name (str): Hash name.
+            key (str): Field to find.
+
+        Returns:
+            Any: Value.
+
+        """
+        return await self._client.hget(name, key)  # type: ignore[misc]
+
+    async def hset(self, name: str, key: str, value: str) -> None:
+        """Sets value of the hash field.
+
+        Args:
+            name (str): Hash name.
+            key (str): Field to set.
+            value (str): Value to set.
+
+        """
+        await self._client.hset(name, key, value)  # type: ignore[misc]
+
+    async def hincrby_many(self, name: str, mapping: Mapping[str, int]) -> None:
+        """Increments values of the hash fields in one round trip.
+
+        Args:
+            name (str): Hash name.
+            mapping (Mapping[str, int]): Increments by fields.
+
+        """
+
+        async with self.pipeline(transaction=False) as pipeline:
+            for key, amount in mapping.items():
+                pipeline.hincrby(name, key, amount)
+
+    async def hpopall(self, name: str) -> dict[str, str]:
+        """Returns all the hash fields and deletes the hash atomically.
+
+        Args:
+            name (str): Hash name.
+
+        Returns:
+            dict[str, str]: Values by fields, empty if hash is missing.
+
+        """
+
+        async with self._client.pipeline(transaction=True) as pipeline:
+            pipeline.hgetall(name)
+            pipeline.delete(name)
+
+            fields, _ = await pipeline.execute()
+
+        return dict(fields)
@@ -20,6 +20,7 @@ class AppConfig(ImmutableModel):
     AUTH_ALGORITHM: str = "HS256"
     AUTH_ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     AUTH_REFRESH_TOKEN_EXPIRE_MINUTES: int = 24 * 60  # 24 hours
+    AUTH_TOKEN_CACHE_SIZE: int = 4096
 
     MONGODB_HOST: str
     MONGODB_PORT: int
@@ -27,10 +28,56 @@ class AppConfig(ImmutableModel):
     MONGODB_PASSWORD: str
     MONGODB_NAME: str
     MONGO_AUTH_SOURCE: str
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: int | None = None
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int | None = None
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 30 * 1000  # 30 seconds
+    MONGODB_CONNECT_TIMEOUT_MS: int = 20 * 1000  # 20 seconds
+    MONGODB_SOCKET_TIMEOUT_MS: int | None = None
+    # comma separated list of wire compressors in order of preference, e.g.
+    # "zstd,snappy,zlib" (zstd and snappy require optional python packages)
+    MONGODB_COMPRESSORS: str = ""
+    MONGODB_COMMAND_MONITORING: bool = True
+    MONGODB_SLOW_OPERATION_THRESHOLD_MS: int | None = 100
+    MONGODB_SLOW_OPERATION_EXPLAIN: bool = False
+    MONGODB_SLOW_OPERATION_EXPLAIN_INTERVAL: float = 60  # seconds between explains
+
+    # product views are buffered in process memory and written to the database
+    # once per interval in seconds or once product reaches the pending views cap
+    PRODUCT_VIEWS_FLUSH_INTERVAL: int = 10
+    PRODUCT_VIEWS_MAX_PENDING: int = 100
+    # count of the most viewed products served from Redis leaderboards
+    PRODUCTS_LEADERBOARD_SIZE: int = 1000
+
+    # category parameters are recalculated once per window in seconds, however
+    # many times the category is requested to be recalculated during the window
+    CATEGORY_PARAMETERS_RECALCULATION_DELAY: int = 5
+    CATEGORY_PARAMETERS_RECALCULATION_INTERVAL: int = 1
+    # counts of values of all categories are recalculated once per interval in
+    # seconds, so counts which went out of sync are repaired
+    CATEGORY_PARAMETERS_REPAIR_INTERVAL: int = 86400
+
+    # count of threads which hash and verify passwords
+    PASSWORD_HASHING_WORKERS: int = 4
 
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_PASSWORD: str
+    # size of connection pool per client, requests wait for a free connection
+    # up to pool timeout, socket timeouts are in seconds, None disables them
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: int | None = 5
+    REDIS_SOCKET_TIMEOUT: float | None = 5
+    REDIS_SOCKET_CONNECT_TIMEOUT: float | None = 5
+    # in-process cache in front of Redis, entries of all workers are invalidated
+    # via pub/sub, TTL in seconds bounds staleness if a message is lost
+    REDIS_LOCAL_CACHE_SIZE: int = 1024
+    REDIS_LOCAL_CACHE_TTL: int = 60
+    # codec of cached values ("bson" or "json"), encoded values which are larger
+    # than threshold in bytes are compressed, None disables compression
+    REDIS_CODEC: str = "bson"
+    REDIS_COMPRESSION_THRESHOLD: int | None = 1024
 
     SEND_GRID_API_KEY: str
     SEND_GRID_SENDER_EMAIL: str
@@ -9,9 +9,16 @@ import pytest
 import pytest_asyncio
 from _pytest.fixtures import SubRequest
 from httpx import ASGITransport, AsyncClient
+from injector import Injector
 from motor.motor_asyncio import AsyncIOMotorClient
 
+from app.api.v1.buffers.product import ProductViewsBuffer
+from app.api.v1.caches.product import ProductsLeaderboardCache
+from app.api.v1.schedulers.category import CategoryParametersScheduler
 from app.app import app
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum
+from app.services.redis.service import RedisService
 from app.tests import BaseTest
 from app.tests.constants import FROZEN_DATETIME
 from app.tests.fixtures.manager import FileFixtureManager
@@ -40,6 +47,26 @@ class BaseAPITest(BaseTest):
         ):
             yield
 
+    @pytest.fixture(autouse=True)
+    def local_cache(self) -> Generator[None, None, None]:
+        """Clears in-process cache, so tests don't share cached values."""
+
+        TwoTierCache.clear_local()
+
+        yield
+
+        TwoTierCache.clear_local()
+
+    @pytest.fixture(autouse=True)
+    def product_views_buffer(self) -> Generator[None, None, None]:
+        """Drops buffered product views, so tests don't flush views of others."""
+
+        ProductViewsBuffer.clear()
+
+        yield
+
+        ProductViewsBuffer.clear()
+
     @pytest.fixture
     def datetime_now_mock(self) -> Generator[MagicMock, None, None]:
         """Arrow datetime now mock."""
@@ -104,10 +131,26 @@ class BaseAPITest(BaseTest):
             collection_names=getattr(request, "param", None)
         )
 
+        # Dirty categories refer to products of other tests
+        category_parameters_scheduler = Injector().get(CategoryParametersScheduler)
+
+        # Fixture users are cached by the same identifiers in every test
+        redis_service = Injector().get(RedisService)
+
+        # Leaderboards rank fixture products loaded by other tests
+        leaderboard_cache = Injector().get(ProductsLeaderboardCache)
+
         await file_fixture_manager.clear()
+        await category_parameters_scheduler.clear()
+        await redis_service.unlink_by_pattern(
+            pattern=RedisNamesEnum.AUTHORIZED_USER.format(user_id="*")
+        )
+        await leaderboard_cache.clear()
 
         await file_fixture_manager.load()
 
         yield
 
         await file_fixture_manager.clear()
+        await category_parameters_scheduler.clear()
+        await leaderboard_cache.clear()
@@ -0,0 +1,97 @@
+"""Module that contains tests for product buffers."""
+
+import asyncio
+from collections.abc import Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from bson import ObjectId
+from injector import Injector
+from pymongo.errors import BulkWriteError
+
+from app.api.v1.buffers.product import ProductViewsBuffer
+from app.api.v1.repositories.product import ProductRepository
+from app.services.redis.constants import RedisNamesEnum
+from app.services.redis.service import RedisService
+from app.settings import SETTINGS
+from app.tests import BaseTest
+
+FLUSHED_ID = ObjectId("6607f143c064f4099808ad33")
+FAILED_ID = ObjectId("6597f143c064f4099808ad26")
+
+
+class TestProductViewsBuffer(BaseTest):
+    """Test class for product views buffer."""
+
+    @pytest.fixture(autouse=True)
+    def views(self) -> Generator[None, None, None]:
+        """Drops pending views, so tests don't share them."""
+
+        ProductViewsBuffer.clear()
+
+        yield
+
+        ProductViewsBuffer.clear()
+
+    @pytest.mark.asyncio
+    async def test_flush_saves_failed_increments(self) -> None:
+        """Test only views of failed increments are saved to be flushed later."""
+
+        buffer = Injector().get(ProductViewsBuffer)
+
+        buffer.add(id_=FLUSHED_ID)
+        buffer.add(id_=FAILED_ID)
+        buffer.add(id_=FAILED_ID)
+
+        flushed_views = ProductViewsBuffer.get_statistics().flushed_views
+
+        error = BulkWriteError(
+            {
+                "writeErrors": [{"index": 1, "code": 14, "errmsg": "TypeMismatch"}],
+                "nModified": 1,
+            }
+        )
+
+        with (
+            patch.object(RedisService, "hpopall", new=AsyncMock(return_value={})),
+            patch.object(RedisService, "hincrby_many", new=AsyncMock()) as save_mock,
+            patch.object(
+                ProductRepository, "increment_views", new=AsyncMock(side_effect=error)
+            ),
+            patch.object(
+                ProductViewsBuffer, "_update_leaderboards", new=AsyncMock()
+            ) as update_leaderboards_mock,
+        ):
+            await buffer.flush()
+
+        save_mock.assert_called_once_with(
+            name=RedisNamesEnum.PRODUCT_VIEWS, mapping={str(FAILED_ID): 2}
+        )
+        update_leaderboards_mock.assert_called_once_with(ids=[FLUSHED_ID])
+
+        assert ProductViewsBuffer.get_statistics().flushed_views == flushed_views + 1
+
+    @pytest.mark.asyncio
+    async def test_run_after_failed_flush(self) -> None:
+        """Test unexpected error of a flush doesn't stop the following flushes."""
+
+        buffer = Injector().get(ProductViewsBuffer)
+
+        with (
+            patch(
+                "app.api.v1.buffers.product.SETTINGS",
+                SETTINGS.model_copy(update={"PRODUCT_VIEWS_FLUSH_INTERVAL": 0}),
+            ),
+            patch.object(
+                ProductViewsBuffer,
+                "flush",
+                new=AsyncMock(side_effect=[ValueError, asyncio.CancelledError]),
+            ) as flush_mock,
+            patch("logging.error") as error_mock,
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await buffer.run()
+
+        assert flush_mock.call_count == 2  # noqa: PLR2004
+
+        error_mock.assert_called_once()
@@ -0,0 +1,221 @@
+"""Module that contains tests for category caches."""
+
+from collections.abc import Generator, Mapping
+from typing import Any
+from unittest.mock import AsyncMock, call, patch
+
+import pytest
+from bson import ObjectId
+from injector import Injector
+
+from app.api.v1.caches.category import CategoryCache, CategoryTree, CategoryTreeCache
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum
+from app.services.redis.service import RedisService
+from app.tests import BaseTest
+
+ROOT_ID = ObjectId("65d24f2a260fb739c605b28a")
+LAPTOPS_ID = ObjectId("65d24f2a260fb739c605b28b")
+GAMING_LAPTOPS_ID = ObjectId("65d24f2a260fb739c605b28c")
+LAPTOP_BAGS_ID = ObjectId("65d24f2a260fb739c605b28d")
+BROKEN_ID = ObjectId("65d24f2a260fb739c605b28e")
+CATEGORIES: list[Mapping[str, Any]] = [
+    {"_id": ROOT_ID, "parent_id": None, "path": "/electronics"},
+    {"_id": LAPTOPS_ID, "parent_id": ROOT_ID, "path": "/electronics/laptops"},
+    {
+        "_id": GAMING_LAPTOPS_ID,
+        "parent_id": LAPTOPS_ID,
+        "path": "/electronics/laptops/gaming",
+    },
+    {
+        "_id": LAPTOP_BAGS_ID,
+        "parent_id": ROOT_ID,
+        "path": "/electronics/laptops-bags",
+    },
+    # Category refers to itself
+    {"_id": BROKEN_ID, "parent_id": BROKEN_ID, "path": "/broken"},
+]
+
+
+class TestCategoryTree(BaseTest):
+    """Test class for category tree index."""
+
+    def test_leafs(self) -> None:
+        """Test categories without children are leafs."""
+
+        tree = CategoryTree(categories=CATEGORIES)
+
+        assert tree.leaf_ids == {GAMING_LAPTOPS_ID, LAPTOP_BAGS_ID, BROKEN_ID}
+        assert tree.is_leaf(id_=GAMING_LAPTOPS_ID) is True
+        assert tree.is_leaf(id_=LAPTOPS_ID) is False
+
+    def test_unknown_category_is_not_leaf(self) -> None:
+        """Test category which is not in the tree is not a leaf."""
+
+        tree = CategoryTree(categories=CATEGORIES)
+
+        assert ObjectId() not in tree
+        assert tree.is_leaf(id_=ObjectId()) is False
+
+    def test_category_which_refers_to_itself(self) -> None:
+        """Test category which is its own parent is not a child of its own."""
+
+        tree = CategoryTree(categories=CATEGORIES)
+
+        assert tree.is_leaf(id_=BROKEN_ID) is True
+        assert tree.get_children(id_=BROKEN_ID) == []
+        assert tree.get_subtree_ids(id_=BROKEN_ID) == {BROKEN_ID}
+        assert tree.get_breadcrumbs(id_=BROKEN_ID) == [CATEGORIES[4]]
+
+    def test_get_children(self) -> None:
+        """Test only direct children of the category are returned."""
+
+        tree = CategoryTree(categories=CATEGORIES)
+
+        assert tree.get_children(id_=ROOT_ID) == [CATEGORIES[1], CATEGORIES[3]]
+        assert tree.get_children(id_=GAMING_LAPTOPS_ID) == []
+
+    def test_get_subtree_ids(self) -> None:
+        """Test subtree contains the category and all its descendants."""
+
+        tree = CategoryTree(categories=CATEGORIES)
+
+        assert tree.get_subtree_ids(id_=ROOT_ID) == {
+            ROOT_ID,
+            LAPTOPS_ID,
+            GAMING_LAPTOPS_ID,
+            LAPTOP_BAGS_ID,
+        }
+        assert tree.get_subtree_ids(id_=LAPTOPS_ID) == {LAPTOPS_ID, GAMING_LAPTOPS_ID}
+        assert tree.get_subtree_ids(id_=ObjectId()) == frozenset()
+
+    def test_get_breadcrumbs(self) -> None:
+        """Test breadcrumbs start from the root and end with the category."""
+
+        tree = CategoryTree(categories=CATEGORIES)
+
+        assert tree.get_breadcrumbs(id_=GAMING_LAPTOPS_ID) == CATEGORIES[:3]
+        assert tree.get_breadcrumbs(id_=ObjectId()) == []
+
+    def test_get_ids_by_path(self) -> None:
+        """Test categories are found by the beginning of their paths."""
+
+        tree = CategoryTree(categories=CATEGORIES)
+
+        ids = tree.get_ids_by_path(path="/electronics/laptops")
+
+        assert ids == {LAPTOPS_ID, GAMING_LAPTOPS_ID, LAPTOP_BAGS_ID}
+        assert tree.get_ids_by_path(path="/electronics/laptops") is ids
+
+
+class TestCategoryTreeCache(BaseTest):
+    """Test class for category tree cache."""
+
+    @pytest.fixture(autouse=True)
+    def tree(self) -> Generator[None, None, None]:
+        """Drops the built index, so tests don't share it."""
+
+        CategoryTreeCache._tree = None
+
+        yield
+
+        CategoryTreeCache._tree = None
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_reloads_tree_without_category(self) -> None:
+        """Test categories are reloaded if the existing category is missing."""
+
+        cache = Injector().get(CategoryTreeCache)
+        loader = AsyncMock()
+
+        with (
+            patch.object(
+                TwoTierCache,
+                "get_or_load",
+                new=AsyncMock(side_effect=[CATEGORIES[:1], CATEGORIES]),
+            ),
+            patch.object(TwoTierCache, "delete", new=AsyncMock()) as delete_mock,
+        ):
+            tree = await cache.get_or_load(loader=loader, category_id=LAPTOPS_ID)
+
+        assert LAPTOPS_ID in tree
+
+        delete_mock.assert_called_once_with(name=RedisNamesEnum.CATEGORY_TREE)
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_keeps_tree_with_category(self) -> None:
+        """Test categories are not reloaded if the category is in the tree."""
+
+        cache = Injector().get(CategoryTreeCache)
+        loader = AsyncMock()
+
+        with (
+            patch.object(
+                TwoTierCache, "get_or_load", new=AsyncMock(return_value=CATEGORIES)
+            ),
+            patch.object(TwoTierCache, "delete", new=AsyncMock()) as delete_mock,
+        ):
+            tree = await cache.get_or_load(loader=loader, category_id=LAPTOPS_ID)
+
+        assert LAPTOPS_ID in tree
+
+        delete_mock.assert_not_called()
+
+
+class TestCategoryCache(BaseTest):
+    """Test class for category cache."""
+
+    @pytest.fixture(autouse=True)
+    def local_cache(self) -> Generator[None, None, None]:
+        """Clears in-process cache, so tests don't share cached values."""
+
+        TwoTierCache.clear_local()
+
+        yield
+
+        TwoTierCache.clear_local()
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_tracks_loaded_category(self) -> None:
+        """Test identifier of the loaded category is tracked for invalidation."""
+
+        cache = Injector().get(CategoryCache)
+
+        with (
+            patch("redis.asyncio.Redis.get", new=AsyncMock(return_value=None)),
+            patch("redis.asyncio.Redis.setex", new=AsyncMock()),
+            patch.object(RedisService, "lock") as lock_mock,
+            patch.object(RedisService, "sadd", new=AsyncMock()) as sadd_mock,
+        ):
+            lock_mock.return_value.acquire = AsyncMock(return_value=True)
+            lock_mock.return_value.owned = AsyncMock(return_value=True)
+            lock_mock.return_value.release = AsyncMock()
+
+            category = await cache.get_or_load(
+                id_=LAPTOPS_ID, loader=AsyncMock(return_value=CATEGORIES[1])
+            )
+
+        assert category == CATEGORIES[1]
+
+        sadd_mock.assert_called_once_with(
+            name=RedisNamesEnum.CATEGORIES, members=[str(LAPTOPS_ID)]
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_tracked_categories(self) -> None:
+        """Test all tracked categories are dropped without scanning."""
+
+        cache = Injector().get(CategoryCache)
+        ids = [str(ROOT_ID), str(LAPTOPS_ID)]
+
+        with (
+            patch.object(RedisService, "smembers", new=AsyncMock(return_value=ids)),
+            patch.object(RedisService, "unlink", new=AsyncMock()) as unlink_mock,
+            patch.object(TwoTierCache, "delete", new=AsyncMock()) as delete_mock,
+        ):
+            await cache.invalidate()
+
+        assert delete_mock.call_args_list == [
+            call(name=RedisNamesEnum.CATEGORY.format(category_id=id_)) for id_ in ids
+        ]
+        unlink_mock.assert_called_once_with(name=RedisNamesEnum.CATEGORIES)
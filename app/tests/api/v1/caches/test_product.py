@@ -0,0 +1,136 @@
+"""Module that contains tests for product caches."""
+
+import asyncio
+from collections.abc import Generator, Mapping
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+from bson import ObjectId
+from injector import Injector
+
+from app.api.v1.caches.product import ProductsLeaderboardCache
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum
+from app.services.redis.service import RedisService
+from app.tests import BaseTest
+
+CATEGORY_ID = ObjectId("65d24f2a260fb739c605b28d")
+OTHER_CATEGORY_ID = ObjectId("65d24f2a260fb739c605b28e")
+PRODUCTS: list[Mapping[str, Any]] = [
+    {"_id": ObjectId("6607f143c064f4099808ad33"), "views": 1500},
+    {"_id": ObjectId("6597f143c064f4099808ad26"), "views": 1452},
+    {"_id": ObjectId("6627f143c064f4099808ad35"), "views": 982},
+]
+
+
+class TestProductsLeaderboardCache(BaseTest):
+    """Test class for products leaderboard cache."""
+
+    @pytest.fixture(autouse=True)
+    def local_cache(self) -> Generator[None, None, None]:
+        """Clears in-process cache, so tests don't share cached values."""
+
+        TwoTierCache.clear_local()
+
+        yield
+
+        TwoTierCache.clear_local()
+
+    @pytest.fixture
+    def redis_mock(self) -> Generator[None, None, None]:
+        """Redis operations mock, where leaderboards and rankings are missing."""
+
+        lock = MagicMock(
+            acquire=AsyncMock(return_value=True),
+            owned=AsyncMock(return_value=True),
+            release=AsyncMock(),
+        )
+
+        with (
+            patch("redis.asyncio.Redis.get", new=AsyncMock(return_value=None)),
+            patch("redis.asyncio.Redis.setex", new=AsyncMock()),
+            patch.object(RedisService, "lock", return_value=lock),
+            patch.object(RedisService, "zrevrange", new=AsyncMock(return_value=None)),
+            patch.object(RedisService, "zreplace", new=AsyncMock()),
+            patch.object(RedisService, "sadd", new=AsyncMock()),
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_get_or_build_builds_once(self, redis_mock: None) -> None:
+        """Test concurrent misses wait for a single build of the leaderboard."""
+
+        cache = Injector().get(ProductsLeaderboardCache)
+        loads = 0
+
+        async def loader() -> list[Mapping[str, Any]]:
+            nonlocal loads
+
+            loads += 1
+
+            await asyncio.sleep(0)
+
+            return PRODUCTS
+
+        results = await asyncio.gather(
+            cache.get_or_build(category_id=CATEGORY_ID, start=0, end=1, loader=loader),
+            cache.get_or_build(category_id=CATEGORY_ID, start=1, end=2, loader=loader),
+        )
+
+        assert loads == 1
+        assert list(results) == [
+            [PRODUCTS[0]["_id"], PRODUCTS[1]["_id"]],
+            [PRODUCTS[1]["_id"], PRODUCTS[2]["_id"]],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_leaderboards_of_categories(self) -> None:
+        """Test only global leaderboard and ones of the categories are dropped."""
+
+        cache = Injector().get(ProductsLeaderboardCache)
+
+        with (
+            patch.object(RedisService, "unlink", new=AsyncMock()) as unlink_mock,
+            patch.object(TwoTierCache, "delete", new=AsyncMock()) as delete_mock,
+        ):
+            await cache.invalidate(category_ids=[CATEGORY_ID])
+
+        names = [
+            RedisNamesEnum.PRODUCTS_LEADERBOARD,
+            RedisNamesEnum.CATEGORY_PRODUCTS_LEADERBOARD.format(
+                category_id=CATEGORY_ID
+            ),
+        ]
+
+        assert unlink_mock.call_args_list == [call(name=name) for name in names]
+        assert delete_mock.call_args_list == [
+            call(name=RedisNamesEnum.PRODUCTS_LEADERBOARD_SNAPSHOT.format(name=name))
+            for name in names
+        ]
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_tracked_leaderboards(self) -> None:
+        """Test leaderboards are dropped by tracked names without scanning."""
+
+        cache = Injector().get(ProductsLeaderboardCache)
+        name = RedisNamesEnum.CATEGORY_PRODUCTS_LEADERBOARD.format(
+            category_id=OTHER_CATEGORY_ID
+        )
+
+        with (
+            patch.object(RedisService, "smembers", new=AsyncMock(return_value=[name])),
+            patch.object(RedisService, "unlink", new=AsyncMock()) as unlink_mock,
+            patch.object(TwoTierCache, "delete", new=AsyncMock()) as delete_mock,
+            patch.object(RedisService, "unlink_by_pattern") as unlink_by_pattern_mock,
+        ):
+            await cache.clear()
+
+        assert unlink_mock.call_args_list == [
+            call(name=name),
+            call(name=RedisNamesEnum.PRODUCTS_LEADERBOARDS),
+        ]
+        delete_mock.assert_called_once_with(
+            name=RedisNamesEnum.PRODUCTS_LEADERBOARD_SNAPSHOT.format(name=name)
+        )
+        unlink_by_pattern_mock.assert_not_called()
@@ -0,0 +1,195 @@
+"""Module that contains tests for user caches."""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Generator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from bson import ObjectId
+from injector import Injector
+
+from app.api.v1.caches.user import AuthorizedUserCache
+from app.api.v1.constants import RolesEnum
+from app.api.v1.models.user import AuthorizedUser
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum, RedisNamesTTLEnum
+from app.services.redis.service import RedisService
+from app.settings import SETTINGS
+from app.tests import BaseTest
+
+
+class TestAuthorizedUserCache(BaseTest):
+    """Test class for authorized user cache."""
+
+    _user = AuthorizedUser(
+        id=ObjectId("65844f12b6de26d7a5d4a112"),
+        email_verified=True,
+        roles=[RolesEnum.CUSTOMER],
+        deleted=False,
+    )
+    _name = RedisNamesEnum.AUTHORIZED_USER.format(user_id=_user.id)
+
+    @pytest.fixture(autouse=True)
+    def local_cache(self) -> Generator[None, None, None]:
+        """Clears in-process cache, so tests don't share cached values."""
+
+        TwoTierCache.clear_local()
+
+        yield
+
+        TwoTierCache.clear_local()
+
+    @pytest.fixture
+    def redis_get_mock(self) -> Generator[AsyncMock, None, None]:
+        """Redis get operation mock, which returns nothing by default."""
+
+        with patch("redis.asyncio.Redis.get", new=AsyncMock()) as mock:
+            mock.return_value = None
+
+            yield mock
+
+    @pytest.fixture
+    def redis_setex_mock(self) -> Generator[AsyncMock, None, None]:
+        """Redis setex operation mock."""
+
+        with patch("redis.asyncio.Redis.setex", new=AsyncMock()) as mock:
+            yield mock
+
+    @pytest.mark.asyncio
+    async def test_set_caches_authorization_fields(
+        self, redis_setex_mock: AsyncMock
+    ) -> None:
+        """Test user is cached under own expiring name without other fields."""
+
+        cache = Injector().get(AuthorizedUserCache)
+
+        await cache.set(user=self._user)
+
+        redis_setex_mock.assert_called_once()
+
+        kwargs = redis_setex_mock.call_args.kwargs
+
+        assert kwargs["name"] == self._name
+        assert kwargs["time"] == RedisNamesTTLEnum.AUTHORIZED_USER.value
+        assert RedisService.codec.decode(kwargs["value"]) == {
+            "_id": self._user.id,
+            "email_verified": True,
+            "roles": [RolesEnum.CUSTOMER],
+            "deleted": False,
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_hits_memory(
+        self, redis_get_mock: AsyncMock, redis_setex_mock: AsyncMock
+    ) -> None:
+        """Test cached user is returned from process memory."""
+
+        cache = Injector().get(AuthorizedUserCache)
+
+        await cache.set(user=self._user)
+
+        assert await cache.get(id_=self._user.id) == self._user
+
+        redis_get_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_hits_redis(self, redis_get_mock: AsyncMock) -> None:
+        """Test user cached by other worker is returned from Redis once."""
+
+        cache = Injector().get(AuthorizedUserCache)
+
+        redis_get_mock.return_value = RedisService.codec.encode(
+            {
+                "_id": self._user.id,
+                "email_verified": True,
+                "roles": [RolesEnum.CUSTOMER],
+                "deleted": False,
+            }
+        )
+
+        assert await cache.get(id_=self._user.id) == self._user
+        assert await cache.get(id_=self._user.id) == self._user
+
+        redis_get_mock.assert_called_once_with(self._name)
+
+    @pytest.mark.asyncio
+    async def test_get_misses_expired_user(
+        self, redis_get_mock: AsyncMock, redis_setex_mock: AsyncMock
+    ) -> None:
+        """Test user is missing once it is expired in memory and in Redis."""
+
+        cache = Injector().get(AuthorizedUserCache)
+
+        await cache.set(user=self._user)
+
+        expired_at = time.monotonic() + SETTINGS.REDIS_LOCAL_CACHE_TTL + 1
+
+        with patch("app.utils.lru.time.monotonic", return_value=expired_at):
+            assert await cache.get(id_=self._user.id) is None
+
+        redis_get_mock.assert_called_once_with(self._name)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_publishes_name(self) -> None:
+        """Test invalidated user is deleted in Redis and published to workers."""
+
+        cache = Injector().get(AuthorizedUserCache)
+
+        with (
+            patch("redis.asyncio.Redis.delete", new=AsyncMock()) as redis_delete_mock,
+            patch("redis.asyncio.Redis.publish", new=AsyncMock()) as publish_mock,
+        ):
+            await cache.invalidate(id_=self._user.id)
+
+        redis_delete_mock.assert_called_once_with(self._name)
+        publish_mock.assert_called_once_with(
+            RedisNamesEnum.CACHE_INVALIDATION_CHANNEL, self._name
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidation_by_other_worker(
+        self, redis_get_mock: AsyncMock, redis_setex_mock: AsyncMock
+    ) -> None:
+        """Test user invalidated by other worker is dropped from process memory."""
+
+        cache = Injector().get(AuthorizedUserCache)
+        messages: asyncio.Queue[str] = asyncio.Queue()
+        subscribed = asyncio.Event()
+
+        async def get_messages() -> AsyncGenerator[str, None]:
+            while True:
+                yield await messages.get()
+
+        @asynccontextmanager
+        async def subscribe(
+            _: RedisService, channel: str
+        ) -> AsyncGenerator[AsyncIterator[str], None]:
+            assert channel == RedisNamesEnum.CACHE_INVALIDATION_CHANNEL
+
+            subscribed.set()
+
+            yield get_messages()
+
+        with patch.object(RedisService, "subscribe", new=subscribe):
+            listener = asyncio.create_task(cache.cache.listen_invalidations())
+
+            await subscribed.wait()
+
+            await cache.set(user=self._user)
+
+            assert await cache.get(id_=self._user.id) == self._user
+
+            messages.put_nowait(self._name)
+
+            while not messages.empty():
+                await asyncio.sleep(0)
+
+            await asyncio.sleep(0)
+
+            listener.cancel()
+
+        assert await cache.get(id_=self._user.id) is None
+
+        redis_get_mock.assert_called_once_with(self._name)
@@ -0,0 +1,251 @@
+"""Module that contains tests for base repository."""
+
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import aclosing
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+from injector import Injector
+
+from app.api.v1.models import Pagination, Search
+from app.api.v1.repositories.product import ProductRepository
+from app.services.mongo.service import MongoDBService
+from app.tests import BaseTest
+from app.utils.cursor import Cursor
+
+PRODUCTS: list[Mapping[str, Any]] = [
+    {"_id": ObjectId("6607f143c064f4099808ad33"), "name": "Laptop", "views": 15},
+    {"_id": ObjectId("6597f143c064f4099808ad26"), "name": "Laptop bag", "views": 9},
+]
+PRODUCTS_PROJECTION: Mapping[str, Any] = {
+    "description": 0,
+    "html_body": 0,
+    "parameters": 0,
+}
+
+
+class TestBaseRepository(BaseTest):
+    """Test class for base repository."""
+
+    @pytest.mark.asyncio
+    async def test_get_and_count_page(self) -> None:
+        """Test page and total are retrieved by a single aggregation."""
+
+        repository = Injector().get(ProductRepository)
+
+        with (
+            patch.object(
+                MongoDBService,
+                "aggregate",
+                new=AsyncMock(
+                    return_value=[{"data": PRODUCTS, "total": [{"total": 3}]}]
+                ),
+            ) as aggregate_mock,
+            patch.object(MongoDBService, "find") as find_mock,
+            patch.object(MongoDBService, "count_documents") as count_documents_mock,
+        ):
+            result = await repository._get_and_count(
+                filter_={"available": True},
+                pagination=Pagination(page=2, page_size=2),
+            )
+
+        assert result == {"data": PRODUCTS, "total": 3}
+
+        aggregate_mock.assert_called_once_with(
+            collection="products",
+            pipeline=[
+                {"$match": {"available": True}},
+                {
+                    "$facet": {
+                        "data": [
+                            {"$sort": {"views": -1, "_id": -1}},
+                            {"$skip": 2},
+                            {"$limit": 2},
+                            {"$project": PRODUCTS_PROJECTION},
+                        ],
+                        "total": [{"$count": "total"}],
+                    }
+                },
+            ],
+            session=None,
+            cursor_length=1,
+        )
+        find_mock.assert_not_called()
+        count_documents_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_and_count_search(self) -> None:
+        """Test search results and total are retrieved by a single aggregation."""
+
+        repository = Injector().get(ProductRepository)
+
+        with patch.object(
+            MongoDBService,
+            "aggregate",
+            new=AsyncMock(return_value=[{"data": PRODUCTS, "total": [{"total": 2}]}]),
+        ) as aggregate_mock:
+            result = await repository._get_and_count(
+                filter_={"$text": {"$search": "laptop"}},
+                search=Search(search="laptop"),
+            )
+
+        assert result == {"data": PRODUCTS, "total": 2}
+
+        aggregate_mock.assert_called_once_with(
+            collection="products",
+            pipeline=[
+                {"$match": {"$text": {"$search": "laptop"}}},
+                {
+                    "$facet": {
+                        "data": [
+                            {"$sort": {"score": {"$meta": "textScore"}}},
+                            {"$project": PRODUCTS_PROJECTION},
+                        ],
+                        "total": [{"$count": "total"}],
+                    }
+                },
+            ],
+            session=None,
+            cursor_length=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_and_count_empty(self) -> None:
+        """Test total is zero if nothing is matched."""
+
+        repository = Injector().get(ProductRepository)
+
+        # "$count" stage outputs nothing for an empty input
+        with patch.object(
+            MongoDBService,
+            "aggregate",
+            new=AsyncMock(return_value=[{"data": [], "total": []}]),
+        ):
+            result = await repository._get_and_count(filter_={"available": False})
+
+        assert result == {"data": [], "total": 0}
+
+    @pytest.mark.asyncio
+    async def test_get_and_count_session(self) -> None:
+        """Test aggregation is a part of the passed transaction."""
+
+        repository = Injector().get(ProductRepository)
+        session = MagicMock()
+
+        with patch.object(
+            MongoDBService,
+            "aggregate",
+            new=AsyncMock(return_value=[{"data": PRODUCTS, "total": [{"total": 2}]}]),
+        ) as aggregate_mock:
+            await repository._get_and_count(session=session)
+
+        assert aggregate_mock.call_args.kwargs["session"] is session
+
+    @pytest.mark.asyncio
+    async def test_get_and_count_keyset_page(self) -> None:
+        """Test keyset page is found by the index and counted separately."""
+
+        repository = Injector().get(ProductRepository)
+        after = Cursor.from_document(
+            sorting=[("views", -1), ("_id", -1)], document=PRODUCTS[-1]
+        ).encode()
+
+        with (
+            patch.object(MongoDBService, "aggregate") as aggregate_mock,
+            patch.object(
+                MongoDBService, "find", new=AsyncMock(return_value=PRODUCTS)
+            ) as find_mock,
+            patch.object(
+                MongoDBService, "count_documents", new=AsyncMock(return_value=4)
+            ),
+        ):
+            result = await repository._get_and_count(
+                pagination=Pagination(page=1, page_size=2, after=after)
+            )
+
+        assert result == {"data": PRODUCTS, "total": 4}
+
+        assert find_mock.call_args.kwargs["skip"] is None
+        aggregate_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_iter_get_by_batches(self) -> None:
+        """Test all documents are yielded with the passed batch size."""
+
+        repository = Injector().get(ProductRepository)
+        batch_sizes = []
+
+        async def iter_find(
+            *_: Any, batch_size: int | None = None, **__: Any
+        ) -> AsyncGenerator[Mapping[str, Any], None]:
+            batch_sizes.append(batch_size)
+
+            for document in PRODUCTS:
+                yield document
+
+        with patch.object(MongoDBService, "iter_find", new=iter_find):
+            documents = [
+                document async for document in repository.iter_get(batch_size=1)
+            ]
+
+        assert documents == PRODUCTS
+        assert batch_sizes == [1]
+
+    @pytest.mark.asyncio
+    async def test_iter_get_stopped_early(self) -> None:
+        """Test documents generator of the service is closed with the consumer."""
+
+        repository = Injector().get(ProductRepository)
+        closed = False
+
+        async def iter_find(
+            *_: Any, **__: Any
+        ) -> AsyncGenerator[Mapping[str, Any], None]:
+            nonlocal closed
+
+            try:
+                for document in PRODUCTS:
+                    yield document
+
+            finally:
+                closed = True
+
+        with patch.object(MongoDBService, "iter_find", new=iter_find):
+            async with aclosing(repository.iter_get(batch_size=1)) as documents:
+                async for _ in documents:
+                    break
+
+        assert closed is True
+
+    @pytest.mark.asyncio
+    async def test_create(self) -> None:
+        """Test created document is returned as stored without reading it again."""
+
+        repository = Injector().get(ProductRepository)
+        id_ = ObjectId("6607f143c064f4099808ad40")
+
+        with (
+            patch.object(
+                MongoDBService, "insert_one", new=AsyncMock(return_value=id_)
+            ) as insert_one_mock,
+            patch.object(MongoDBService, "find_one") as find_one_mock,
+        ):
+            document = await repository._create(
+                document={
+                    "name": "Laptop",
+                    "created_at": datetime(2024, 1, 1, 10, 0, 0, 123456, tzinfo=UTC),
+                }
+            )
+
+        # BSON datetime has no timezone and keeps milliseconds only
+        assert document == {
+            "_id": id_,
+            "name": "Laptop",
+            "created_at": datetime(2024, 1, 1, 10, 0, 0, 123000),
+        }
+
+        insert_one_mock.assert_called_once()
+        find_one_mock.assert_not_called()
@@ -0,0 +1,56 @@
+"""Module that contains tests for parameter repository."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from injector import Injector
+
+from app.api.v1.caches.category import CategoryCache
+from app.api.v1.caches.parameter import ParametersCache
+from app.api.v1.repositories.parameter import ParameterRepository
+from app.services.mongo.service import MongoDBService
+from app.tests import BaseTest
+
+
+class TestParameterRepository(BaseTest):
+    """Test class for parameter repository."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_invalidates_caches(self) -> None:
+        """Test parameters and categories, which contain them, are dropped."""
+
+        repository = Injector().get(ParameterRepository)
+
+        with (
+            patch.object(MongoDBService, "insert_many", new=AsyncMock()),
+            patch.object(
+                ParametersCache, "invalidate", new=AsyncMock()
+            ) as parameters_invalidate_mock,
+            patch.object(
+                CategoryCache, "invalidate", new=AsyncMock()
+            ) as categories_invalidate_mock,
+        ):
+            await repository.create_many(documents=[{"machine_name": "brand"}])
+
+        parameters_invalidate_mock.assert_called_once()
+        categories_invalidate_mock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_all_invalidates_caches(self) -> None:
+        """Test cached parameters and categories are dropped on delete."""
+
+        repository = Injector().get(ParameterRepository)
+
+        with (
+            patch.object(MongoDBService, "delete_many", new=AsyncMock()),
+            patch.object(
+                ParametersCache, "invalidate", new=AsyncMock()
+            ) as parameters_invalidate_mock,
+            patch.object(
+                CategoryCache, "invalidate", new=AsyncMock()
+            ) as categories_invalidate_mock,
+        ):
+            await repository.delete_all()
+
+        parameters_invalidate_mock.assert_called_once()
+        categories_invalidate_mock.assert_called_once()
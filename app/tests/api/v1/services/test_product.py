@@ -0,0 +1,48 @@
+"""Module that contains tests for product services."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+from fastapi import BackgroundTasks
+from redis.exceptions import RedisError
+
+from app.api.v1.services.product import ProductService
+from app.tests import BaseTest
+
+CATEGORY_ID = ObjectId("65d24f2a260fb739c605b2a7")
+
+
+class TestProductService(BaseTest):
+    """Test class for product service."""
+
+    @pytest.mark.asyncio
+    async def test_update_category_parameters_redis_error(self) -> None:
+        """Test category is scheduled if time of its recalculation can't be read."""
+
+        scheduler = MagicMock(
+            is_recalculated_after=AsyncMock(side_effect=RedisError),
+            schedule=AsyncMock(),
+        )
+        service = ProductService(
+            background_tasks=BackgroundTasks(),
+            category_parameters_scheduler=scheduler,
+        )
+
+        with (
+            patch.object(
+                ProductService, "_increment_category_parameters", new=AsyncMock()
+            ) as increment_mock,
+            patch("logging.error") as error_mock,
+        ):
+            await service.update_category_parameters(
+                category_id=CATEGORY_ID,
+                old_parameters=None,
+                new_parameters={"brand": "Anker"},
+                written_at=datetime(2024, 1, 1, tzinfo=UTC),
+            )
+
+        scheduler.schedule.assert_called_once_with(category_id=CATEGORY_ID)
+        increment_mock.assert_not_called()
+        error_mock.assert_called_once()
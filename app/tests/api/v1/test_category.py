@@ -147,6 +147,58 @@ class TestCategory(BaseAPITest):
             "path": "/electronics",
             "machine_name": "electronics",
             "has_children": True,
+            "children": [
+                {
+                    "id": "65d24f2a260fb739c605b28b",
+                    "name": "Computers",
+                    "description": "Computing devices",
+                    "parent_id": "65d24f2a260fb739c605b28a",
+                    "path": "/electronics/computers",
+                    "machine_name": "computers",
+                },
+                {
+                    "id": "65d24f2a260fb739c605b28f",
+                    "name": "TVs",
+                    "description": "Television sets",
+                    "parent_id": "65d24f2a260fb739c605b28a",
+                    "path": "/electronics/tvs",
+                    "machine_name": "tvs",
+                },
+                {
+                    "id": "65d24f2a260fb739c605b290",
+                    "name": "Smartphones",
+                    "description": "Mobile phones",
+                    "parent_id": "65d24f2a260fb739c605b28a",
+                    "path": "/electronics/smartphones",
+                    "machine_name": "smartphones",
+                },
+                {
+                    "id": "65d24f2a260fb739c605b291",
+                    "name": "Game Consoles",
+                    "description": "Gaming consoles",
+                    "parent_id": "65d24f2a260fb739c605b28a",
+                    "path": "/electronics/game-consoles",
+                    "machine_name": "game-consoles",
+                },
+                {
+                    "id": "65d24f2a260fb739c605b292",
+                    "name": "Accessories",
+                    "description": "Electronic accessories",
+                    "parent_id": "65d24f2a260fb739c605b28a",
+                    "path": "/electronics/accessories",
+                    "machine_name": "accessories",
+                },
+            ],
+            "breadcrumbs": [
+                {
+                    "id": "65d24f2a260fb739c605b28a",
+                    "name": "Electronics",
+                    "description": "Electronic devices",
+                    "parent_id": None,
+                    "path": "/electronics",
+                    "machine_name": "electronics",
+                },
+            ],
             "parameters": [],
         }
 
@@ -174,6 +226,37 @@ class TestCategory(BaseAPITest):
             "path": "/electronics/accessories/mobile-accessories/power-banks",
             "machine_name": "power-banks",
             "has_children": False,
+            "children": [],
+            "breadcrumbs": [
+                {
+                    "name": "Electronics",
+                    "description": "Electronic devices",
+                    "parent_id": None,
+                    "path": "/electronics",
+                    "machine_name": "electronics",
+                },
+                {
+                    "name": "Accessories",
+                    "description": "Electronic accessories",
+                    "parent_id": "65d24f2a260fb739c605b28a",
+                    "path": "/electronics/accessories",
+                    "machine_name": "accessories",
+                },
+                {
+                    "name": "Mobile Accessories",
+                    "description": "Accessories for mobile devices",
+                    "parent_id": "65d24f2a260fb739c605b292",
+                    "path": "/electronics/accessories/mobile-accessories",
+                    "machine_name": "mobile-accessories",
+                },
+                {
+                    "name": "Power Banks",
+                    "description": "Power banks for mobile devices",
+                    "parent_id": "65d24f2a260fb739c605b2a3",
+                    "path": "/electronics/accessories/mobile-accessories/power-banks",
+                    "machine_name": "power-banks",
+                },
+            ],
             "parameters": [
                 {
                     "name": "Brand",
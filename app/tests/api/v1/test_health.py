@@ -41,3 +41,44 @@ class TestHealth(BaseAPITest):
         )
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert response.json() == {"detail": HTTPErrorMessagesEnum.PERMISSION_DENIED}
+
+    @pytest.mark.asyncio
+    @patch("jwt.decode", Mock(return_value=SHOP_SIDE_USER))
+    @pytest.mark.parametrize("db", [(MongoCollectionsEnum.USERS,)], indirect=True)
+    async def test_get_metrics(self, test_client: AsyncClient, db: None) -> None:
+        """Test get application metrics."""
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/health/metrics/",
+            headers={"Authorization": f"Bearer {TEST_JWT}"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        metrics = response.json()
+
+        assert metrics["mongo_connection_pools"][0]["connections"] > 0
+        assert {
+            (command["command"], command["collection"])
+            for command in metrics["mongo_commands"]
+        } >= {
+            ("insert", MongoCollectionsEnum.USERS),
+            ("find", MongoCollectionsEnum.USERS),
+        }
+        assert metrics["password_hashing"]["workers"] == (
+            SETTINGS.PASSWORD_HASHING_WORKERS
+        )
+        assert metrics["jwt_cache"]["maxsize"] == SETTINGS.AUTH_TOKEN_CACHE_SIZE
+        assert metrics["product_views"]["pending_views"] == 0
+
+    @pytest.mark.asyncio
+    @patch("jwt.decode", Mock(return_value=USER_NO_SCOPES))
+    @pytest.mark.parametrize("db", [(MongoCollectionsEnum.USERS,)], indirect=True)
+    async def test_get_metrics_no_scope(
+        self, test_client: AsyncClient, db: None
+    ) -> None:
+        """Test get application metrics in case user does not have appropriate scope."""
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/health/metrics/",
+            headers={"Authorization": f"Bearer {TEST_JWT}"},
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.json() == {"detail": HTTPErrorMessagesEnum.PERMISSION_DENIED}
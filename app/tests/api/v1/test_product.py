@@ -2,15 +2,22 @@
 
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import arrow
 import pytest
+from bson import ObjectId
 from fastapi import status
 from httpx import AsyncClient
+from injector import Injector
 
+from app.api.v1.buffers.product import ProductViewsBuffer
+from app.api.v1.schedulers.category import CategoryParametersScheduler
 from app.constants import (
     HTTPErrorMessagesEnum,
     ValidationErrorMessagesEnum,
 )
-from app.services.mongo.constants import MongoCollectionsEnum
+from app.services.mongo.constants import MongoCollectionsEnum, SortingValuesEnum
+from app.services.redis.constants import RedisNamesEnum
+from app.services.redis.service import RedisService
 from app.settings import SETTINGS
 from app.tests.api.v1 import BaseAPITest
 from app.tests.constants import (
@@ -20,6 +27,7 @@ from app.tests.constants import (
     TEST_JWT,
     USER_NO_SCOPES,
 )
+from app.utils.cursor import Cursor
 
 
 class TestProduct(BaseAPITest):
@@ -160,7 +168,9 @@ class TestProduct(BaseAPITest):
             "updated_at": None,
         }
 
-        # Check if background task calculates appropriate category parameters
+        await Injector().get(CategoryParametersScheduler).recalculate(force=True)
+
+        # Check if scheduled recalculation calculates category parameters
         response = await test_client.get(
             f"{SETTINGS.APP_API_V1_PREFIX}/categories/65d24f2a260fb739c605b28d/parameters/"
         )
@@ -498,68 +508,71 @@ class TestProduct(BaseAPITest):
     ) -> None:
         """
         Test create product in case category parameters calculation failed.
-        Calculation transaction should be aborted.
+        Calculation transaction should be aborted, category should stay dirty.
         """
 
-        try:
-            await test_client.post(
-                f"{SETTINGS.APP_API_V1_PREFIX}/products/",
-                json={
-                    "name": "ASUS TUF Gaming F15",
-                    "synopsis": "Display 15.6 IPS (1920x1080) Full HD 144 Hz / "
-                    "Intel Core i5-12500H (2.5 - 4.5 GHz) / RAM 16 GB / "
-                    "SSD 512 GB / nVidia GeForce RTX 3050, 4 GB / LAN / "
-                    "Wi-Fi / Bluetooth / webcamera / no OS / 2.2 kg / black",
-                    "description": "Very cool laptop.",
-                    "quantity": 12,
-                    "price": 1200.00,
-                    "category_id": "65d24f2a260fb739c605b28d",
-                    "available": True,
-                    "html_body": None,
-                    "parameters": {
-                        "brand": "Asus",
-                        "cpu": "Intel Core i5-12500H",
-                        "cpu_cores_number": 12,
-                        "graphics_card": "GeForce RTX 3050",
-                        "graphics_card_type": "Discrete",
-                        "motherboard_chipset": None,
-                        "vram": "4 GB",
-                        "ram": "16 GB",
-                        "ram_slots": 2,
-                        "ram_type": "DDR4",
-                        "hdd": None,
-                        "hdd_space": None,
-                        "ssd": "Kingston",
-                        "ssd_space": "512 GB",
-                        "class": ["Gaming"],
-                        "has_wifi": True,
-                        "has_bluetooth": True,
-                        "no_wireless_connection": False,
-                        "os": None,
-                        "year": 2024,
-                        "warranty": "2 years",
-                        "country_of_production": "Taiwan",
-                        "screen_type": "IPS",
-                        "screen_resolution": "1920x1080",
-                        "screen_refresh_rate": "144 Hz",
-                        "screen_size": '15.6"',
-                        "battery_capacity": "56 watt*hours",
-                        "has_fingerprint_identification": False,
-                        "has_keyboard_backlight": False,
-                        "has_touch_screen": False,
-                        "color": "black",
-                        "custom_field": "some_value",
-                    },
+        await test_client.post(
+            f"{SETTINGS.APP_API_V1_PREFIX}/products/",
+            json={
+                "name": "ASUS TUF Gaming F15",
+                "synopsis": "Display 15.6 IPS (1920x1080) Full HD 144 Hz / "
+                "Intel Core i5-12500H (2.5 - 4.5 GHz) / RAM 16 GB / "
+                "SSD 512 GB / nVidia GeForce RTX 3050, 4 GB / LAN / "
+                "Wi-Fi / Bluetooth / webcamera / no OS / 2.2 kg / black",
+                "description": "Very cool laptop.",
+                "quantity": 12,
+                "price": 1200.00,
+                "category_id": "65d24f2a260fb739c605b28d",
+                "available": True,
+                "html_body": None,
+                "parameters": {
+                    "brand": "Asus",
+                    "cpu": "Intel Core i5-12500H",
+                    "cpu_cores_number": 12,
+                    "graphics_card": "GeForce RTX 3050",
+                    "graphics_card_type": "Discrete",
+                    "motherboard_chipset": None,
+                    "vram": "4 GB",
+                    "ram": "16 GB",
+                    "ram_slots": 2,
+                    "ram_type": "DDR4",
+                    "hdd": None,
+                    "hdd_space": None,
+                    "ssd": "Kingston",
+                    "ssd_space": "512 GB",
+                    "class": ["Gaming"],
+                    "has_wifi": True,
+                    "has_bluetooth": True,
+                    "no_wireless_connection": False,
+                    "os": None,
+                    "year": 2024,
+                    "warranty": "2 years",
+                    "country_of_production": "Taiwan",
+                    "screen_type": "IPS",
+                    "screen_resolution": "1920x1080",
+                    "screen_refresh_rate": "144 Hz",
+                    "screen_size": '15.6"',
+                    "battery_capacity": "56 watt*hours",
+                    "has_fingerprint_identification": False,
+                    "has_keyboard_backlight": False,
+                    "has_touch_screen": False,
+                    "color": "black",
+                    "custom_field": "some_value",
                 },
-                headers={"Authorization": f"Bearer {TEST_JWT}"},
-            )
+            },
+            headers={"Authorization": f"Bearer {TEST_JWT}"},
+        )
 
-        except ValueError:
-            pass
+        await Injector().get(CategoryParametersScheduler).recalculate(force=True)
 
         assert mongo_transaction_abort_mock.call_count == 1
 
-        # Check if background task calculates appropriate category parameters
+        # Check if failed recalculation is scheduled again
+        assert await Injector().get(RedisService).zrangebyscore(
+            name=RedisNamesEnum.DIRTY_CATEGORY_PARAMETERS
+        ) == ["65d24f2a260fb739c605b28d"]
+
+        # Check if category parameters are not calculated
         response = await test_client.get(
             f"{SETTINGS.APP_API_V1_PREFIX}/categories/65d24f2a260fb739c605b28d/parameters/"
         )
@@ -633,7 +646,11 @@ class TestProduct(BaseAPITest):
             "updated_at": None,
         }
 
-        # check if "views" counter is incremented
+        # check if "views" counter is incremented after buffered views are flushed
+        assert ProductViewsBuffer.get_statistics().pending_views == 1
+
+        await Injector().get(ProductViewsBuffer).flush()
+
         response = await test_client.get(
             f"{SETTINGS.APP_API_V1_PREFIX}/products/6597f143c064f4099808ad26/"
         )
@@ -864,8 +881,9 @@ class TestProduct(BaseAPITest):
             params={"page": 1, "page_size": 2, "available": True},
         )
 
-        assert redis_get_mock.call_count == 1
-        assert redis_setex_mock.call_count == 1
+        # Ranking of the built leaderboard is cached too
+        assert redis_get_mock.call_count == 2  # noqa: PLR2004
+        assert redis_setex_mock.call_count == 2  # noqa: PLR2004
 
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == {
@@ -901,8 +919,53 @@ class TestProduct(BaseAPITest):
                 },
             ],
             "total": 19,
+            "next_cursor": Cursor(
+                sorting=[
+                    ("views", SortingValuesEnum.DESC),
+                    ("_id", SortingValuesEnum.DESC),
+                ],
+                values=[1452, ObjectId("6597f143c064f4099808ad26")],
+            ).encode(),
         }
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("db", [(MongoCollectionsEnum.PRODUCTS,)], indirect=True)
+    async def test_get_products_list_top_products_are_ranked_by_flushed_views(
+        self, test_client: AsyncClient, db: None
+    ) -> None:
+        """Test get products list in case leaderboard is updated by flushed views."""
+
+        params = {"page": 1, "page_size": 2, "available": True}
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/products/", params=params
+        )
+
+        assert [product["id"] for product in response.json()["data"]] == [
+            "6607f143c064f4099808ad33",
+            "6597f143c064f4099808ad26",
+        ]
+
+        views_buffer = Injector().get(ProductViewsBuffer)
+
+        for _ in range(50):
+            views_buffer.add(id_=ObjectId("6597f143c064f4099808ad26"))
+
+        await views_buffer.flush()
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/products/", params=params
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [
+            (product["id"], product["views"]) for product in response.json()["data"]
+        ] == [
+            ("6597f143c064f4099808ad26", 1502),
+            ("6607f143c064f4099808ad33", 1500),
+        ]
+        assert response.json()["total"] == 19  # noqa: PLR2004
+
     @pytest.mark.asyncio
     @patch("jwt.decode", Mock(return_value=CUSTOMER_USER))
     @pytest.mark.parametrize(
@@ -925,8 +988,9 @@ class TestProduct(BaseAPITest):
             headers={"Authorization": f"Bearer {TEST_JWT}"},
         )
 
-        assert redis_get_mock.call_count == 1
-        assert redis_setex_mock.call_count == 1
+        # Authorized user and ranking of the built leaderboard are cached too
+        assert redis_get_mock.call_count == 3  # noqa: PLR2004
+        assert redis_setex_mock.call_count == 3  # noqa: PLR2004
 
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == {
@@ -948,6 +1012,13 @@ class TestProduct(BaseAPITest):
                 }
             ],
             "total": 19,
+            "next_cursor": Cursor(
+                sorting=[
+                    ("views", SortingValuesEnum.DESC),
+                    ("_id", SortingValuesEnum.DESC),
+                ],
+                values=[982, ObjectId("6627f143c064f4099808ad35")],
+            ).encode(),
         }
 
     @pytest.mark.asyncio
@@ -972,8 +1043,9 @@ class TestProduct(BaseAPITest):
             headers={"Authorization": f"Bearer {TEST_JWT}"},
         )
 
-        assert redis_get_mock.call_count == 1
-        assert redis_setex_mock.call_count == 1
+        # Authorized user is cached too
+        assert redis_get_mock.call_count == 2  # noqa: PLR2004
+        assert redis_setex_mock.call_count == 2  # noqa: PLR2004
 
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == {
@@ -1007,6 +1079,13 @@ class TestProduct(BaseAPITest):
                 },
             ],
             "total": 20,
+            "next_cursor": Cursor(
+                sorting=[
+                    ("views", SortingValuesEnum.DESC),
+                    ("_id", SortingValuesEnum.DESC),
+                ],
+                values=[207, ObjectId("65d22fd0a83d80b9f0bd3e41")],
+            ).encode(),
         }
 
     @pytest.mark.asyncio
@@ -1058,6 +1137,64 @@ class TestProduct(BaseAPITest):
                 }
             ],
             "total": 1,
+            "next_cursor": None,
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("db", [(MongoCollectionsEnum.PRODUCTS,)], indirect=True)
+    async def test_get_products_list_with_filter_by_category_subtree(
+        self, test_client: AsyncClient, db: None
+    ) -> None:
+        """Test get products list with filter by category and its descendants."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/products/",
+            params={
+                "page": 1,
+                "page_size": 20,
+                "available": True,
+                "category_subtree": "65d24f2a260fb739c605b28b",
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        data = response.json()
+
+        # "Desktops" and "Laptops" are leafs of "Computers"
+        assert {
+            "total": data["total"],
+            "category_ids": {product["category_id"] for product in data["data"]},
+        } == {
+            "total": 16,
+            "category_ids": {"65d24f2a260fb739c605b28c", "65d24f2a260fb739c605b28d"},
+        }
+
+        views = [product["views"] for product in data["data"]]
+
+        assert views == sorted(views, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_get_products_list_with_filter_by_category_subtree_not_found(
+        self, test_client: AsyncClient
+    ) -> None:
+        """Test get products list in case subtree category is not found."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/products/",
+            params={
+                "page": 1,
+                "page_size": 20,
+                "available": True,
+                "category_subtree": "6598495fdf97a8e0d7e612aa",
+            },
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {
+            "detail": HTTPErrorMessagesEnum.ENTITY_IS_NOT_FOUND.format(
+                entity="Category"
+            )
         }
 
     @pytest.mark.asyncio
@@ -1114,6 +1251,7 @@ class TestProduct(BaseAPITest):
                 },
             ],
             "total": 2,
+            "next_cursor": None,
         }
 
     @pytest.mark.asyncio
@@ -1181,6 +1319,7 @@ class TestProduct(BaseAPITest):
                 },
             ],
             "total": 3,
+            "next_cursor": None,
         }
 
     @pytest.mark.asyncio
@@ -1212,6 +1351,21 @@ class TestProduct(BaseAPITest):
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == {
             "data": [
+                {
+                    "id": "65c7f143c064f4099808ad29",
+                    "name": "Acer Predator Helios 300",
+                    "synopsis": "Display 17.3 IPS (1920x1080) Full HD 144 Hz / "
+                    "Intel Core i7-11800H (2.3 - 4.6 GHz) / RAM 32 GB / "
+                    "SSD 1 TB / NVIDIA GeForce RTX 3070, 8 GB / LAN / Wi-Fi 6 / "
+                    "Bluetooth 5.0 / webcam / Windows 10 Home / 3.1 kg / black",
+                    "quantity": 20,
+                    "price": 1066.0,
+                    "views": 0,
+                    "category_id": "65d24f2a260fb739c605b28d",
+                    "available": True,
+                    "created_at": "2024-03-15T14:30:00",
+                    "updated_at": None,
+                },
                 {
                     "id": "65d7f143c064f4099808ad30",
                     "name": "HP Envy x360",
@@ -1227,23 +1381,129 @@ class TestProduct(BaseAPITest):
                     "created_at": "2024-04-05T10:15:00",
                     "updated_at": None,
                 },
+            ],
+            "total": 12,
+            "next_cursor": Cursor(
+                sorting=[
+                    ("parameters.cpu_cores_number", SortingValuesEnum.ASC),
+                    ("_id", SortingValuesEnum.ASC),
+                ],
+                values=[8, ObjectId("65d7f143c064f4099808ad30")],
+            ).encode(),
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("db", [(MongoCollectionsEnum.PRODUCTS,)], indirect=True)
+    async def test_get_products_list_with_cursor(
+        self,
+        test_client: AsyncClient,
+        db: None,
+        redis_get_mock: AsyncMock,
+        redis_setex_mock: AsyncMock,
+    ) -> None:
+        """Test get products list with keyset pagination cursor."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/products/",
+            params={
+                "page": 1,
+                "page_size": 2,
+                "available": True,
+                "after": Cursor(
+                    sorting=[
+                        ("views", SortingValuesEnum.DESC),
+                        ("_id", SortingValuesEnum.DESC),
+                    ],
+                    values=[1452, ObjectId("6597f143c064f4099808ad26")],
+                ).encode(),
+            },
+        )
+
+        assert redis_get_mock.call_count == 1
+        assert redis_setex_mock.call_count == 1
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "data": [
                 {
-                    "id": "65c7f143c064f4099808ad29",
-                    "name": "Acer Predator Helios 300",
-                    "synopsis": "Display 17.3 IPS (1920x1080) Full HD 144 Hz / "
-                    "Intel Core i7-11800H (2.3 - 4.6 GHz) / RAM 32 GB / "
-                    "SSD 1 TB / NVIDIA GeForce RTX 3070, 8 GB / LAN / Wi-Fi 6 / "
-                    "Bluetooth 5.0 / webcam / Windows 10 Home / 3.1 kg / black",
+                    "id": "6627f143c064f4099808ad35",
+                    "name": "Samsung Galaxy Book Pro 360",
+                    "synopsis": "Display 15.6 Super AMOLED (1920x1080) Full HD "
+                    "Touchscreen / Intel Core i7-1260U (2.1 - 4.7 GHz) / RAM 16 GB / "
+                    "SSD 512 GB / Intel Iris Xe Graphics / Wi-Fi 6E / Bluetooth 5.1 / "
+                    "webcam / Windows 11 Home / 1.05 kg / mystic bronze",
                     "quantity": 20,
-                    "price": 1066.0,
-                    "views": 0,
+                    "price": 749.0,
+                    "views": 982,
                     "category_id": "65d24f2a260fb739c605b28d",
                     "available": True,
-                    "created_at": "2024-03-15T14:30:00",
+                    "created_at": "2024-07-10T08:45:00",
+                    "updated_at": None,
+                },
+                {
+                    "id": "65d22fd0a83d80b9f0bd3e44",
+                    "name": "Apple Mac mini",
+                    "synopsis": "Apple M1 Chip, 16GB RAM, 1TB SSD, Integrated "
+                    "8-core GPU, macOS Monterey",
+                    "quantity": 10,
+                    "price": 499.0,
+                    "views": 972,
+                    "category_id": "65d24f2a260fb739c605b28c",
+                    "available": True,
+                    "created_at": "2024-03-01T14:20:00",
                     "updated_at": None,
                 },
             ],
-            "total": 12,
+            "total": 19,
+            "next_cursor": Cursor(
+                sorting=[
+                    ("views", SortingValuesEnum.DESC),
+                    ("_id", SortingValuesEnum.DESC),
+                ],
+                values=[972, ObjectId("65d22fd0a83d80b9f0bd3e44")],
+            ).encode(),
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("db", [(MongoCollectionsEnum.PRODUCTS,)], indirect=True)
+    @pytest.mark.parametrize(
+        "after",
+        [
+            "invalid",
+            Cursor(
+                sorting=[
+                    ("price", SortingValuesEnum.ASC),
+                    ("_id", SortingValuesEnum.ASC),
+                ],
+                values=[499.0, ObjectId("65d22fd0a83d80b9f0bd3e44")],
+            ).encode(),
+            Cursor(
+                sorting=[
+                    ("views", SortingValuesEnum.DESC),
+                    ("_id", SortingValuesEnum.DESC),
+                ],
+                values=[{"$ne": None}, ObjectId("65d22fd0a83d80b9f0bd3e44")],
+            ).encode(),
+        ],
+    )
+    async def test_get_products_list_invalid_cursor(
+        self,
+        test_client: AsyncClient,
+        db: None,
+        after: str,
+        redis_get_mock: AsyncMock,
+        redis_setex_mock: AsyncMock,
+    ) -> None:
+        """Test get products list in case keyset pagination cursor is invalid."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/products/",
+            params={"page": 1, "page_size": 2, "available": True, "after": after},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {
+            "detail": HTTPErrorMessagesEnum.INVALID_PAGINATION_CURSOR
         }
 
     @pytest.mark.asyncio
@@ -1296,7 +1556,12 @@ class TestProduct(BaseAPITest):
     @pytest.mark.parametrize(
         "redis_get_mock",
         [
-            '[{"machine_name":"cpu_cores_number","type":"INT"},{"machine_name":"has_wifi","type":"BOOL"}]'
+            RedisService.codec.encode(
+                [
+                    {"machine_name": "cpu_cores_number", "type": "INT"},
+                    {"machine_name": "has_wifi", "type": "BOOL"},
+                ]
+            )
         ],
         indirect=True,
     )
@@ -1437,7 +1702,9 @@ class TestProduct(BaseAPITest):
             "updated_at": FROZEN_DATETIME,
         }
 
-        # Check if background task calculates category parameters
+        await Injector().get(CategoryParametersScheduler).recalculate(force=True)
+
+        # Check if scheduled recalculation calculates category parameters
         response = await test_client.get(
             f"{SETTINGS.APP_API_V1_PREFIX}/categories/65d24f2a260fb739c605b2a7/parameters/"
         )
@@ -1451,6 +1718,131 @@ class TestProduct(BaseAPITest):
             "year": [2020, 2023, 2024],
         }
 
+    @pytest.mark.asyncio
+    @patch("jwt.decode", Mock(return_value=SHOP_SIDE_USER))
+    @pytest.mark.parametrize(
+        "db",
+        [(MongoCollectionsEnum.USERS, MongoCollectionsEnum.PRODUCTS)],
+        indirect=True,
+    )
+    async def test_update_product_category_parameters_are_updated_incrementally(
+        self, test_client: AsyncClient, db: None, datetime_now_mock: MagicMock
+    ) -> None:
+        """
+        Test update product twice. The first update schedules counting of values
+        of category parameters, the second one adjusts counts by changed parameters.
+        """
+
+        for minutes, parameters in enumerate(
+            (
+                {
+                    "brand": "RAVPower",
+                    "year": 2020,
+                    "warranty": "3 year",
+                    "country_of_production": "China",
+                },
+                {
+                    "brand": "Anker",
+                    "year": 2024,
+                    "warranty": "1 year",
+                    "country_of_production": "China",
+                },
+            )
+        ):
+            # The next update is made after the recalculation
+            datetime_now_mock.return_value = arrow.get(FROZEN_DATETIME).shift(
+                minutes=minutes
+            )
+
+            response = await test_client.patch(
+                f"{SETTINGS.APP_API_V1_PREFIX}/products/65d22fd0a83d80b9f0bd3e40/",
+                json={
+                    "name": "RAVPower Portable Charger 10000mAh",
+                    "synopsis": "10000mAh Power Bank with 18W PD and QC 3.0",
+                    "description": "Compact and efficient power bank for on-the-go "
+                    "charging.",
+                    "quantity": 2,
+                    "price": 15.99,
+                    "category_id": "65d24f2a260fb739c605b2a7",
+                    "available": True,
+                    "html_body": None,
+                    "parameters": parameters,
+                },
+                headers={"Authorization": f"Bearer {TEST_JWT}"},
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+
+            # Counts are created once, the next update is applied to them
+            await Injector().get(CategoryParametersScheduler).recalculate(force=True)
+
+        # Values which are not used by any product anymore are removed
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/categories/65d24f2a260fb739c605b2a7/parameters/"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "id": "65d24f2a260fb739c605b2a7",
+            "brand": ["Anker", "Samsung", "Xiaomi"],
+            "country_of_production": ["China", "South Korea"],
+            "warranty": ["1 year", "18 months", "2 years"],
+            "year": [2023, 2024],
+        }
+
+    @pytest.mark.asyncio
+    @patch("jwt.decode", Mock(return_value=SHOP_SIDE_USER))
+    @pytest.mark.parametrize(
+        "db",
+        [(MongoCollectionsEnum.USERS, MongoCollectionsEnum.PRODUCTS)],
+        indirect=True,
+    )
+    async def test_update_product_category_parameters_write_before_recalculation(
+        self, test_client: AsyncClient, db: None, datetime_now_mock: MagicMock
+    ) -> None:
+        """
+        Test update product in case category is recalculated after the update.
+        Update could be counted by the recalculation already, so its counts are
+        not adjusted, later updates are.
+        """
+
+        response = await test_client.patch(
+            f"{SETTINGS.APP_API_V1_PREFIX}/products/65d22fd0a83d80b9f0bd3e40/",
+            json={
+                "name": "RAVPower Portable Charger 10000mAh",
+                "synopsis": "10000mAh Power Bank with 18W PD and QC 3.0",
+                "description": "Compact and efficient power bank for on-the-go "
+                "charging.",
+                "quantity": 2,
+                "price": 15.99,
+                "category_id": "65d24f2a260fb739c605b2a7",
+                "available": True,
+                "html_body": None,
+                "parameters": {
+                    "brand": "RAVPower",
+                    "year": 2020,
+                    "warranty": "3 year",
+                    "country_of_production": "China",
+                },
+            },
+            headers={"Authorization": f"Bearer {TEST_JWT}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        scheduler = Injector().get(CategoryParametersScheduler)
+
+        await scheduler.recalculate(force=True)
+
+        assert await scheduler.is_recalculated_after(
+            category_id=ObjectId("65d24f2a260fb739c605b2a7"),
+            written_at=arrow.get(FROZEN_DATETIME).datetime,
+        )
+        assert not await scheduler.is_recalculated_after(
+            category_id=ObjectId("65d24f2a260fb739c605b2a7"),
+            written_at=arrow.get(FROZEN_DATETIME).shift(minutes=1).datetime,
+        )
+
     @pytest.mark.asyncio
     @patch("jwt.decode", Mock(return_value=SHOP_SIDE_USER))
     @pytest.mark.parametrize(
@@ -1514,7 +1906,9 @@ class TestProduct(BaseAPITest):
             "updated_at": FROZEN_DATETIME,
         }
 
-        # Check if background task calculates "new" category parameters
+        await Injector().get(CategoryParametersScheduler).recalculate(force=True)
+
+        # Check if scheduled recalculation calculates "new" category parameters
         response = await test_client.get(
             f"{SETTINGS.APP_API_V1_PREFIX}/categories/65d24f2a260fb739c605b2a7/parameters/"
         )
@@ -1528,7 +1922,7 @@ class TestProduct(BaseAPITest):
             "year": [2020, 2023, 2024],
         }
 
-        # Check if background task recalculates "old" category parameters
+        # Check if scheduled recalculation calculates "old" category parameters
         response = await test_client.get(
             f"{SETTINGS.APP_API_V1_PREFIX}/categories/65d24f2a260fb739c605b28d/parameters/"
         )
@@ -1,12 +1,15 @@
 """Module that contains tests for role routes."""
 
+from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from bson import ObjectId
 from fastapi import status
 from httpx import AsyncClient
 
 from app.services.mongo.constants import MongoCollectionsEnum
+from app.services.redis.service import RedisService
 from app.settings import SETTINGS
 from app.tests.api.v1 import BaseAPITest
 from app.tests.constants import (
@@ -29,7 +32,8 @@ class TestRole(BaseAPITest):
 
         response = await test_client.get(f"{SETTINGS.APP_API_V1_PREFIX}/roles/")
 
-        assert redis_get_mock.call_count == 2  # noqa: PLR2004
+        # Total is counted by roles cached in process memory
+        assert redis_get_mock.call_count == 1
         assert redis_setex_mock.call_count == 1
 
         assert response.status_code == status.HTTP_200_OK
@@ -88,8 +92,10 @@ class TestRole(BaseAPITest):
             headers={"Authorization": f"Bearer {TEST_JWT}"},
         )
 
+        # Total is counted by roles cached in process memory, authorized user is
+        # cached too
         assert redis_get_mock.call_count == 2  # noqa: PLR2004
-        assert redis_setex_mock.call_count == 1
+        assert redis_setex_mock.call_count == 2  # noqa: PLR2004
 
         assert response.status_code == status.HTTP_200_OK
         assert self._exclude_fields(
@@ -134,9 +140,17 @@ class TestRole(BaseAPITest):
     @pytest.mark.parametrize(
         "redis_get_mock",
         [
-            '[{"_id": {"$oid": "65f0a17b39d1c27e2e6933e5"}, "name": "Customer", '
-            '"machine_name": "customer", "created_at": {"$date": '
-            '"2024-03-12T18:39:55.955Z"}, "updated_at": null}]'
+            RedisService.codec.encode(
+                [
+                    {
+                        "_id": ObjectId("65f0a17b39d1c27e2e6933e5"),
+                        "name": "Customer",
+                        "machine_name": "customer",
+                        "created_at": datetime(2024, 3, 12, 18, 39, 55, 955000),
+                        "updated_at": None,
+                    }
+                ]
+            )
         ],
         indirect=True,
     )
@@ -149,7 +163,8 @@ class TestRole(BaseAPITest):
 
         response = await test_client.get(f"{SETTINGS.APP_API_V1_PREFIX}/roles/")
 
-        assert redis_get_mock.call_count == 2  # noqa: PLR2004
+        # Total is counted by roles cached in process memory
+        assert redis_get_mock.call_count == 1
 
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == {
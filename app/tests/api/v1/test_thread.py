@@ -1,15 +1,19 @@
 """Module that contains tests for thread routes."""
 
+from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from bson import ObjectId
 from fastapi import status
 from httpx import AsyncClient
 
+from app.api.v1.constants import PlaceholdersEnum
+from app.api.v1.services.comment import CommentService
 from app.constants import (
     HTTPErrorMessagesEnum,
 )
-from app.services.mongo.constants import MongoCollectionsEnum
+from app.services.mongo.constants import MongoCollectionsEnum, SortingValuesEnum
 from app.settings import SETTINGS
 from app.tests.api.v1 import BaseAPITest
 from app.tests.constants import (
@@ -19,6 +23,7 @@ from app.tests.constants import (
     TEST_JWT,
     USER_NO_SCOPES,
 )
+from app.utils.cursor import Cursor
 
 
 class TestThread(BaseAPITest):
@@ -111,6 +116,261 @@ class TestThread(BaseAPITest):
             "detail": HTTPErrorMessagesEnum.ENTITY_IS_NOT_FOUND.format(entity="Thread")
         }
 
+    @pytest.mark.asyncio
+    @patch("jwt.decode", Mock(return_value=CUSTOMER_USER))
+    @pytest.mark.parametrize(
+        "db",
+        [
+            (
+                MongoCollectionsEnum.USERS,
+                MongoCollectionsEnum.THREADS,
+                MongoCollectionsEnum.COMMENTS,
+            )
+        ],
+        indirect=True,
+    )
+    async def test_get_thread_comments(
+        self, test_client: AsyncClient, db: None
+    ) -> None:
+        """Test get thread comments tree."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/threads/6669b5634cef83e11dbc7abf/comments/",
+            params={"page": 1, "page_size": 1, "depth": 1},
+            headers={"Authorization": f"Bearer {TEST_JWT}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "data": [
+                {
+                    "id": "666af8ae6aba47cfb60efb31",
+                    "body": "first product message",
+                    "thread_id": "6669b5634cef83e11dbc7abf",
+                    "user_id": "6597f14332e631f7fed1a114",
+                    "parent_comment_id": None,
+                    "path": "/666af8ae6aba47cfb60efb31",
+                    "upvotes": 2,
+                    "downvotes": 1,
+                    "deleted": False,
+                    "created_at": "2024-06-13T13:48:30.209000",
+                    "updated_at": None,
+                    "replies": [
+                        {
+                            "id": "666af8cb6aba47cfb60efb33",
+                            "body": "third product message",
+                            "thread_id": "6669b5634cef83e11dbc7abf",
+                            "user_id": "6597f14332e631f7fed1a114",
+                            "parent_comment_id": "666af8ae6aba47cfb60efb31",
+                            "path": (
+                                "/666af8ae6aba47cfb60efb31/666af8cb6aba47cfb60efb33"
+                            ),
+                            "upvotes": 0,
+                            "downvotes": 0,
+                            "deleted": False,
+                            "created_at": "2024-06-13T13:48:59.113000",
+                            "updated_at": None,
+                            "replies": [],
+                            "has_more_replies": False,
+                        },
+                        {
+                            "id": "666af90e6aba47cfb60efb34",
+                            "body": PlaceholdersEnum.DELETED_COMMENT,
+                            "thread_id": "6669b5634cef83e11dbc7abf",
+                            "user_id": "65844f12b6de26578d98c2c8",
+                            "parent_comment_id": "666af8ae6aba47cfb60efb31",
+                            "path": (
+                                "/666af8ae6aba47cfb60efb31/666af90e6aba47cfb60efb34"
+                            ),
+                            "upvotes": 0,
+                            "downvotes": 0,
+                            "deleted": True,
+                            "created_at": "2024-06-13T13:50:06.714000",
+                            "updated_at": None,
+                            "replies": [],
+                            "has_more_replies": False,
+                        },
+                    ],
+                    "has_more_replies": False,
+                },
+            ],
+            "total": 4,
+            "next_cursor": Cursor(
+                sorting=[("_id", SortingValuesEnum.ASC)],
+                values=[ObjectId("666af8ae6aba47cfb60efb31")],
+            ).encode(),
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "db",
+        [(MongoCollectionsEnum.THREADS, MongoCollectionsEnum.COMMENTS)],
+        indirect=True,
+    )
+    async def test_get_thread_comments_nested_replies(
+        self, test_client: AsyncClient, db: None
+    ) -> None:
+        """Test get thread comments tree with nested replies."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/threads/6669b5634cef83e11dbc7abf/comments/",
+            params={"page": 2, "page_size": 3},
+        )
+
+        def get_tree_ids(comments: list[dict[str, Any]]) -> list[Any]:
+            return [
+                (comment["id"], get_tree_ids(comment["replies"]))
+                for comment in comments
+            ]
+
+        assert response.status_code == status.HTTP_200_OK
+        assert get_tree_ids(response.json()["data"]) == [
+            (
+                "666af91a6aba47cfb60efb36",
+                [
+                    (
+                        "666af9246aba47cfb60efb37",
+                        [("666afa3f6aba47cfb60efb3b", [])],
+                    ),
+                    ("666af9cf6aba47cfb60efb3a", []),
+                ],
+            ),
+        ]
+        assert response.json()["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "db",
+        [(MongoCollectionsEnum.THREADS, MongoCollectionsEnum.COMMENTS)],
+        indirect=True,
+    )
+    @patch.object(CommentService, "_MAX_REPLIES", 2)
+    async def test_get_thread_comments_replies_are_truncated(
+        self, test_client: AsyncClient, db: None
+    ) -> None:
+        """Test get thread comments tree in case replies exceed limit of the page."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/threads/6669b5634cef83e11dbc7abf/comments/",
+            params={"page": 2, "page_size": 3},
+        )
+
+        def get_tree_flags(comments: list[dict[str, Any]]) -> list[Any]:
+            return [
+                (
+                    comment["id"],
+                    comment["has_more_replies"],
+                    get_tree_flags(comment["replies"]),
+                )
+                for comment in comments
+            ]
+
+        assert response.status_code == status.HTTP_200_OK
+        assert get_tree_flags(response.json()["data"]) == [
+            (
+                "666af91a6aba47cfb60efb36",
+                True,
+                [
+                    (
+                        "666af9246aba47cfb60efb37",
+                        False,
+                        [("666afa3f6aba47cfb60efb3b", False, [])],
+                    ),
+                ],
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "db",
+        [(MongoCollectionsEnum.THREADS, MongoCollectionsEnum.COMMENTS)],
+        indirect=True,
+    )
+    async def test_get_thread_comments_best(
+        self, test_client: AsyncClient, db: None
+    ) -> None:
+        """Test get thread comments tree ranked by "best" score."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/threads/6669b5634cef83e11dbc7abf/comments/",
+            params={"page": 1, "page_size": 2, "depth": 0, "ranking": "best"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [comment["id"] for comment in response.json()["data"]] == [
+            "666af8ae6aba47cfb60efb31",
+            "666af91a6aba47cfb60efb36",
+        ]
+        assert response.json()["next_cursor"] == (
+            Cursor(
+                sorting=[
+                    ("scores.best", SortingValuesEnum.DESC),
+                    ("_id", SortingValuesEnum.DESC),
+                ],
+                values=[0.0, ObjectId("666af91a6aba47cfb60efb36")],
+            ).encode()
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "db",
+        [(MongoCollectionsEnum.THREADS, MongoCollectionsEnum.COMMENTS)],
+        indirect=True,
+    )
+    async def test_get_thread_comments_hot(
+        self, test_client: AsyncClient, db: None
+    ) -> None:
+        """Test get thread comments tree ranked by "hot" score."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/threads/6669b5634cef83e11dbc7abf/comments/",
+            params={"page": 1, "page_size": 10, "depth": 1, "ranking": "hot"},
+        )
+
+        def get_tree_ids(comments: list[dict[str, Any]]) -> list[Any]:
+            return [
+                (comment["id"], get_tree_ids(comment["replies"]))
+                for comment in comments
+            ]
+
+        assert response.status_code == status.HTTP_200_OK
+        assert get_tree_ids(response.json()["data"]) == [
+            (
+                "666af91a6aba47cfb60efb36",
+                [
+                    ("666af9cf6aba47cfb60efb3a", []),
+                    ("666af9246aba47cfb60efb37", []),
+                ],
+            ),
+            ("666af9176aba47cfb60efb35", []),
+            ("666af8c16aba47cfb60efb32", []),
+            (
+                "666af8ae6aba47cfb60efb31",
+                [
+                    ("666af90e6aba47cfb60efb34", []),
+                    ("666af8cb6aba47cfb60efb33", []),
+                ],
+            ),
+        ]
+        assert response.json()["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("db", [(MongoCollectionsEnum.USERS,)], indirect=True)
+    async def test_get_thread_comments_thread_is_not_found(
+        self, test_client: AsyncClient, db: None
+    ) -> None:
+        """Test get thread comments tree in case thread is not found."""
+
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/threads/6669b5634cef83e11dbc7abf/comments/",
+            params={"page": 1, "page_size": 10},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {
+            "detail": HTTPErrorMessagesEnum.ENTITY_IS_NOT_FOUND.format(entity="Thread")
+        }
+
     @pytest.mark.asyncio
     @patch("jwt.decode", Mock(return_value=SHOP_SIDE_USER))
     @pytest.mark.parametrize(
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import jwt
 import pytest
+from bson import ObjectId
 from fastapi import status
 from httpx import AsyncClient
 from sendgrid import SendGridException  # type: ignore
@@ -14,7 +15,7 @@ from app.constants import (
     HTTPErrorMessagesEnum,
     ValidationErrorMessagesEnum,
 )
-from app.services.mongo.constants import MongoCollectionsEnum
+from app.services.mongo.constants import MongoCollectionsEnum, SortingValuesEnum
 from app.services.send_grid.service import SendGridService
 from app.settings import SETTINGS
 from app.tests.api.v1 import BaseAPITest
@@ -28,6 +29,7 @@ from app.tests.constants import (
     TEST_JWT,
     USER_NO_SCOPES,
 )
+from app.utils.cursor import Cursor
 
 
 class TestUser(BaseAPITest):
@@ -248,7 +250,8 @@ class TestUser(BaseAPITest):
             },
         )
 
-        assert redis_setex_mock.call_count == 1
+        # Authorized user is cached too
+        assert redis_setex_mock.call_count == 2  # noqa: PLR2004
         assert send_grid_send_mock.call_count == 1
 
         assert response.status_code == status.HTTP_201_CREATED
@@ -787,7 +790,8 @@ class TestUser(BaseAPITest):
             },
         )
 
-        assert redis_setex_mock.call_count == 1
+        # Authorized user is cached too
+        assert redis_setex_mock.call_count == 2  # noqa: PLR2004
         assert send_grid_send_mock.call_count == 1
 
         assert response.status_code == status.HTTP_200_OK
@@ -1336,6 +1340,21 @@ class TestUser(BaseAPITest):
                     "created_at": "2023-12-30T13:25:43.895000",
                     "updated_at": None,
                 },
+                {
+                    "id": "6597f14332e631f7fed1a114",
+                    "first_name": "Admin",
+                    "last_name": "Admin",
+                    "patronymic_name": None,
+                    "username": "admin",
+                    "email": "admin@gmail.com",
+                    "email_verified": True,
+                    "phone_number": "+380980000000",
+                    "birthdate": "1997-01-01",
+                    "roles": ["admin"],
+                    "deleted": False,
+                    "created_at": "2023-12-30T13:25:43.895000",
+                    "updated_at": None,
+                },
                 {
                     "id": "6598495fdf97a8e0d7e612ae",
                     "first_name": "Bruce",
@@ -1351,23 +1370,12 @@ class TestUser(BaseAPITest):
                     "created_at": "2023-11-11T13:25:43.895000",
                     "updated_at": None,
                 },
-                {
-                    "id": "659ac89bfe61d8332f6be4c4",
-                    "first_name": "Sheila",
-                    "last_name": "Fahey",
-                    "patronymic_name": None,
-                    "username": "sheila.fahey",
-                    "email": "sheila.fahey@gmail.com",
-                    "email_verified": True,
-                    "phone_number": "+111111111114",
-                    "birthdate": "1994-11-14",
-                    "roles": ["content_manager"],
-                    "deleted": True,
-                    "created_at": "2024-01-07T13:25:43.895000",
-                    "updated_at": None,
-                },
             ],
             "total": 7,
+            "next_cursor": Cursor(
+                sorting=[("_id", SortingValuesEnum.ASC)],
+                values=[ObjectId("6598495fdf97a8e0d7e612ae")],
+            ).encode(),
         }
 
     @pytest.mark.asyncio
@@ -1409,6 +1417,10 @@ class TestUser(BaseAPITest):
                 }
             ],
             "total": 2,
+            "next_cursor": Cursor(
+                sorting=[("_id", SortingValuesEnum.ASC)],
+                values=[ObjectId("659bf67868d14b47475ec11c")],
+            ).encode(),
         }
 
     @pytest.mark.asyncio
@@ -1445,6 +1457,7 @@ class TestUser(BaseAPITest):
                 }
             ],
             "total": 1,
+            "next_cursor": None,
         }
 
     @pytest.mark.asyncio
@@ -1486,6 +1499,13 @@ class TestUser(BaseAPITest):
                 }
             ],
             "total": 7,
+            "next_cursor": Cursor(
+                sorting=[
+                    ("first_name", SortingValuesEnum.DESC),
+                    ("_id", SortingValuesEnum.DESC),
+                ],
+                values=["Sheila", ObjectId("659ac89bfe61d8332f6be4c4")],
+            ).encode(),
         }
 
     @pytest.mark.asyncio
@@ -1813,7 +1833,8 @@ class TestUser(BaseAPITest):
         )
 
         assert redis_get_mock.call_count == 1
-        assert redis_delete_mock.call_count == 1
+        # Applied token and cached authorized user are deleted
+        assert redis_delete_mock.call_count == 2  # noqa: PLR2004
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
@@ -1911,7 +1932,11 @@ class TestUser(BaseAPITest):
         indirect=True,
     )
     async def test_reset_user_password_token_is_invalid(
-        self, test_client: AsyncClient, db: None, redis_get_mock: MagicMock
+        self,
+        test_client: AsyncClient,
+        db: None,
+        redis_get_mock: MagicMock,
+        redis_delete_mock: MagicMock,
     ) -> None:
         """Test reset user password in case token is invalid."""
 
@@ -1925,6 +1950,9 @@ class TestUser(BaseAPITest):
 
         assert redis_get_mock.call_count == 1
 
+        # Stored token is kept for the right attempt
+        assert redis_delete_mock.call_count == 0
+
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.json() == {
             "detail": HTTPErrorMessagesEnum.INVALID_RESET_PASSWORD_TOKEN
@@ -2045,7 +2073,8 @@ class TestUser(BaseAPITest):
         )
 
         assert redis_get_mock.call_count == 1
-        assert redis_delete_mock.call_count == 1
+        # Applied token and cached authorized user are deleted
+        assert redis_delete_mock.call_count == 2  # noqa: PLR2004
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
@@ -2154,7 +2183,11 @@ class TestUser(BaseAPITest):
         indirect=True,
     )
     async def test_verify_user_email_token_is_invalid(
-        self, test_client: AsyncClient, db: None, redis_get_mock: MagicMock
+        self,
+        test_client: AsyncClient,
+        db: None,
+        redis_get_mock: MagicMock,
+        redis_delete_mock: MagicMock,
     ) -> None:
         """Test verify user email in case token is invalid."""
 
@@ -2167,6 +2200,9 @@ class TestUser(BaseAPITest):
 
         assert redis_get_mock.call_count == 1
 
+        # Stored token is kept for the right attempt
+        assert redis_delete_mock.call_count == 0
+
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.json() == {
             "detail": HTTPErrorMessagesEnum.INVALID_EMAIL_VERIFICATION_TOKEN
@@ -211,6 +211,46 @@ class TestVote(BaseAPITest):
             "updated_at": None,
         }
 
+    @pytest.mark.asyncio
+    @patch("jwt.decode", Mock(return_value=CUSTOMER_USER))
+    @pytest.mark.parametrize(
+        "db",
+        [
+            (
+                MongoCollectionsEnum.USERS,
+                MongoCollectionsEnum.THREADS,
+                MongoCollectionsEnum.COMMENTS,
+            )
+        ],
+        indirect=True,
+    )
+    async def test_create_vote_comment_ranking_is_updated(
+        self, test_client: AsyncClient, db: None, datetime_now_mock: MagicMock
+    ) -> None:
+        """Test create vote in case comment ranking scores are updated."""
+
+        response = await test_client.post(
+            f"{SETTINGS.APP_API_V1_PREFIX}/votes/",
+            json={"comment_id": "666af8c16aba47cfb60efb32", "value": True},
+            headers={"Authorization": f"Bearer {TEST_JWT}"},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # Checks if upvoted comment outranks comment with 2 upvotes of 3 votes
+        response = await test_client.get(
+            f"{SETTINGS.APP_API_V1_PREFIX}/threads/6669b5634cef83e11dbc7abf/comments/",
+            params={"page": 1, "page_size": 10, "depth": 0, "ranking": "best"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [comment["id"] for comment in response.json()["data"]] == [
+            "666af8c16aba47cfb60efb32",
+            "666af8ae6aba47cfb60efb31",
+            "666af91a6aba47cfb60efb36",
+            "666af9176aba47cfb60efb35",
+        ]
+
     @pytest.mark.asyncio
     async def test_create_vote_no_token(self, test_client: AsyncClient) -> None:
         """Test create vote in case there is no token."""
@@ -0,0 +1,75 @@
+"""Module that contains tests for product validators."""
+
+from collections.abc import Generator, Mapping
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pydantic import create_model
+
+from app.api.v1.validators.product import ProductParametersFilterValidator
+from app.tests import BaseTest
+
+PARAMETERS: list[Mapping[str, Any]] = [
+    {"machine_name": "brand", "type": "STR"},
+    {"machine_name": "year", "type": "INT"},
+]
+
+
+class TestProductParametersFilterValidator(BaseTest):
+    """Test class for product parameters filter validator."""
+
+    @pytest.fixture(autouse=True)
+    def parameters_model(self) -> Generator[None, None, None]:
+        """Drops the built model, so tests don't share it."""
+
+        ProductParametersFilterValidator._parameters_model = None
+
+        yield
+
+        ProductParametersFilterValidator._parameters_model = None
+
+    def test_get_parameters_model_built_once(self) -> None:
+        """Test model is built once for the same parameters."""
+
+        with patch(
+            "app.api.v1.validators.product.create_model", wraps=create_model
+        ) as create_model_mock:
+            models = [
+                ProductParametersFilterValidator.get_parameters_model(
+                    parameters=[dict(parameter) for parameter in PARAMETERS]
+                )
+                for _ in range(3)
+            ]
+
+        assert models[0] is models[1] is models[2]
+
+        create_model_mock.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "parameters",
+        [
+            [PARAMETERS[0], {"machine_name": "release_year", "type": "INT"}],
+            [PARAMETERS[0], {"machine_name": "year", "type": "STR"}],
+        ],
+    )
+    def test_get_parameters_model_rebuilt(
+        self, parameters: list[Mapping[str, Any]]
+    ) -> None:
+        """Test model is rebuilt if machine name or type of a parameter is changed."""
+
+        with patch(
+            "app.api.v1.validators.product.create_model", wraps=create_model
+        ) as create_model_mock:
+            model = ProductParametersFilterValidator.get_parameters_model(
+                parameters=PARAMETERS
+            )
+            changed_model = ProductParametersFilterValidator.get_parameters_model(
+                parameters=parameters
+            )
+
+        assert changed_model is not model
+        assert set(changed_model.model_fields) == {
+            parameter["machine_name"] for parameter in parameters
+        }
+        assert create_model_mock.call_count == 2  # noqa: PLR2004
@@ -7,6 +7,9 @@ from injector import Injector
 
 from app.api.v1.repositories import BaseRepository
 from app.api.v1.repositories.cart import CartRepository
+from app.api.v1.repositories.category_parameter_values import (
+    CategoryParameterValuesRepository,
+)
 from app.api.v1.repositories.category_parameters import (
     CategoryParametersRepository,
 )
@@ -38,6 +41,11 @@ class FileFixtureManager:
         MongoCollectionsEnum.VOTES: _injector.get(VoteRepository),
     }
 
+    # contains repositories of collections which are derived from fixtures
+    _derived_repositories: ClassVar[list[BaseRepository]] = [
+        _injector.get(CategoryParameterValuesRepository),
+    ]
+
     def __init__(
         self, collection_names: list[MongoCollectionsEnum] | None = None
     ) -> None:
@@ -94,3 +102,7 @@ class FileFixtureManager:
                 repository = self._fixture_repositories[collection]
 
                 await repository.delete_all(session=session)
+
+            # counts of values are not dropped with products by repository
+            for repository in self._derived_repositories:
+                await repository.delete_all(session=session)
@@ -0,0 +1,115 @@
+"""Module that contains tests for MongoDB client event listeners."""
+
+from collections.abc import Mapping
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import bson
+from bson.raw_bson import RawBSONDocument
+
+from app.services.mongo.listeners import (
+    CommandStatisticsListener,
+    ConnectionPoolStatisticsListener,
+)
+from app.services.mongo.models import ConnectionPoolStatistics
+from app.tests import BaseTest
+
+ADDRESS = ("localhost", 27017)
+REPLY: Mapping[str, Any] = {
+    "cursor": {"firstBatch": [{"_id": 1}, {"_id": 2}], "id": 0, "ns": "test.users"},
+    "ok": 1.0,
+}
+
+
+class TestConnectionPoolStatisticsListener(BaseTest):
+    """Test class for connection pool statistics listener."""
+
+    def test_connections_of_pool(self) -> None:
+        """Test connections are counted in statistics of their pool."""
+
+        listener = ConnectionPoolStatisticsListener()
+        event = MagicMock(address=ADDRESS)
+
+        listener.pool_created(event)
+        listener.connection_created(event)
+        listener.connection_created(event)
+        listener.connection_closed(event)
+
+        assert listener.get_statistics() == [
+            ConnectionPoolStatistics(address="localhost:27017", connections=1)
+        ]
+
+    def test_events_after_pool_closed(self) -> None:
+        """Test events of closed pool don't re-create its statistics."""
+
+        listener = ConnectionPoolStatisticsListener()
+        event = MagicMock(address=ADDRESS)
+
+        listener.pool_created(event)
+        listener.connection_created(event)
+        listener.pool_closed(event)
+        listener.connection_checked_in(event)
+        listener.connection_closed(event)
+
+        assert listener.get_statistics() == []
+
+
+class TestCommandStatisticsListener(BaseTest):
+    """Test class for command statistics listener."""
+
+    @staticmethod
+    def _execute(
+        listener: CommandStatisticsListener, reply: Mapping[str, Any], request_id: int
+    ) -> None:
+        """Passes events of one succeeded find command to the listener."""
+
+        listener.started(
+            MagicMock(
+                command_name="find",
+                command={"find": "users"},
+                request_id=request_id,
+                connection_id=ADDRESS,
+            )
+        )
+        listener.succeeded(
+            MagicMock(
+                command_name="find",
+                request_id=request_id,
+                connection_id=ADDRESS,
+                duration_micros=1500,
+                reply=reply,
+            )
+        )
+
+    def test_bytes_of_raw_replies(self) -> None:
+        """Test size of each raw reply is taken without encoding."""
+
+        listener = CommandStatisticsListener()
+        reply = RawBSONDocument(bson.encode(REPLY))
+
+        with patch("bson.encode") as encode_mock:
+            self._execute(listener, reply=reply, request_id=1)
+
+        (command,) = listener.get_statistics()
+
+        assert command.documents == 2  # noqa: PLR2004
+        assert command.bytes == len(reply.raw)
+
+        encode_mock.assert_not_called()
+
+    def test_bytes_of_decoded_replies(self) -> None:
+        """Test only sampled decoded replies are encoded to estimate their size."""
+
+        listener = CommandStatisticsListener()
+        rate = CommandStatisticsListener._BYTES_SAMPLE_RATE
+
+        with patch("bson.encode", wraps=bson.encode) as encode_mock:
+            for request_id in range(rate):
+                self._execute(listener, reply=REPLY, request_id=request_id)
+
+        (command,) = listener.get_statistics()
+
+        assert command.count == rate
+        assert command.bytes == len(bson.encode(REPLY)) * rate
+
+        encode_mock.assert_called_once()
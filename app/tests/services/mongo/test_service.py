@@ -0,0 +1,308 @@
+"""Module that contains tests for MongoDB service."""
+
+import asyncio
+from collections.abc import AsyncIterator, Generator, Mapping
+from contextlib import aclosing
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from injector import Injector
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError
+
+from app.services.mongo.models import BulkWriteResult
+from app.services.mongo.service import MongoDBService
+from app.settings import SETTINGS
+from app.tests import BaseTest
+
+DOCUMENTS: list[Mapping[str, Any]] = [{"_id": index} for index in range(5)]
+OPERATIONS: list[InsertOne[Mapping[str, Any]]] = [
+    InsertOne({"_id": index}) for index in range(2500)
+]
+
+
+class FakeCursor:
+    """Driver cursor, which returns documents by batches of the set size."""
+
+    def __init__(self, documents: list[Mapping[str, Any]]) -> None:
+        """Initializes the cursor over documents."""
+
+        self.documents = documents
+        self.size = len(documents)
+        self.batches = 0
+        self.close = AsyncMock()
+
+    def batch_size(self, size: int) -> "FakeCursor":
+        """Sets count of documents fetched per round trip."""
+
+        self.size = size
+
+        return self
+
+    async def __aiter__(self) -> AsyncIterator[Mapping[str, Any]]:
+        """Fetches next batch once the previous one is consumed."""
+
+        for start in range(0, len(self.documents), self.size):
+            self.batches += 1
+
+            for document in self.documents[start : start + self.size]:
+                yield document
+
+
+class TestMongoDBService(BaseTest):
+    """Test class for MongoDB service."""
+
+    @pytest.fixture
+    def cursor(self) -> Generator[FakeCursor, None, None]:
+        """Cursor which is returned by both find and aggregate of a collection."""
+
+        cursor = FakeCursor(documents=DOCUMENTS)
+        collection = MagicMock(
+            find=MagicMock(return_value=cursor),
+            aggregate=MagicMock(return_value=cursor),
+        )
+
+        with patch.object(
+            MongoDBService, "_get_collection_by_name", return_value=collection
+        ):
+            yield cursor
+
+    @pytest.mark.asyncio
+    async def test_iter_find_by_batches(self, cursor: FakeCursor) -> None:
+        """Test all documents are yielded by several batches."""
+
+        service = Injector().get(MongoDBService)
+
+        documents = [
+            document
+            async for document in service.iter_find(collection="test", batch_size=2)
+        ]
+
+        assert documents == DOCUMENTS
+        assert cursor.batches == 3  # noqa: PLR2004
+
+        cursor.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_find_stopped_early(self, cursor: FakeCursor) -> None:
+        """Test cursor is closed if consumer stops before the last batch."""
+
+        service = Injector().get(MongoDBService)
+
+        async with aclosing(
+            service.iter_find(collection="test", batch_size=2)
+        ) as documents:
+            async for document in documents:
+                if document["_id"] == 0:
+                    break
+
+        assert cursor.batches == 1
+
+        cursor.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_aggregate_by_batches(self, cursor: FakeCursor) -> None:
+        """Test all resulting documents are yielded by several batches."""
+
+        service = Injector().get(MongoDBService)
+
+        documents = [
+            document
+            async for document in service.iter_aggregate(
+                collection="test", pipeline=[], batch_size=2
+            )
+        ]
+
+        assert documents == DOCUMENTS
+        assert cursor.batches == 3  # noqa: PLR2004
+
+        cursor.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_aggregate_stopped_early(self, cursor: FakeCursor) -> None:
+        """Test cursor is closed if consumer stops before the last batch."""
+
+        service = Injector().get(MongoDBService)
+
+        async with aclosing(
+            service.iter_aggregate(collection="test", pipeline=[], batch_size=2)
+        ) as documents:
+            async for document in documents:
+                if document["_id"] == 2:  # noqa: PLR2004
+                    break
+
+        assert cursor.batches == 2  # noqa: PLR2004
+
+        cursor.close.assert_called_once()
+
+    @pytest.fixture
+    def collection(self) -> Generator[MagicMock, None, None]:
+        """Collection which executes a batch of bulk write operations."""
+
+        def bulk_write(requests: list[Any], **_: Any) -> MagicMock:
+            return MagicMock(
+                inserted_count=len(requests),
+                matched_count=0,
+                modified_count=0,
+                deleted_count=0,
+                upserted_count=0,
+            )
+
+        collection = MagicMock(bulk_write=AsyncMock(side_effect=bulk_write))
+
+        with patch.object(
+            MongoDBService, "_get_collection_by_name", return_value=collection
+        ):
+            yield collection
+
+    @staticmethod
+    def _get_batch_error() -> BulkWriteError:
+        """Returns error of a batch, where the fourth operation is failed."""
+
+        return BulkWriteError(
+            {
+                "writeErrors": [{"index": 3, "code": 11000, "errmsg": "duplicate"}],
+                "writeConcernErrors": [],
+                "nInserted": 3,
+                "nUpserted": 0,
+                "nMatched": 0,
+                "nModified": 0,
+                "nRemoved": 0,
+                "upserted": [],
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_by_batches(self, collection: MagicMock) -> None:
+        """Test operations are sent by batches and their counts are summed up."""
+
+        service = Injector().get(MongoDBService)
+
+        result = await service.bulk_write(collection="test", operations=OPERATIONS)
+
+        assert result == BulkWriteResult(inserted_count=2500)
+        assert [
+            len(call_.kwargs["requests"])
+            for call_ in collection.bulk_write.call_args_list
+        ] == [1000, 1000, 500]
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_unordered_error(self, collection: MagicMock) -> None:
+        """Test all batches are executed and error indexes refer to operations."""
+
+        service = Injector().get(MongoDBService)
+
+        side_effect = collection.bulk_write.side_effect
+        collection.bulk_write.side_effect = [
+            side_effect(requests=OPERATIONS[:1000]),
+            self._get_batch_error(),
+            side_effect(requests=OPERATIONS[2000:]),
+        ]
+
+        with pytest.raises(BulkWriteError) as exc_info:
+            await service.bulk_write(
+                collection="test", operations=OPERATIONS, ordered=False
+            )
+
+        assert collection.bulk_write.call_count == 3  # noqa: PLR2004
+        assert [error["index"] for error in exc_info.value.details["writeErrors"]] == [
+            1003
+        ]
+        assert exc_info.value.details["nInserted"] == 1503  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_ordered_error(self, collection: MagicMock) -> None:
+        """Test execution stops on the batch with the failed operation."""
+
+        service = Injector().get(MongoDBService)
+
+        side_effect = collection.bulk_write.side_effect
+        collection.bulk_write.side_effect = [
+            side_effect(requests=OPERATIONS[:1000]),
+            self._get_batch_error(),
+        ]
+
+        with pytest.raises(BulkWriteError) as exc_info:
+            await service.bulk_write(collection="test", operations=OPERATIONS)
+
+        assert collection.bulk_write.call_count == 2  # noqa: PLR2004
+        assert [error["index"] for error in exc_info.value.details["writeErrors"]] == [
+            1003
+        ]
+        assert exc_info.value.details["nInserted"] == 1003  # noqa: PLR2004
+
+    @pytest.fixture
+    def explain_settings(self) -> Generator[None, None, None]:
+        """Settings where slow operations are explained once per minute."""
+
+        settings = SETTINGS.model_copy(
+            update={
+                "MONGODB_SLOW_OPERATION_THRESHOLD_MS": 100,
+                "MONGODB_SLOW_OPERATION_EXPLAIN": True,
+                "MONGODB_SLOW_OPERATION_EXPLAIN_INTERVAL": 60,
+            }
+        )
+
+        MongoDBService._explained_at = float("-inf")
+
+        with patch("app.services.mongo.service.SETTINGS", settings):
+            yield
+
+        MongoDBService._explained_at = float("-inf")
+
+    @pytest.mark.asyncio
+    async def test_slow_operation_explain_rate_limit(
+        self, explain_settings: None
+    ) -> None:
+        """Test slow operations are explained not often than once per interval."""
+
+        service = Injector().get(MongoDBService)
+
+        with (
+            patch.object(
+                MongoDBService, "explain", new=AsyncMock(return_value={})
+            ) as explain_mock,
+            patch(
+                "app.services.mongo.service.time",
+                perf_counter=MagicMock(return_value=1.0),
+                monotonic=MagicMock(side_effect=[1000.0, 1059.0, 1060.0]),
+            ),
+        ):
+            for _ in range(3):
+                # Operation started 200 ms ago
+                await service._log_slow_operation(
+                    started_at=0.8, command={"find": "users", "filter": {"_id": 1}}
+                )
+
+            await asyncio.gather(*MongoDBService._explain_tasks)
+
+        assert explain_mock.call_count == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_slow_operation_in_transaction_not_explained(
+        self, explain_settings: None
+    ) -> None:
+        """Test slow operations of transactions are logged, but not explained."""
+
+        service = Injector().get(MongoDBService)
+
+        with (
+            patch.object(
+                MongoDBService, "explain", new=AsyncMock(return_value={})
+            ) as explain_mock,
+            patch(
+                "app.services.mongo.service.time",
+                perf_counter=MagicMock(return_value=1.0),
+                monotonic=MagicMock(return_value=1000.0),
+            ),
+            patch("logging.warning") as warning_mock,
+        ):
+            await service._log_slow_operation(
+                started_at=0.8,
+                command={"find": "users", "filter": {"_id": 1}},
+                session=MagicMock(),
+            )
+
+        warning_mock.assert_called_once()
+        explain_mock.assert_not_called()
@@ -0,0 +1,129 @@
+"""Module that contains tests for two-tier cache."""
+
+import asyncio
+import math
+import time
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from injector import Injector
+from redis.asyncio.client import PubSub
+
+from app.services.redis.cache import TwoTierCache
+from app.services.redis.constants import RedisNamesEnum
+from app.services.redis.service import RedisService
+from app.tests import BaseTest
+
+
+class TestTwoTierCache(BaseTest):
+    """Test class for two-tier cache."""
+
+    @pytest.fixture(autouse=True)
+    def local_cache(self) -> Generator[None, None, None]:
+        """Clears in-process cache, so tests don't share cached values."""
+
+        TwoTierCache.clear_local()
+
+        yield
+
+        TwoTierCache.clear_local()
+
+    @pytest.mark.asyncio
+    async def test_listen_invalidations_clears_memory_once_subscribed(self) -> None:
+        """Test values are dropped after subscription is confirmed, not before."""
+
+        cache = Injector().get(TwoTierCache)
+        listened = asyncio.Event()
+        calls: list[None] = []
+
+        # Values cached before subscription is confirmed could miss invalidation
+        async def get_message(pubsub: PubSub, **_: Any) -> Any:
+            calls.append(None)
+
+            if len(calls) == 1:
+                cache._set_local(
+                    "loaded_while_subscribing", value=1, expires_at=math.inf
+                )
+
+                return None
+
+            if len(calls) == 2:  # noqa: PLR2004
+                return {"type": "subscribe", "channel": "", "data": 1}
+
+            if len(calls) == 3:  # noqa: PLR2004
+                cache._set_local("loaded_after_subscription", 1, expires_at=math.inf)
+                cache._set_local("invalidated", 1, expires_at=math.inf)
+
+                return {"type": "message", "channel": "", "data": "invalidated"}
+
+            listened.set()
+
+            await asyncio.Event().wait()
+
+        with (
+            patch(
+                "redis.asyncio.client.PubSub.subscribe", new=AsyncMock()
+            ) as subscribe_mock,
+            patch("redis.asyncio.client.PubSub.get_message", new=get_message),
+        ):
+            listener = asyncio.create_task(cache.listen_invalidations())
+
+            await listened.wait()
+
+            listener.cancel()
+
+        subscribe_mock.assert_called_once_with(
+            RedisNamesEnum.CACHE_INVALIDATION_CHANNEL
+        )
+
+        assert cache._local_cache.get("loaded_while_subscribing") is None
+        assert cache._local_cache.get("loaded_after_subscription") is not None
+        assert cache._local_cache.get("invalidated") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "early_refresh, remaining_ttl, refreshed",
+        [(True, 1, True), (True, 3600, False), (False, 1, False)],
+    )
+    async def test_get_or_load_refreshes_on_memory_hit(
+        self, early_refresh: bool, remaining_ttl: int, refreshed: bool
+    ) -> None:
+        """Test value served from process memory is refreshed before expiration."""
+
+        cache = Injector().get(TwoTierCache)
+        loader = AsyncMock()
+
+        with patch.dict(TwoTierCache._load_durations, {"name": 10}):
+            cache._set_local("name", value=1, expires_at=time.time() + remaining_ttl)
+
+        with (
+            patch("random.random", return_value=0.99),
+            patch.object(TwoTierCache, "_refresh") as refresh_mock,
+        ):
+            value = await cache.get_or_load(
+                name="name", loader=loader, ttl=3600, early_refresh=early_refresh
+            )
+
+        assert value == 1
+        assert loader.call_count == 0
+        assert refresh_mock.call_count == int(refreshed)
+
+    @pytest.mark.asyncio
+    async def test_refresh_rereads_value_refreshed_by_other_worker(self) -> None:
+        """Test value is not loaded again once other worker has refreshed it."""
+
+        cache = Injector().get(TwoTierCache)
+        loader = AsyncMock()
+
+        cache._set_local("name", value=1, expires_at=time.time() + 1)
+
+        with patch.object(RedisService, "ttl", new=AsyncMock(return_value=3600)):
+            cache._refresh(name="name", loader=loader, ttl=3600)
+
+            await TwoTierCache._refresh_tasks["name"]
+
+        assert loader.call_count == 0
+        assert cache._local_cache.get("name") is None
+        assert "name" not in TwoTierCache._refresh_tasks
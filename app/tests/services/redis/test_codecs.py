@@ -0,0 +1,67 @@
+"""Module that contains tests for codecs of Redis values."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from bson import ObjectId, json_util
+from injector import Injector
+
+from app.exceptions import InvalidCachedValueError
+from app.services.redis.codecs import get_codec
+from app.services.redis.service import RedisService
+from app.tests import BaseTest
+
+# Value in the form repositories return cached documents
+VALUE = [
+    {
+        "_id": ObjectId("65f0a17b39d1c27e2e6933e5"),
+        "machine_name": "customer",
+        "created_at": datetime(2024, 3, 12, 18, 39, 55, 955000),
+    }
+]
+
+
+class TestCodecs(BaseTest):
+    """Test class for codecs of Redis values."""
+
+    @pytest.mark.parametrize("name", ["json", "bson"])
+    @pytest.mark.parametrize("compression_threshold", [None, 0, 1024])
+    def test_codec_decodes_encoded_value(
+        self, name: str, compression_threshold: int | None
+    ) -> None:
+        """Test value is decoded as it was before encoding."""
+
+        codec = get_codec(name=name, compression_threshold=compression_threshold)
+
+        assert codec.decode(codec.encode(VALUE)) == VALUE
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            json_util.dumps(VALUE).encode(),  # stored before codecs had headers
+            b"\x00" + json_util.dumps(VALUE).encode(),
+            get_codec(name="json").encode(VALUE),
+            get_codec(name="bson").encode(VALUE)[:-1],
+            get_codec(name="bson", compression_threshold=0).encode(VALUE)[:-1],
+            b"",
+        ],
+    )
+    def test_codec_rejects_foreign_value(self, data: bytes) -> None:
+        """Test value of other codec or format is not decoded."""
+
+        codec = get_codec(name="bson", compression_threshold=1024)
+
+        with pytest.raises(InvalidCachedValueError):
+            codec.decode(data)
+
+    @pytest.mark.asyncio
+    async def test_get_value_misses_foreign_value(self) -> None:
+        """Test value of other codec or format is treated as missing."""
+
+        redis_service = Injector().get(RedisService)
+
+        with patch("redis.asyncio.Redis.get", new=AsyncMock()) as redis_get_mock:
+            redis_get_mock.return_value = json_util.dumps(VALUE).encode()
+
+            assert await redis_service.get_value(name="roles") is None
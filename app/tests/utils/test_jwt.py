@@ -0,0 +1,101 @@
+"""Module that contains tests for JWT utilities."""
+
+import time
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+
+from app.api.v1.models.auth import JWTUser
+from app.exceptions import ExpiredTokenError, InvalidTokenError
+from app.tests import BaseTest
+from app.tests.constants import CUSTOMER_USER
+from app.utils.jwt import JWT
+
+
+class TestJWT(BaseTest):
+    """Test class for JWT encoding and decoding."""
+
+    _user = JWTUser.model_validate(CUSTOMER_USER)
+
+    @pytest.fixture(autouse=True)
+    def decoded_tokens(self) -> Generator[None, None, None]:
+        """Clears decoded tokens, so tests don't share cached tokens."""
+
+        JWT._decoded_tokens.clear()
+
+        yield
+
+        JWT._decoded_tokens.clear()
+
+    @pytest.fixture
+    def jwt_decode_mock(self) -> Generator[MagicMock, None, None]:
+        """JWT decode operation mock, which decodes tokens."""
+
+        with patch("jwt.decode", wraps=jwt.decode) as mock:
+            yield mock
+
+    def test_decode_token_hits_cache(self, jwt_decode_mock: MagicMock) -> None:
+        """Test valid token is verified once and then served from cache."""
+
+        token = JWT.encode_tokens(data=self._user)["access_token"]
+
+        statistics = JWT.get_cache_statistics()
+
+        token_data = JWT.decode_token(token=token)
+
+        assert JWT.decode_token(token=token) == token_data
+        assert token_data.id == self._user.id
+        assert token_data.scopes == self._user.scopes
+
+        jwt_decode_mock.assert_called_once()
+
+        assert JWT.get_cache_statistics().hits == statistics.hits + 1
+
+    def test_decode_token_expires_at_exp(self, jwt_decode_mock: MagicMock) -> None:
+        """Test cached token is not served after its expiration time."""
+
+        token = JWT.encode_tokens(data=self._user)["access_token"]
+
+        exp = JWT.decode_token(token=token).exp
+
+        # Token is cached for the time left till its expiration
+        now = time.monotonic() + exp - time.time()
+
+        with patch("app.utils.lru.time.monotonic", return_value=now - 1):
+            JWT.decode_token(token=token)
+
+        jwt_decode_mock.assert_called_once()
+
+        jwt_decode_mock.side_effect = jwt.ExpiredSignatureError
+
+        with (
+            patch("app.utils.lru.time.monotonic", return_value=now + 1),
+            pytest.raises(ExpiredTokenError),
+        ):
+            JWT.decode_token(token=token)
+
+        assert jwt_decode_mock.call_count == 2  # noqa: PLR2004
+
+    def test_decode_token_separates_token_types(
+        self, jwt_decode_mock: MagicMock
+    ) -> None:
+        """Test cached access token is not accepted as refresh token and back."""
+
+        tokens = JWT.encode_tokens(data=self._user)
+
+        JWT.decode_token(token=tokens["access_token"])
+        JWT.decode_token(token=tokens["refresh_token"], is_refresh=True)
+
+        with pytest.raises(InvalidTokenError):
+            JWT.decode_token(token=tokens["access_token"], is_refresh=True)
+
+        with pytest.raises(InvalidTokenError):
+            JWT.decode_token(token=tokens["refresh_token"])
+
+        # Both valid tokens are cached, each under own type
+        JWT.decode_token(token=tokens["access_token"])
+        JWT.decode_token(token=tokens["refresh_token"], is_refresh=True)
+
+        assert jwt_decode_mock.call_count == 4  # noqa: PLR2004
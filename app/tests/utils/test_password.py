@@ -0,0 +1,63 @@
+"""Module that contains tests for password utilities."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.tests import BaseTest
+from app.utils.password import Password
+
+
+class TestPassword(BaseTest):
+    """Test class for password hashing and verification."""
+
+    @pytest.mark.asyncio
+    async def test_get_password_hash_runs_on_pool(self) -> None:
+        """Test password is hashed in the pool thread and statistics are updated."""
+
+        statistics = Password.get_statistics()
+
+        with patch.object(Password, "_hasher") as hasher_mock:
+            hasher_mock.hash.side_effect = lambda _: threading.current_thread().name
+
+            thread_name = await Password.get_password_hash("password")
+
+        hasher_mock.hash.assert_called_once_with("password")
+        assert thread_name.startswith("password-hashing")
+        assert thread_name != threading.current_thread().name
+
+        new_statistics = Password.get_statistics()
+
+        assert new_statistics.completed == statistics.completed + 1
+        assert new_statistics.active == 0
+        assert new_statistics.queued == 0
+        assert new_statistics.queue_wait_time >= statistics.queue_wait_time
+
+    @pytest.mark.asyncio
+    async def test_verify_password_runs_on_pool(self) -> None:
+        """Test password is verified in the pool thread and statistics are updated."""
+
+        hashed_password = await Password.get_password_hash("password")
+        statistics = Password.get_statistics()
+        threads: list[str] = []
+
+        verify = Password._hasher.verify
+
+        def verify_in_thread(hash_: str, password: str) -> bool:
+            threads.append(threading.current_thread().name)
+            return verify(hash_, password)
+
+        with patch.object(Password, "_hasher", MagicMock(verify=verify_in_thread)):
+            assert await Password.verify_password("password", hashed_password) is True
+            assert await Password.verify_password("wrong", hashed_password) is False
+
+        assert len(threads) == 2  # noqa: PLR2004
+        assert all(thread.startswith("password-hashing") for thread in threads)
+
+        new_statistics = Password.get_statistics()
+
+        # Mismatched verification is counted as completed too
+        assert new_statistics.completed == statistics.completed + 2
+        assert new_statistics.active == 0
+        assert new_statistics.queued == 0
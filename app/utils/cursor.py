@@ -0,0 +1,136 @@
+"""Contains keyset pagination cursor class."""
+
+import base64
+import binascii
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+import bson
+from bson import Decimal128, Int64, ObjectId
+from bson.errors import BSONError
+
+from app.exceptions import InvalidCursorError
+
+
+class Cursor:
+    """Keyset pagination cursor.
+
+    Cursor keeps the sorting it was built for and the values of the sorting fields
+    of the last document on a page, so the next page can be requested with a range
+    condition instead of skipping documents.
+
+    """
+
+    # Types of values which can be compared with fields in query, documents or
+    # arrays of token would become query operators otherwise
+    _SCALAR_TYPES = (bool, int, Int64, float, Decimal128, str, ObjectId, datetime)
+
+    def __init__(self, sorting: list[tuple[str, int]], values: list[Any]) -> None:
+        """Initialize keyset pagination cursor.
+
+        Args:
+            sorting (list[tuple[str, int]]): Sorting fields and directions.
+            values (list[Any]): Values of sorting fields.
+
+        """
+        self.sorting = sorting
+        self.values = values
+
+    @classmethod
+    def from_document(
+        cls, sorting: list[tuple[str, int]], document: Mapping[str, Any]
+    ) -> "Cursor":
+        """Builds a cursor which points to the document.
+
+        Args:
+            sorting (list[tuple[str, int]]): Sorting fields and directions.
+            document (Mapping[str, Any]): The last document on a page.
+
+        Returns:
+            Cursor: Keyset pagination cursor.
+
+        """
+        return cls(
+            sorting=sorting,
+            values=[cls._get_field_value(document, field) for field, _ in sorting],
+        )
+
+    @staticmethod
+    def _get_field_value(document: Mapping[str, Any], field: str) -> Any:
+        """Returns a value of the document field by its dotted path.
+
+        Missing fields are treated as null, the same way MongoDB sorts them.
+
+        Args:
+            document (Mapping[str, Any]): Document.
+            field (str): Dotted path to the field.
+
+        Returns:
+            Any: Field value or None.
+
+        """
+
+        value: Any = document
+
+        for key in field.split("."):
+            if not isinstance(value, Mapping):
+                return None
+
+            value = value.get(key)
+
+        return value
+
+    def encode(self) -> str:
+        """Encodes a cursor to the opaque URL-safe token.
+
+        Returns:
+            str: Cursor token.
+
+        """
+
+        data = bson.encode(
+            {
+                "sorting": [[field, direction] for field, direction in self.sorting],
+                "values": self.values,
+            }
+        )
+
+        return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """Decodes a cursor from the opaque token.
+
+        Args:
+            token (str): Cursor token.
+
+        Returns:
+            Cursor: Keyset pagination cursor.
+
+        Raises:
+            InvalidCursorError: In case token is malformed or has non-scalar
+            values.
+
+        """
+
+        try:
+            data = bson.decode(
+                base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            )
+
+            sorting = [
+                (str(field), int(direction)) for field, direction in data["sorting"]
+            ]
+            values = list(data["values"])
+
+        except (BSONError, binascii.Error, KeyError, TypeError, ValueError):
+            raise InvalidCursorError
+
+        if len(sorting) != len(values) or any(
+            value is not None and not isinstance(value, cls._SCALAR_TYPES)
+            for value in values
+        ):
+            raise InvalidCursorError
+
+        return cls(sorting=sorting, values=values)
@@ -1,11 +1,15 @@
 """Module that provides utility functions for manipulating JWT (JSON Web Token)."""
 
+import hashlib
+import time
+
 import arrow
 import jwt
 
 from app.api.v1.models.auth import JWTPayload, JWTUser
 from app.exceptions import ExpiredTokenError, InvalidTokenError
 from app.settings import SETTINGS
+from app.utils.lru import LRUCache, LRUCacheStatistics
 
 
 class JWT:
@@ -13,6 +17,16 @@ class JWT:
 
     _JTW_TYPE = "Bearer"
 
+    # Decoded tokens by token type and token digest, cached till tokens expire
+    _decoded_tokens: LRUCache[JWTPayload] = LRUCache(
+        maxsize=SETTINGS.AUTH_TOKEN_CACHE_SIZE,
+        ttl=max(
+            SETTINGS.AUTH_ACCESS_TOKEN_EXPIRE_MINUTES,
+            SETTINGS.AUTH_REFRESH_TOKEN_EXPIRE_MINUTES,
+        )
+        * 60,
+    )
+
     @staticmethod
     def _encode_jwt(data: JWTUser, secret_key: str, expires_delta: int) -> str:
         """Encodes a JWT with the provided data and expiration time.
@@ -111,6 +125,10 @@ class JWT:
     def decode_token(token: str, is_refresh: bool = False) -> JWTPayload:
         """Decodes and validates a JWT.
 
+        Valid tokens are cached till they expire, so repeated requests with the
+        same token skip signature verification and payload validation. Access and
+        refresh tokens are cached separately, as they are signed by different keys.
+
         Args:
             token (str): The JWT to decode.
             is_refresh (bool): Defines if token is refresh or access. Default to False.
@@ -123,6 +141,14 @@ class JWT:
             InvalidTokenException: If the token is invalid or can't be decoded.
 
         """
+
+        cache_key = (is_refresh, hashlib.sha256(token.encode()).digest())
+
+        token_data = JWT._decoded_tokens.get(cache_key)
+
+        if token_data is not None:
+            return token_data
+
         try:
             payload = jwt.decode(
                 token,
@@ -132,10 +158,24 @@ class JWT:
                 algorithms=[SETTINGS.AUTH_ALGORITHM],
             )
 
-            return JWTPayload(**payload)
+            token_data = JWTPayload(**payload)
 
         except jwt.ExpiredSignatureError:
             raise ExpiredTokenError
 
         except jwt.InvalidTokenError:
             raise InvalidTokenError
+
+        JWT._decoded_tokens.set(cache_key, token_data, ttl=token_data.exp - time.time())
+
+        return token_data
+
+    @staticmethod
+    def get_cache_statistics() -> LRUCacheStatistics:
+        """Returns statistics of the decoded tokens cache.
+
+        Returns:
+            LRUCacheStatistics: Size of the cache and count of hits and misses.
+
+        """
+        return JWT._decoded_tokens.get_statistics()
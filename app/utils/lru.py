@@ -0,0 +1,131 @@
+"""Contains in-process LRU cache class."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class LRUCacheStatistics(BaseModel):
+    """Statistics of the LRU cache."""
+
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+
+
+class LRUCache(Generic[T]):
+    """In-process least recently used cache with expiration.
+
+    Cache is bound to the worker process, so it is meant for small hot data sets
+    which can be stale for a short time.
+
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize LRU cache.
+
+        Args:
+            maxsize (int): Maximum count of cached values.
+            ttl (float): Number of seconds the value is cached.
+
+        """
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+        self._data: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> T | None:
+        """Returns a cached value by key.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            T | None: Cached value or None if it is missing or expired.
+
+        """
+
+        item = self._data.get(key)
+
+        if item is None:
+            self._misses += 1
+
+            return None
+
+        expires_at, value = item
+
+        if expires_at <= time.monotonic():
+            del self._data[key]
+
+            self._misses += 1
+
+            return None
+
+        self._data.move_to_end(key)
+
+        self._hits += 1
+
+        return value
+
+    def set(self, key: Hashable, value: T, ttl: float | None = None) -> None:
+        """Caches a value by key and evicts the least recently used one if full.
+
+        Args:
+            key (Hashable): Cache key.
+            value (T): Value to cache.
+            ttl (float | None): Number of seconds the value is cached, it can't
+            exceed TTL of the cache. Defaults to None.
+
+        """
+
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+
+        if self._maxsize <= 0 or ttl <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Removes a cached value by key.
+
+        Args:
+            key (Hashable): Cache key.
+
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all cached values."""
+        self._data.clear()
+
+    def get_statistics(self) -> LRUCacheStatistics:
+        """Returns statistics of the cache.
+
+        Returns:
+            LRUCacheStatistics: Size of the cache and count of hits and misses.
+
+        """
+        return LRUCacheStatistics(
+            size=len(self._data),
+            maxsize=self._maxsize,
+            hits=self._hits,
+            misses=self._misses,
+        )
+
+    def __len__(self) -> int:
+        """Returns count of cached values, including expired ones."""
+        return len(self._data)
@@ -3,17 +3,121 @@ Module that provides utility functions for password hashing and verification
 using the argon2 library.
 """
 
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
+from pydantic import BaseModel
+
+from app.settings import SETTINGS
+
+T = TypeVar("T")
+
+
+class PasswordHashingStatistics(BaseModel):
+    """Statistics of the password hashing pool."""
+
+    workers: int
+    active: int = 0
+    queued: int = 0
+    completed: int = 0
+    queue_wait_time: float = 0.0  # total time in seconds spent in the queue
 
 
 class Password:
-    """Utility class for password hashing and verification."""
+    """Utility class for password hashing and verification.
+
+    Argon2 is CPU and memory intensive by design, so hashing and verification run
+    on the bounded thread pool instead of blocking the event loop. Argon2 releases
+    GIL while hashing, so threads are enough to use several CPU cores.
+
+    """
 
     _hasher = PasswordHasher()
 
-    @staticmethod
-    def get_password_hash(password: str) -> str:
+    _executor = ThreadPoolExecutor(
+        max_workers=SETTINGS.PASSWORD_HASHING_WORKERS,
+        thread_name_prefix="password-hashing",
+    )
+
+    _lock = threading.Lock()
+    _statistics = PasswordHashingStatistics(workers=SETTINGS.PASSWORD_HASHING_WORKERS)
+
+    @classmethod
+    def _call(cls, function: Callable[..., T], queued_at: float, *args: Any) -> T:
+        """Calls a function in the pool thread and updates pool statistics.
+
+        Args:
+            function (Callable[..., T]): Function to call.
+            queued_at (float): Performance counter value before queueing.
+            args (Any): Function arguments.
+
+        Returns:
+            T: Function result.
+
+        """
+
+        with cls._lock:
+            cls._statistics.queued -= 1
+            cls._statistics.active += 1
+            cls._statistics.queue_wait_time += time.perf_counter() - queued_at
+
+        try:
+            return function(*args)
+
+        finally:
+            with cls._lock:
+                cls._statistics.active -= 1
+                cls._statistics.completed += 1
+
+    @classmethod
+    async def _run(cls, function: Callable[..., T], *args: Any) -> T:
+        """Runs a function on the password hashing pool.
+
+        Args:
+            function (Callable[..., T]): Function to run.
+            args (Any): Function arguments.
+
+        Returns:
+            T: Function result.
+
+        """
+
+        with cls._lock:
+            cls._statistics.queued += 1
+
+        future = cls._executor.submit(cls._call, function, time.perf_counter(), *args)
+
+        try:
+            return await asyncio.wrap_future(future)
+
+        except asyncio.CancelledError:
+            # Function has never started, so it is still counted as queued
+            if future.cancel() is True:
+                with cls._lock:
+                    cls._statistics.queued -= 1
+
+            raise
+
+    @classmethod
+    def get_statistics(cls) -> PasswordHashingStatistics:
+        """Returns statistics of the password hashing pool.
+
+        Returns:
+            PasswordHashingStatistics: Count of active and queued operations.
+
+        """
+
+        with cls._lock:
+            return cls._statistics.model_copy()
+
+    @classmethod
+    async def get_password_hash(cls, password: str) -> str:
         """Hashes a password.
 
         Args:
@@ -23,10 +127,10 @@ class Password:
             str: Hashed password.
 
         """
-        return Password._hasher.hash(password)
+        return await cls._run(cls._hasher.hash, password)
 
-    @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
+    @classmethod
+    async def verify_password(cls, plain_password: str, hashed_password: str) -> bool:
         """Verifies if a plain password matches its hashed counterpart.
 
         Args:
@@ -38,7 +142,7 @@ class Password:
 
         """
         try:
-            return Password._hasher.verify(hashed_password, plain_password)
+            return await cls._run(cls._hasher.verify, hashed_password, plain_password)
         except VerifyMismatchError:
             return False
 
@@ -0,0 +1,182 @@
+"""Contains ranking scores of voted entities."""
+
+import math
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+
+class Ranking:
+    """Utility class for ranking scores of voted entities.
+
+    "Best" score is the lower bound of Wilson score confidence interval of
+    upvotes ratio, so a few votes don't outrank many mostly positive ones. "Hot"
+    score adds the order of magnitude of votes balance to the creation time, so
+    newer entities need fewer votes to be ranked higher.
+
+    Scores are provided as MongoDB expressions too, so they are recalculated in
+    the same update which changes vote counters.
+
+    """
+
+    # Normal quantile of 80% confidence
+    WILSON_Z = 1.281551565545
+
+    HOT_EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
+    HOT_DECAY = 45000  # seconds which weigh as ten times more votes
+
+    @classmethod
+    def get_best_score(cls, upvotes: int, downvotes: int) -> float:
+        """Calculates "best" score.
+
+        Args:
+            upvotes (int): Count of upvotes.
+            downvotes (int): Count of downvotes.
+
+        Returns:
+            float: Lower bound of Wilson score interval.
+
+        """
+
+        # Entities without votes are counted as voted once, so the score is zero
+        count = max(upvotes + downvotes, 1)
+        ratio = upvotes / count
+        z_squared = cls.WILSON_Z**2
+
+        center = ratio + z_squared / (2 * count)
+        margin = cls.WILSON_Z * math.sqrt(
+            (ratio * (1 - ratio) + z_squared / (4 * count)) / count
+        )
+
+        return (center - margin) / (1 + z_squared / count)
+
+    @classmethod
+    def get_hot_score(cls, upvotes: int, downvotes: int, created_at: datetime) -> float:
+        """Calculates "hot" score.
+
+        Args:
+            upvotes (int): Count of upvotes.
+            downvotes (int): Count of downvotes.
+            created_at (datetime): Creation time, naive one is treated as UTC.
+
+        Returns:
+            float: Time-decayed score.
+
+        """
+
+        balance = upvotes - downvotes
+        sign = (balance > 0) - (balance < 0)
+
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=UTC)
+
+        age = (created_at - cls.HOT_EPOCH).total_seconds()
+
+        return sign * math.log10(max(abs(balance), 1)) + age / cls.HOT_DECAY
+
+    @classmethod
+    def get_best_score_expression(
+        cls, upvotes: Any = "$upvotes", downvotes: Any = "$downvotes"
+    ) -> Mapping[str, Any]:
+        """Returns MongoDB expression which calculates "best" score.
+
+        Args:
+            upvotes (Any): Expression of count of upvotes. Defaults to "$upvotes".
+            downvotes (Any): Expression of count of downvotes.
+            Defaults to "$downvotes".
+
+        Returns:
+            Mapping[str, Any]: Aggregation expression.
+
+        """
+
+        z_squared = cls.WILSON_Z**2
+
+        center = {
+            "$add": ["$$ratio", {"$divide": [z_squared, {"$multiply": [2, "$$count"]}]}]
+        }
+        variance = {
+            "$divide": [
+                {
+                    "$add": [
+                        {"$multiply": ["$$ratio", {"$subtract": [1, "$$ratio"]}]},
+                        {"$divide": [z_squared, {"$multiply": [4, "$$count"]}]},
+                    ]
+                },
+                "$$count",
+            ]
+        }
+        margin = {"$multiply": [cls.WILSON_Z, {"$sqrt": variance}]}
+
+        return {
+            "$let": {
+                "vars": {"count": {"$max": [{"$add": [upvotes, downvotes]}, 1]}},
+                "in": {
+                    "$let": {
+                        "vars": {"ratio": {"$divide": [upvotes, "$$count"]}},
+                        "in": {
+                            "$divide": [
+                                {"$subtract": [center, margin]},
+                                {"$add": [1, {"$divide": [z_squared, "$$count"]}]},
+                            ]
+                        },
+                    }
+                },
+            }
+        }
+
+    @classmethod
+    def get_hot_score_expression(
+        cls,
+        upvotes: Any = "$upvotes",
+        downvotes: Any = "$downvotes",
+        created_at: Any = "$created_at",
+    ) -> Mapping[str, Any]:
+        """Returns MongoDB expression which calculates "hot" score.
+
+        Args:
+            upvotes (Any): Expression of count of upvotes. Defaults to "$upvotes".
+            downvotes (Any): Expression of count of downvotes.
+            Defaults to "$downvotes".
+            created_at (Any): Expression of creation time.
+            Defaults to "$created_at".
+
+        Returns:
+            Mapping[str, Any]: Aggregation expression.
+
+        """
+        return {
+            "$let": {
+                "vars": {"balance": {"$subtract": [upvotes, downvotes]}},
+                "in": {
+                    "$add": [
+                        {
+                            "$multiply": [
+                                {"$cmp": ["$$balance", 0]},
+                                {"$log10": {"$max": [{"$abs": "$$balance"}, 1]}},
+                            ]
+                        },
+                        {
+                            # Difference of dates is in milliseconds
+                            "$divide": [
+                                {"$subtract": [created_at, cls.HOT_EPOCH]},
+                                cls.HOT_DECAY * 1000,
+                            ]
+                        },
+                    ]
+                },
+            }
+        }
+
+    @classmethod
+    def get_scores_expression(cls) -> Mapping[str, Any]:
+        """Returns MongoDB expression which calculates all scores of a document.
+
+        Returns:
+            Mapping[str, Any]: Aggregation expression.
+
+        """
+        return {
+            "best": cls.get_best_score_expression(),
+            "hot": cls.get_hot_score_expression(),
+        }
@@ -0,0 +1,19 @@
+"""Contains a migration that creates/drops products views and _id fields index."""
+
+from mongodb_migrations.base import BaseMigration
+
+from app.services.mongo.constants import MongoCollectionsEnum, SortingValuesEnum
+
+
+class Migration(BaseMigration):  # type: ignore
+    """Migration that creates/drops products views and _id fields index."""
+
+    def upgrade(self) -> None:
+        """Creates a views and _id index."""
+        self.db[MongoCollectionsEnum.PRODUCTS].create_index(
+            [("views", SortingValuesEnum.DESC), ("_id", SortingValuesEnum.DESC)]
+        )
+
+    def downgrade(self) -> None:
+        """Drops a views and _id index."""
+        self.db[MongoCollectionsEnum.PRODUCTS].drop_index("views_-1__id_-1")
@@ -0,0 +1,32 @@
+"""
+Contains a migration that creates/drops category parameter values
+category_id/parameter/value fields unique index.
+"""
+
+from mongodb_migrations.base import BaseMigration
+
+from app.services.mongo.constants import MongoCollectionsEnum, SortingValuesEnum
+
+
+class Migration(BaseMigration):  # type: ignore
+    """
+    Migration that creates/drops category parameter values
+    category_id/parameter/value fields unique index.
+    """
+
+    def upgrade(self) -> None:
+        """Creates a category_id/parameter/value index."""
+        self.db[MongoCollectionsEnum.CATEGORY_PARAMETER_VALUES].create_index(
+            {
+                "category_id": SortingValuesEnum.ASC,
+                "parameter": SortingValuesEnum.ASC,
+                "value": SortingValuesEnum.ASC,
+            },
+            unique=True,
+        )
+
+    def downgrade(self) -> None:
+        """Drops a category_id/parameter/value index."""
+        self.db[MongoCollectionsEnum.CATEGORY_PARAMETER_VALUES].drop_index(
+            "category_id_1_parameter_1_value_1"
+        )
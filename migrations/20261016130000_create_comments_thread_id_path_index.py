@@ -0,0 +1,19 @@
+"""Contains a migration that creates/drops comments thread_id/path fields index."""
+
+from mongodb_migrations.base import BaseMigration
+
+from app.services.mongo.constants import MongoCollectionsEnum, SortingValuesEnum
+
+
+class Migration(BaseMigration):  # type: ignore
+    """Migration that creates/drops comments thread_id/path fields index."""
+
+    def upgrade(self) -> None:
+        """Creates a thread_id/path index."""
+        self.db[MongoCollectionsEnum.COMMENTS].create_index(
+            {"thread_id": SortingValuesEnum.ASC, "path": SortingValuesEnum.ASC}
+        )
+
+    def downgrade(self) -> None:
+        """Drops a thread_id/path index."""
+        self.db[MongoCollectionsEnum.COMMENTS].drop_index("thread_id_1_path_1")
@@ -0,0 +1,55 @@
+"""
+Contains a migration that calculates/removes comments ranking scores and
+creates/drops their thread_id/parent_comment_id fields indexes.
+"""
+
+from mongodb_migrations.base import BaseMigration
+
+from app.services.mongo.constants import MongoCollectionsEnum, SortingValuesEnum
+from app.utils.ranking import Ranking
+
+
+class Migration(BaseMigration):  # type: ignore
+    """
+    Migration that calculates/removes comments ranking scores and creates/drops
+    their thread_id/parent_comment_id fields indexes.
+    """
+
+    def upgrade(self) -> None:
+        """Calculates scores and creates indexes."""
+
+        self.db[MongoCollectionsEnum.COMMENTS].update_many(
+            {}, [{"$set": {"scores": Ranking.get_scores_expression()}}]
+        )
+
+        self.db[MongoCollectionsEnum.COMMENTS].create_index(
+            {
+                "thread_id": SortingValuesEnum.ASC,
+                "parent_comment_id": SortingValuesEnum.ASC,
+                "_id": SortingValuesEnum.ASC,
+            }
+        )
+
+        for score in ("best", "hot"):
+            self.db[MongoCollectionsEnum.COMMENTS].create_index(
+                {
+                    "thread_id": SortingValuesEnum.ASC,
+                    "parent_comment_id": SortingValuesEnum.ASC,
+                    f"scores.{score}": SortingValuesEnum.DESC,
+                    "_id": SortingValuesEnum.DESC,
+                }
+            )
+
+    def downgrade(self) -> None:
+        """Drops indexes and removes scores."""
+
+        for index in (
+            "thread_id_1_parent_comment_id_1__id_1",
+            "thread_id_1_parent_comment_id_1_scores.best_-1__id_-1",
+            "thread_id_1_parent_comment_id_1_scores.hot_-1__id_-1",
+        ):
+            self.db[MongoCollectionsEnum.COMMENTS].drop_index(index)
+
+        self.db[MongoCollectionsEnum.COMMENTS].update_many(
+            {}, {"$unset": {"scores": ""}}
+        )
@@ -0,0 +1,24 @@
+"""Contains a migration that adds/removes health metrics scope of admin role."""
+
+from mongodb_migrations.base import BaseMigration
+
+from app.api.v1.constants import RolesEnum, ScopesEnum
+from app.services.mongo.constants import MongoCollectionsEnum
+
+
+class Migration(BaseMigration):  # type: ignore
+    """Migration that adds/removes health metrics scope of admin role."""
+
+    def upgrade(self) -> None:
+        """Adds health metrics scope to admin role."""
+        self.db[MongoCollectionsEnum.ROLES].update_one(
+            {"machine_name": RolesEnum.ADMIN},
+            {"$addToSet": {"scopes": ScopesEnum.HEALTH_GET_METRICS.name}},
+        )
+
+    def downgrade(self) -> None:
+        """Removes health metrics scope from admin role."""
+        self.db[MongoCollectionsEnum.ROLES].update_one(
+            {"machine_name": RolesEnum.ADMIN},
+            {"$pull": {"scopes": ScopesEnum.HEALTH_GET_METRICS.name}},
+        )
@@ -4,10 +4,41 @@ Python code into CLI-invokable tasks.
 """
 
 import asyncio
+import json
+import timeit
+from collections.abc import Callable, Mapping
+from typing import Any
 
+from bson import ObjectId
+from injector import Injector
 from invoke import Context, task
-
+from pydantic import BaseModel
+
+from app.api.v1.caches.category import CategoryCache, CategoryTreeCache
+from app.api.v1.caches.parameter import ParametersCache
+from app.api.v1.caches.role import RolesCache
+from app.api.v1.constants import RolesEnum
+from app.api.v1.models import Pagination, Search, Sorting
+from app.api.v1.models.category import CategoryFilter
+from app.api.v1.models.comment import CommentFilter
+from app.api.v1.models.product import ProductFilter
+from app.api.v1.models.user import UserFilter
+from app.api.v1.repositories.category import CategoryRepository
+from app.api.v1.repositories.comment import CommentRepository
+from app.api.v1.repositories.parameter import ParameterRepository
+from app.api.v1.repositories.product import ProductRepository
+from app.api.v1.repositories.role import RoleRepository
+from app.api.v1.repositories.user import UserRepository
+from app.api.v1.validators.product import ProductParametersFilterValidator
+from app.constants import AppConstantsEnum
+from app.services.mongo.constants import (
+    MongoCollectionsEnum,
+    SortingTypesEnum,
+    SortingValuesEnum,
+)
+from app.services.mongo.profiler import QueryProfiler
 from app.services.mongo.service import MongoDBService
+from app.services.redis.codecs import get_codec
 from app.tests.fixtures.manager import FileFixtureManager
 
 
@@ -76,6 +107,17 @@ def create_migration(ctx: Context, description: str) -> None:
     ctx.run(f"mongodb-migrate-create --description {description}")
 
 
+async def _invalidate_caches() -> None:
+    """Drops cached categories, roles and parameters, migrations write them."""
+
+    injector = Injector()
+
+    await injector.get(CategoryTreeCache).invalidate()
+    await injector.get(CategoryCache).invalidate()
+    await injector.get(RolesCache).invalidate()
+    await injector.get(ParametersCache).invalidate()
+
+
 @task
 def upgrade_migrations(_: Context, to_datetime: str | None = None) -> None:
     """Upgrades MongoDB migrations.
@@ -96,6 +138,8 @@ def upgrade_migrations(_: Context, to_datetime: str | None = None) -> None:
 
     MongoDBService.run_migrations(upgrade=True, to_datetime=to_datetime)
 
+    asyncio.run(_invalidate_caches())
+
 
 @task
 def downgrade_migrations(_: Context, to_datetime: str | None = None) -> None:
@@ -118,6 +162,8 @@ def downgrade_migrations(_: Context, to_datetime: str | None = None) -> None:
 
     MongoDBService.run_migrations(upgrade=False, to_datetime=to_datetime)
 
+    asyncio.run(_invalidate_caches())
+
 
 @task(default=True)
 def run(ctx: Context) -> None:
@@ -239,6 +285,285 @@ def fixture(_: Context) -> None:
     asyncio.run(file_fixture_manager.load())
 
 
+async def _advise_indexes() -> None:
+    """Explains list queries of repositories and prints missing indexes."""
+
+    injector = Injector()
+
+    mongo_service = injector.get(MongoDBService)
+    product_repository = injector.get(ProductRepository)
+    user_repository = injector.get(UserRepository)
+    category_repository = injector.get(CategoryRepository)
+    comment_repository = injector.get(CommentRepository)
+
+    pagination = Pagination(page=1, page_size=10)
+    category_id = ObjectId()
+    thread_id = ObjectId()
+
+    # List queries issued by API, in the form of (name, repository, parameters)
+    query_shapes: list[tuple[str, Any, dict[str, Any]]] = [
+        ("products", product_repository, {"filter_": ProductFilter()}),
+        (
+            "products by category",
+            product_repository,
+            {"filter_": ProductFilter(category_id=category_id, available=True)},
+        ),
+        (
+            "products by category and parameters",
+            product_repository,
+            {
+                "filter_": ProductFilter(
+                    category_id=category_id,
+                    available=True,
+                    parameters={"brand": ["Asus", "Lenovo"]},
+                )
+            },
+        ),
+        (
+            "products by category subtree",
+            product_repository,
+            {
+                "filter_": ProductFilter(
+                    available=True, category_ids=[category_id, ObjectId()]
+                )
+            },
+        ),
+        (
+            "products by category sorted by price",
+            product_repository,
+            {
+                "filter_": ProductFilter(category_id=category_id, available=True),
+                "sorting": Sorting(sort_by="price", sort_order=SortingTypesEnum.ASC),
+            },
+        ),
+        (
+            "products search",
+            product_repository,
+            {"filter_": ProductFilter(), "search": Search(search="laptop")},
+        ),
+        (
+            "users by roles",
+            user_repository,
+            {"filter_": UserFilter(roles=[RolesEnum.CUSTOMER])},
+        ),
+        (
+            "users by roles, not deleted",
+            user_repository,
+            {"filter_": UserFilter(roles=[RolesEnum.CUSTOMER], deleted=False)},
+        ),
+        (
+            "categories by path",
+            category_repository,
+            {"filter_": CategoryFilter(path="/")},
+        ),
+        (
+            "leaf categories",
+            category_repository,
+            {"filter_": CategoryFilter(leafs=True)},
+        ),
+        (
+            "thread comments",
+            comment_repository,
+            {"filter_": CommentFilter(thread_id=thread_id)},
+        ),
+        *[
+            (
+                f"thread comments ranked by {field}",
+                comment_repository,
+                {
+                    "filter_": CommentFilter(thread_id=thread_id),
+                    "sorting": Sorting(sort_by=field, sort_order=SortingTypesEnum.DESC),
+                },
+            )
+            for field in ("scores.best", "scores.hot", "_id")
+        ],
+    ]
+
+    reports: list[tuple[str, dict[str, Any], Any]] = []
+
+    for name, repository, parameters in query_shapes:
+        result = await repository.explain_get(**parameters, pagination=pagination)
+
+        reports.append(
+            (
+                name,
+                result["plan"],
+                QueryProfiler.get_index_suggestion(
+                    result["command"]["filter"], result["command"].get("sort")
+                ),
+            )
+        )
+
+    # Replies of a page of top-level comments are fetched by paths
+    replies_query = CommentRepository.get_replies_query_filter(
+        thread_id=thread_id,
+        paths=[f"/{ObjectId()}" for _ in range(pagination.page_size)],
+        depth=AppConstantsEnum.COMMENTS_TREE_DEFAULT_DEPTH,
+    )
+    replies_sort = {"path": SortingValuesEnum.ASC}
+
+    explanation = await mongo_service.explain(
+        command={
+            "find": MongoCollectionsEnum.COMMENTS,
+            "filter": replies_query,
+            "sort": replies_sort,
+        }
+    )
+
+    reports.append(
+        (
+            "thread comment replies",
+            QueryProfiler.get_plan_summary(explanation),
+            QueryProfiler.get_index_suggestion(replies_query, replies_sort),
+        )
+    )
+
+    for name, plan, suggestion in reports:
+        supported = not plan["collection_scan"] and not plan["in_memory_sort"]
+
+        print(f"{'OK' if supported else 'MISSING INDEX'}: {name}")
+        print(f"  plan: {' <- '.join(plan['winning_plan'])}")
+        print(
+            f"  keys examined: {plan['total_keys_examined']}, "
+            f"documents examined: {plan['total_docs_examined']}, "
+            f"returned: {plan['returned']}"
+        )
+
+        if not supported and suggestion is not None:
+            print(f"  suggested index: {json.dumps(dict(suggestion))}")
+
+
+@task(pre=[upgrade_migrations])
+def index_advisor(_: Context) -> None:
+    """Checks that list queries of repositories are supported by indexes.
+
+    Every list query shape is explained against the database, so it should be
+    seeded (e.g. with fixtures). Shapes which scan a collection or sort in memory
+    are reported along with a suggested compound index.
+
+    Args:
+        _ (invoke.Context): The context object representing the current invocation.
+
+    Example:
+        invoke fixture        # Loads data from fixtures into Mongo collections.
+        invoke index-advisor  # Reports list queries without supporting index.
+
+    """
+
+    asyncio.run(_advise_indexes())
+
+
+async def _benchmark_codecs(number: int) -> None:
+    """Measures Redis codecs on cached lists of roles and parameters.
+
+    Args:
+        number (int): Number of encoding and decoding runs per codec.
+
+    """
+
+    injector = Injector()
+
+    # Values are cached in the same form as repositories return them
+    values = {
+        "roles": await injector.get(RoleRepository).get(),
+        "parameters": await injector.get(ParameterRepository).get(),
+    }
+
+    codecs = {
+        "json": get_codec(name="json"),
+        "bson": get_codec(name="bson"),
+        "json + zlib": get_codec(name="json", compression_threshold=0),
+        "bson + zlib": get_codec(name="bson", compression_threshold=0),
+    }
+
+    for value_name, value in values.items():
+        print(f"{value_name} ({len(value)} documents):")
+
+        for codec_name, codec in codecs.items():
+            data = codec.encode(value)
+
+            encoding_time = timeit.timeit(lambda: codec.encode(value), number=number)
+            decoding_time = timeit.timeit(lambda: codec.decode(data), number=number)
+
+            print(
+                f"  {codec_name:<12} size: {len(data):>6} B, "
+                f"encode: {encoding_time / number * 1e6:>8.2f} us, "
+                f"decode: {decoding_time / number * 1e6:>8.2f} us"
+            )
+
+
+@task(pre=[upgrade_migrations])
+def benchmark_codecs(_: Context, number: int = 10000) -> None:
+    """Compares codecs of Redis values on the roles and parameters lists.
+
+    Lists are read from the database, where they are inserted by migrations.
+
+    Args:
+        _ (invoke.Context): The context object representing the current invocation.
+        number (int): Number of encoding and decoding runs per codec.
+        Defaults to 10000.
+
+    Example:
+        invoke benchmark-codecs --number 1000  # Prints size and timings per codec.
+
+    """
+
+    asyncio.run(_benchmark_codecs(number=number))
+
+
+async def _benchmark_parameters_filter(number: int) -> None:
+    """Measures validation of product parameters filter with and without caching.
+
+    Args:
+        number (int): Number of validations per case.
+
+    """
+
+    parameters = await Injector().get(ParameterRepository).get()
+
+    # Values are valid for both string and integer parameters
+    query_params = {
+        parameter["machine_name"]: ["1"]
+        for parameter in parameters
+        if parameter["type"] in {"STR", "INT"}
+    }
+
+    def validate(
+        get_model: Callable[[list[Mapping[str, Any]]], type[BaseModel]],
+    ) -> None:
+        get_model(parameters)(**query_params).model_dump(exclude_unset=True)
+
+    cases = {
+        "model per request": ProductParametersFilterValidator.build_parameters_model,
+        "cached model": ProductParametersFilterValidator.get_parameters_model,
+    }
+
+    print(f"parameters ({len(parameters)} documents):")
+
+    for case_name, get_model in cases.items():
+        validation_time = timeit.timeit(lambda: validate(get_model), number=number)
+
+        print(f"  {case_name:<18} {validation_time / number * 1e6:>10.2f} us/request")
+
+
+@task(pre=[upgrade_migrations])
+def benchmark_parameters_filter(_: Context, number: int = 1000) -> None:
+    """Compares per-request cost of product parameters filter validation.
+
+    Parameters are read from the database, where they are inserted by migrations.
+
+    Args:
+        _ (invoke.Context): The context object representing the current invocation.
+        number (int): Number of validations per case. Defaults to 1000.
+
+    Example:
+        invoke benchmark-parameters-filter  # Prints timings per request.
+
+    """
+
+    asyncio.run(_benchmark_parameters_filter(number=number))
+
+
 @task
 def build(ctx: Context) -> None:
     """Builds a new docker image for application.